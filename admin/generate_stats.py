@@ -6,113 +6,190 @@ Generates statistics and visualizations from DynamoDB reservation data
 
 import argparse
 import boto3
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import matplotlib
+matplotlib.use('Agg')  # headless; also skips GUI backend init in plot workers
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 import matplotlib.dates as mdates
+from matplotlib import font_manager
 import seaborn as sns
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import json
 import os
+from string import Template
 
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
+# Pin the bundled font (seaborn's list starts with Arial, which costs a fallback
+# search when absent) and resolve it once here, so forked plot workers inherit
+# a warm font cache.
+plt.rcParams['font.family'] = 'DejaVu Sans'
+for _weight in ('normal', 'bold'):
+    font_manager.findfont(font_manager.FontProperties(
+        family='DejaVu Sans', weight=_weight))
 
 # AWS Configuration
 REGION = os.environ.get('AWS_REGION', 'us-east-2')
 TABLE_NAME = os.environ.get(
     'RESERVATIONS_TABLE', 'pytorch-gpu-dev-reservations')
+# Number of parallel DynamoDB scan segments
+SCAN_SEGMENTS = int(os.environ.get('SCAN_SEGMENTS', '8'))
+# Number of processes used to render plots
+PLOT_WORKERS = int(os.environ.get('PLOT_WORKERS', str(os.cpu_count() or 1)))
+
+# Dashboard images are shown at <=1400px wide, so 150 dpi is plenty and WebP
+# encodes faster and smaller than PNG
+SAVE_KW = dict(dpi=150, bbox_inches='tight', format='webp')
 
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'output')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Parsed reservations from the previous run. Reservations created within
+# CACHE_REFRESH_DAYS of the newest cached one may still change (status,
+# expiry), so those are always refetched.
+CACHE_PATH = os.path.join(OUTPUT_DIR, 'reservations.parquet')
+CACHE_REFRESH_DAYS = int(os.environ.get('CACHE_REFRESH_DAYS', '7'))
+
+# Reservation attributes fetched from DynamoDB (all others are projected away)
+RESERVATION_COLUMNS = ['reservation_id', 'user_id', 'gpu_type', 'gpu_count',
+                       'status', 'created_at', 'expired_at', 'expires_at']
+RESERVATION_SCHEMA = pa.schema([(col, pa.string()) for col in RESERVATION_COLUMNS])
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['gpu_type', 'status', 'user_id']
+
+
+def _page_to_batch(items):
+    """Convert one page of low-level DynamoDB items into an Arrow RecordBatch"""
+    # Values stay as their raw S/N strings; parse_reservation_data types them
+    columns = {col: [] for col in RESERVATION_COLUMNS}
+    for item in items:
+        for col, values in columns.items():
+            value = item.get(col)
+            values.append(None if value is None else value.get('S', value.get('N')))
+    return pa.RecordBatch.from_pydict(columns, schema=RESERVATION_SCHEMA)
+
+
+def _scan_segment(segment, total_segments, since=None):
+    """Scan one segment of the reservations table into Arrow RecordBatches"""
+    # boto3 sessions are not thread-safe, so each worker gets its own client
+    client = boto3.session.Session().client('dynamodb', region_name=REGION)
+
+    scan_kwargs = {
+        'TableName': TABLE_NAME,
+        'Segment': segment,
+        'TotalSegments': total_segments,
+        # Only pull the attributes parse_reservation_data reads
+        'ProjectionExpression': ', '.join(
+            '#s' if col == 'status' else col for col in RESERVATION_COLUMNS),
+        'ExpressionAttributeNames': {'#s': 'status'},
+    }
+    if since is not None:
+        # created_at is stored either as a naive UTC ISO string or as epoch seconds
+        scan_kwargs['FilterExpression'] = (
+            '(attribute_type(created_at, :type_s) AND created_at >= :since_s) OR '
+            '(attribute_type(created_at, :type_n) AND created_at >= :since_n)')
+        scan_kwargs['ExpressionAttributeValues'] = {
+            ':type_s': {'S': 'S'},
+            ':type_n': {'S': 'N'},
+            ':since_s': {'S': since.strftime('%Y-%m-%dT%H:%M:%S')},
+            ':since_n': {'N': str(since.timestamp())},
+        }
+
+    # Convert page by page so only one page of raw items is alive at a time
+    paginator = client.get_paginator('scan')
+    return [_page_to_batch(page['Items']) for page in paginator.paginate(**scan_kwargs)]
+
+
+def fetch_all_reservations(since=None):
+    """Fetch all reservations (or those created at/after `since`) from DynamoDB as an Arrow table"""
+    if since is None:
+        print("Fetching reservations from DynamoDB...")
+    else:
+        print(f"Fetching reservations created since {since:%Y-%m-%d %H:%M} from DynamoDB...")
+
+    batches = []
+    with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+        for segment_batches in executor.map(_scan_segment, range(SCAN_SEGMENTS),
+                                            [SCAN_SEGMENTS] * SCAN_SEGMENTS,
+                                            [since] * SCAN_SEGMENTS):
+            batches.extend(segment_batches)
+    reservations = pa.Table.from_batches(batches, schema=RESERVATION_SCHEMA)
+
+    print(f"Fetched {reservations.num_rows} reservations")
+    return reservations
 
-def fetch_all_reservations():
-    """Fetch all reservations from DynamoDB"""
-    print("Fetching reservations from DynamoDB...")
-    dynamodb = boto3.resource('dynamodb', region_name=REGION)
-    table = dynamodb.Table(TABLE_NAME)
-
-    reservations = []
-    last_evaluated_key = None
-
-    while True:
-        if last_evaluated_key:
-            response = table.scan(ExclusiveStartKey=last_evaluated_key)
-        else:
-            response = table.scan()
-
-        reservations.extend(response.get('Items', []))
-
-        last_evaluated_key = response.get('LastEvaluatedKey')
-        if not last_evaluated_key:
-            break
 
-    print(f"Fetched {len(reservations)} reservations")
-    return reservations
+def _parse_timestamps(col):
+    """Parse ISO 8601 strings and/or numeric epoch seconds to datetime64[ns, UTC]"""
+    numeric = pd.to_numeric(col, errors='coerce')
+    iso = pd.to_datetime(col.where(numeric.isna()), errors='coerce',
+                         utc=True, format='ISO8601')
+    return iso.fillna(pd.to_datetime(numeric, unit='s', utc=True)).dt.as_unit('ns')
 
 
 def parse_reservation_data(reservations):
-    """Parse reservation data into a DataFrame"""
+    """Parse the Arrow table from fetch_all_reservations into a typed DataFrame"""
     print("Parsing reservation data...")
 
-    data = []
-    for res in reservations:
-        try:
-            # A reservation is not valid without a creation date.
-            created_at_raw = res.get('created_at', '')
-            if not created_at_raw:
-                continue
-
-            # Parse created_at (can be ISO string or timestamp)
-            if isinstance(created_at_raw, str):
-                # ISO 8601 format: "2025-10-03T03:09:06.002555"
-                created_at = datetime.fromisoformat(
-                    created_at_raw.replace('Z', '+00:00'))
-            else:
-                # Numeric timestamp
-                created_at = datetime.fromtimestamp(float(created_at_raw))
-
-            # Parse expired_at (preferred) or expires_at (fallback)
-            expires_at_raw = res.get(
-                'expired_at', '') or res.get('expires_at', '')
-            expires_at = None
-            if expires_at_raw:
-                if isinstance(expires_at_raw, str):
-                    expires_at = datetime.fromisoformat(
-                        expires_at_raw.replace('Z', '+00:00'))
-                else:
-                    expires_at = datetime.fromtimestamp(float(expires_at_raw))
-
-            # Calculate duration
-            duration_hours = 0
-            if expires_at and expires_at > created_at:
-                duration_hours = (
-                    expires_at - created_at).total_seconds() / 3600
-
-            data.append({
-                'reservation_id': res.get('reservation_id', ''),
-                'user_id': res.get('user_id', ''),
-                # Normalize to lowercase
-                'gpu_type': res.get('gpu_type', '').lower(),
-                'gpu_count': int(res.get('gpu_count', 1)),
-                'status': res.get('status', ''),
-                'created_at': created_at,
-                'expires_at': expires_at,
-                'duration_hours': duration_hours,
-            })
-        except Exception as e:
-            print(f"Warning: Failed to parse reservation: {e}")
-            continue
-
-    df = pd.DataFrame(data)
+    raw = reservations.to_pandas()
+
+    # A reservation is not valid without a creation date.
+    created_at = _parse_timestamps(raw['created_at'])
+    # expired_at (preferred) or expires_at (fallback)
+    expires_at = _parse_timestamps(
+        raw['expired_at'].where(raw['expired_at'].fillna('') != '', raw['expires_at']))
+
+    df = pd.DataFrame({
+        'reservation_id': raw['reservation_id'].fillna(''),
+        'user_id': raw['user_id'].fillna(''),
+        # Normalize to lowercase
+        'gpu_type': raw['gpu_type'].fillna('').astype(str).str.lower(),
+        # int16, not int8: multi-node reservations can exceed 127 GPUs
+        'gpu_count': pd.to_numeric(raw['gpu_count'], errors='coerce').fillna(1).astype('int16'),
+        'status': raw['status'].fillna(''),
+        'created_at': created_at,
+        'expires_at': expires_at,
+        'duration_hours': ((expires_at - created_at).dt.total_seconds() / 3600)
+        .clip(lower=0).fillna(0).astype('float32'),
+    })
+    df = df.dropna(subset=['created_at']).reset_index(drop=True)
+    df[CATEGORICAL_COLUMNS] = df[CATEGORICAL_COLUMNS].astype('category')
     print(f"Parsed {len(df)} valid reservations")
     return df
 
 
+def load_reservations(full_refresh=False):
+    """Load reservations, only refetching recent ones when a local cache exists"""
+    cached = None
+    if not full_refresh and os.path.exists(CACHE_PATH):
+        cached = pd.read_parquet(CACHE_PATH)
+        print(f"Loaded {len(cached)} cached reservations from {CACHE_PATH}")
+
+    if cached is None or cached.empty:
+        df = parse_reservation_data(fetch_all_reservations())
+    else:
+        since = (cached['created_at'].max() -
+                 timedelta(days=CACHE_REFRESH_DAYS)).to_pydatetime()
+        fresh = parse_reservation_data(fetch_all_reservations(since=since))
+        df = pd.concat([cached[cached['created_at'] < since], fresh], ignore_index=True)
+        df = df.drop_duplicates('reservation_id', keep='last').reset_index(drop=True)
+        # concat of categoricals with differing categories falls back to object
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype('category').cat.remove_unused_categories()
+
+    df.to_parquet(CACHE_PATH, compression='zstd', index=False)
+    return df
+
+
 def fetch_gpu_availability():
     """Fetch total available GPUs for each type from DynamoDB"""
     print("\nFetching GPU availability...")
@@ -157,40 +234,65 @@ def calculate_statistics(df):
             'first': df['created_at'].min(),
             'last': df['created_at'].max(),
         },
-        'gpu_types': df['gpu_type'].value_counts().to_dict(),
-        'status_breakdown': df['status'].value_counts().to_dict(),
-        'total_gpu_hours': (df['duration_hours'] * df['gpu_count']).sum(),
+        # Kept as Series: iterated via .items() and reused by
+        # plot_gpu_type_distribution, so no dict copy is needed
+        'gpu_types': df['gpu_type'].value_counts(),
+        'status_breakdown': df['status'].value_counts(),
+        # float64 so the all-time total doesn't accumulate float32 error
+        'total_gpu_hours': (df['duration_hours'].astype('float64') * df['gpu_count']).sum(),
     }
 
     return stats
 
 
-def plot_daily_active_reservations(df, weeks=4):
-    """Plot daily active reservation counts for last N weeks"""
-    print("\nGenerating daily active reservations plot...")
+def _figure(figsize):
+    """Return this process's reusable Figure, cleared and resized"""
+    # Reusing one Figure skips per-plot canvas/font setup; constrained layout
+    # replaces a tight_layout pass per plot.
+    fig = plt.figure(num='dashboard', layout='constrained')
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig
 
-    # Get last N weeks
-    end_date = datetime.now()
+
+RecentSlice = namedtuple('RecentSlice', ['starts', 'ends', 'gpu_count', 'days', 'hours'])
+
+
+def _recent_slice(df, weeks=4):
+    """Reservations created in the last N weeks as NumPy arrays, plus the day/hour ranges"""
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
 
-    # Filter to last N weeks
-    df_recent = df[df['created_at'] >= start_date].copy()
+    recent = (df['created_at'] >= start_date).values
+    starts = df['created_at'].values[recent]
+    ends = df['expires_at'].values[recent]
+    # Reservations that expire before they start are never active
+    valid = ~(ends < starts)
+    return RecentSlice(
+        starts=starts[valid],
+        ends=ends[valid],
+        gpu_count=df['gpu_count'].values[recent][valid].astype(np.int64),
+        days=pd.date_range(start=start_date, end=end_date, freq='D'),
+        hours=pd.date_range(start=start_date, end=end_date, freq='h'),
+    )
 
-    # Create date range for last N weeks
-    date_range = pd.date_range(start=start_date, end=end_date, freq='D')
 
-    # Count active reservations per day
-    daily_active = []
-    for date in date_range:
-        active = df_recent[
-            (df_recent['created_at'] <= date) &
-            ((df_recent['expires_at'].isna()) |
-             (df_recent['expires_at'] >= date))
-        ]
-        daily_active.append(len(active))
+def plot_daily_active_reservations(recent, weeks=4):
+    """Plot daily active reservation counts for last N weeks"""
+    print("\nGenerating daily active reservations plot...")
+
+    date_range = recent.days
+
+    # Single sweep: active(d) = #started by d - #ended before d
+    starts = np.sort(recent.starts)
+    ends = np.sort(np.where(np.isnat(recent.ends),
+                            np.datetime64('2262-04-01', 'ns'), recent.ends))
+    dates = date_range.values
+    daily_active = np.searchsorted(starts, dates, side='right') - \
+        np.searchsorted(ends, dates, side='left')
 
     # Plot
-    plt.figure(figsize=(14, 6))
+    _figure((14, 6))
     plt.plot(date_range, daily_active, marker='o', linewidth=2, markersize=4)
     plt.title(f'Daily Active Reservations (Last {weeks} Weeks)',
               fontsize=16, fontweight='bold')
@@ -200,42 +302,44 @@ def plot_daily_active_reservations(df, weeks=4):
     plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
     plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=max(1, weeks // 4)))
     plt.xticks(rotation=45)
-    plt.tight_layout()
     plt.savefig(os.path.join(
-        OUTPUT_DIR, 'daily_active_reservations.png'), dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/daily_active_reservations.png")
-    plt.close()
+        OUTPUT_DIR, 'daily_active_reservations.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/daily_active_reservations.webp")
 
 
-def plot_hourly_gpu_usage(df, weeks=4):
+def plot_hourly_gpu_usage(recent, weeks=4):
     """Plot hourly active GPU count for last N weeks"""
     print("\nGenerating hourly GPU usage plot...")
 
-    # Get last N weeks
-    end_date = datetime.now()
-    start_date = end_date - timedelta(weeks=weeks)
-
-    # Filter to last N weeks
-    df_recent = df[df['created_at'] >= start_date].copy()
-
-    # Create hourly range for last N weeks
-    hour_range = pd.date_range(start=start_date, end=end_date, freq='H')
-
-    # Count active GPUs per hour
-    hourly_gpus = []
-    for hour in hour_range:
-        active = df_recent[
-            (df_recent['created_at'] <= hour) &
-            ((df_recent['expires_at'].isna()) |
-             (df_recent['expires_at'] >= hour))
-        ]
-        total_gpus = (active['gpu_count']).sum()
-        hourly_gpus.append(total_gpus)
+    hour_range = recent.hours
+
+    # Difference array over hour buckets: a reservation is counted from the
+    # first bucket at/after created_at through the last bucket at/before expiry.
+    n_hours = len(hour_range)
+    hour = np.timedelta64(1, 'h')
+    t0 = hour_range.values[0]
+    ends = recent.ends
+    no_end = np.isnat(ends)
+    start_idx = np.clip(-((t0 - recent.starts) // hour), 0, n_hours)
+    end_idx = np.clip((np.where(no_end, t0, ends) - t0) // hour + 1, 0, n_hours)
+    end_idx[no_end] = n_hours
+    gpu_count = recent.gpu_count
+    keep = start_idx < end_idx
+    delta = np.zeros(n_hours + 1, dtype=np.int64)
+    np.add.at(delta, start_idx[keep], gpu_count[keep])
+    np.add.at(delta, end_idx[keep], -gpu_count[keep])
+    hourly_gpus = np.cumsum(delta)[:n_hours]
+
+    # The count is piecewise constant, so only keep the hours where it changes
+    # and draw it as one filled step patch (outline + fill in a single artist)
+    changes = np.r_[0, np.flatnonzero(np.diff(hourly_gpus)) + 1]
+    hours = hour_range.values
+    edges = np.append(hours[changes], hours[-1] + hour)
 
     # Plot
-    plt.figure(figsize=(16, 6))
-    plt.plot(hour_range, hourly_gpus, linewidth=1, alpha=0.8)
-    plt.fill_between(hour_range, hourly_gpus, alpha=0.3)
+    _figure((16, 6))
+    plt.stairs(hourly_gpus[changes], edges, fill=True,
+               facecolor=mcolors.to_rgba('C0', 0.3), edgecolor='C0', linewidth=1)
     plt.title(f'Hourly Active GPU Count (Last {weeks} Weeks)',
               fontsize=16, fontweight='bold')
     plt.xlabel('Date', fontsize=12)
@@ -244,20 +348,15 @@ def plot_hourly_gpu_usage(df, weeks=4):
     plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
     plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=max(1, weeks // 2)))
     plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'hourly_gpu_usage.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/hourly_gpu_usage.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'hourly_gpu_usage.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/hourly_gpu_usage.webp")
 
 
-def plot_gpu_type_distribution(df):
-    """Plot GPU type distribution"""
+def plot_gpu_type_distribution(gpu_counts):
+    """Plot GPU type distribution from precomputed per-type reservation counts"""
     print("\nGenerating GPU type distribution plot...")
 
-    gpu_counts = df['gpu_type'].value_counts()
-
-    plt.figure(figsize=(10, 6))
+    _figure((10, 6))
     colors = sns.color_palette("husl", len(gpu_counts))
     plt.bar(range(len(gpu_counts)), gpu_counts.values, color=colors)
     plt.xticks(range(len(gpu_counts)), gpu_counts.index,
@@ -266,11 +365,8 @@ def plot_gpu_type_distribution(df):
     plt.xlabel('GPU Type', fontsize=12)
     plt.ylabel('Number of Reservations', fontsize=12)
     plt.grid(True, alpha=0.3, axis='y')
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'gpu_type_distribution.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/gpu_type_distribution.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'gpu_type_distribution.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/gpu_type_distribution.webp")
 
 
 def plot_top_users(df, top_n=10):
@@ -279,7 +375,7 @@ def plot_top_users(df, top_n=10):
 
     user_counts = df['user_id'].value_counts().head(top_n)
 
-    plt.figure(figsize=(12, 6))
+    _figure((12, 6))
     colors = sns.color_palette("viridis", len(user_counts))
     plt.barh(range(len(user_counts)), user_counts.values, color=colors)
     plt.yticks(range(len(user_counts)), [
@@ -289,27 +385,29 @@ def plot_top_users(df, top_n=10):
     plt.xlabel('Number of Reservations', fontsize=12)
     plt.ylabel('User', fontsize=12)
     plt.grid(True, alpha=0.3, axis='x')
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'top_users.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/top_users.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'top_users.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/top_users.webp")
 
 
 def plot_top_users_by_gpu_hours(df, top_n=10):
     """Plot top users by GPU hours, grouped by GPU type (stacked bar)"""
     print("\nGenerating top users by GPU hours plot...")
 
-    # Calculate GPU hours per user per GPU type
-    df['gpu_hours'] = df['duration_hours'] * df['gpu_count']
+    # GPU hours per reservation, kept out of the shared DataFrame
+    gpu_hours = pd.Series(
+        df['duration_hours'].values * df['gpu_count'].values, index=df.index)
 
     # Get top N users by total GPU hours
-    top_users = df.groupby('user_id')['gpu_hours'].sum().nlargest(top_n).index
+    top_users = gpu_hours.groupby(
+        df['user_id'], observed=True).sum().nlargest(top_n).index
 
-    # Filter to top users and pivot for stacking
-    df_top = df[df['user_id'].isin(top_users)].copy()
-    user_gpu_type_hours = df_top.groupby(['user_id', 'gpu_type'])[
-        'gpu_hours'].sum().unstack(fill_value=0)
+    # Filter to top users (compare int category codes, not user strings) and
+    # pivot for stacking
+    top_codes = df['user_id'].cat.categories.get_indexer(top_users)
+    top = np.isin(df['user_id'].cat.codes.values, top_codes)
+    user_gpu_type_hours = gpu_hours[top].groupby(
+        [df['user_id'][top], df['gpu_type'][top]], observed=True
+    ).sum().unstack(fill_value=0)
 
     # Sort by total GPU hours
     user_gpu_type_hours['total'] = user_gpu_type_hours.sum(axis=1)
@@ -318,14 +416,14 @@ def plot_top_users_by_gpu_hours(df, top_n=10):
     user_gpu_type_hours = user_gpu_type_hours.drop('total', axis=1)
 
     # Plot stacked horizontal bar chart
-    plt.figure(figsize=(12, 8))
+    _figure((12, 8))
     colors = sns.color_palette("Set2", len(user_gpu_type_hours.columns))
 
     user_gpu_type_hours.plot(
         kind='barh',
         stacked=True,
         color=colors,
-        figsize=(12, 8)
+        ax=plt.gca()
     )
 
     # Format y-axis labels (remove @domain.com)
@@ -338,26 +436,23 @@ def plot_top_users_by_gpu_hours(df, top_n=10):
     plt.ylabel('User', fontsize=12)
     plt.legend(title='GPU Type', bbox_to_anchor=(1.05, 1), loc='upper left')
     plt.grid(True, alpha=0.3, axis='x')
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'top_users_gpu_hours.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/top_users_gpu_hours.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'top_users_gpu_hours.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/top_users_gpu_hours.webp")
 
 
 def plot_gpu_usage_by_type(df, gpu_availability, weeks=4, target_types=['h200', 'b200']):
     """Plot hourly usage for specific GPU types against total capacity."""
     print("\nGenerating GPU usage plots by type...")
 
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
-    hour_range = pd.date_range(start=start_date, end=end_date, freq='H')
+    hour_range = pd.date_range(start=start_date, end=end_date, freq='h')
     target_types = [t.lower() for t in target_types]
     generated_plots = []
 
     for gpu_type in target_types:
         print(f"  Processing {gpu_type}...")
-        df_type = df[df['gpu_type'] == gpu_type].copy()
+        df_type = df[df['gpu_type'] == gpu_type]
 
         if df_type.empty:
             print(f"    No data for {gpu_type}, skipping plot.")
@@ -373,7 +468,7 @@ def plot_gpu_usage_by_type(df, gpu_availability, weeks=4, target_types=['h200',
             total_gpus = active['gpu_count'].sum()
             hourly_gpus.append(total_gpus)
 
-        plt.figure(figsize=(14, 6))
+        _figure((14, 6))
         plt.plot(hour_range, hourly_gpus, linewidth=2,
                  label=f'GPUs in Use ({gpu_type})')
         plt.fill_between(hour_range, hourly_gpus, alpha=0.2)
@@ -393,13 +488,11 @@ def plot_gpu_usage_by_type(df, gpu_availability, weeks=4, target_types=['h200',
         plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
         plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=max(1, weeks // 2)))
         plt.xticks(rotation=45)
-        plt.tight_layout()
 
-        filename = f'usage_{gpu_type}.png'
+        filename = f'usage_{gpu_type}.webp'
         filepath = os.path.join(OUTPUT_DIR, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        plt.savefig(filepath, **SAVE_KW)
         print(f"    Saved: {filepath}")
-        plt.close()
         generated_plots.append(filename)
 
     return generated_plots
@@ -410,11 +503,11 @@ def plot_unique_users_per_day(df, weeks=4):
     print("\nGenerating unique users per day plot...")
 
     # Get last N weeks
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
 
     # Filter to last N weeks
-    df_recent = df[df['created_at'] >= start_date].copy()
+    df_recent = df[df['created_at'] >= start_date]
 
     # Create date range for last N weeks
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
@@ -433,7 +526,7 @@ def plot_unique_users_per_day(df, weeks=4):
         daily_unique_users.append(unique_users)
 
     # Plot
-    plt.figure(figsize=(14, 6))
+    _figure((14, 6))
     plt.plot(date_range, daily_unique_users, marker='o',
              linewidth=2, markersize=4, color='#2ecc71')
     plt.fill_between(date_range, daily_unique_users,
@@ -447,11 +540,8 @@ def plot_unique_users_per_day(df, weeks=4):
     plt.gca().xaxis.set_major_locator(mdates.DayLocator(interval=max(1, weeks // 4)))
     plt.xticks(rotation=45)
     plt.ylim(bottom=0)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'unique_users_per_day.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/unique_users_per_day.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'unique_users_per_day.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/unique_users_per_day.webp")
 
 
 def plot_unique_users_per_week(df, weeks=4):
@@ -459,11 +549,11 @@ def plot_unique_users_per_week(df, weeks=4):
     print("\nGenerating unique users per week plot...")
 
     # Get last N weeks
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
 
     # Filter to last N weeks
-    df_recent = df[df['created_at'] >= start_date].copy()
+    df_recent = df[df['created_at'] >= start_date]
 
     # Create week range
     week_starts = pd.date_range(start=start_date, end=end_date, freq='W-MON')
@@ -490,7 +580,7 @@ def plot_unique_users_per_week(df, weeks=4):
         plot_weeks.append(week_start)
 
     # Plot
-    plt.figure(figsize=(14, 6))
+    _figure((14, 6))
     plt.bar(plot_weeks, weekly_unique_users, width=5, color='#3498db',
             alpha=0.7, edgecolor='#2980b9', linewidth=1.5)
     plt.title(f'Unique Users Per Week (Last {weeks} Weeks)',
@@ -501,11 +591,8 @@ def plot_unique_users_per_week(df, weeks=4):
     plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
     plt.xticks(rotation=45)
     plt.ylim(bottom=0)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'unique_users_per_week.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/unique_users_per_week.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'unique_users_per_week.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/unique_users_per_week.webp")
 
 
 def plot_gpu_hours_per_day_by_type(df, weeks=4, target_types=['h200', 'b200']):
@@ -513,14 +600,14 @@ def plot_gpu_hours_per_day_by_type(df, weeks=4, target_types=['h200', 'b200']):
     print("\nGenerating GPU hours per day by type plot...")
 
     # Get last N weeks
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
 
     # Filter to last N weeks and exclude failed reservations
     df_recent = df[
         (df['created_at'] >= start_date) &
         (df['status'] != 'failed')
-    ].copy()
+    ]
 
     # Create date range
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
@@ -531,7 +618,7 @@ def plot_gpu_hours_per_day_by_type(df, weeks=4, target_types=['h200', 'b200']):
     # Calculate GPU hours per day for each GPU type
     gpu_type_daily_hours = {}
     for gpu_type in target_types:
-        df_type = df_recent[df_recent['gpu_type'] == gpu_type].copy()
+        df_type = df_recent[df_recent['gpu_type'] == gpu_type]
 
         if df_type.empty:
             print(f"  No data for {gpu_type}, skipping from plot.")
@@ -571,7 +658,7 @@ def plot_gpu_hours_per_day_by_type(df, weeks=4, target_types=['h200', 'b200']):
         return
 
     # Plot
-    fig, ax = plt.subplots(figsize=(14, 7))
+    ax = _figure((14, 7)).subplots()
     colors = {'h200': '#e74c3c', 'b200': '#9b59b6',
               'h100': '#3498db', 't4': '#2ecc71', 'l4': '#f39c12'}
 
@@ -592,8 +679,8 @@ def plot_gpu_hours_per_day_by_type(df, weeks=4, target_types=['h200', 'b200']):
     # Phase 1: Before Oct 5 - 16 GPUs
     # Phase 2: Oct 5 to Oct 12 (7 days) - 32 GPUs
     # Phase 3: After Oct 12 - 24 GPUs
-    step_date_1 = datetime(2025, 10, 5)
-    step_date_2 = datetime(2025, 10, 12)
+    step_date_1 = datetime(2025, 10, 5, tzinfo=timezone.utc)
+    step_date_2 = datetime(2025, 10, 12, tzinfo=timezone.utc)
 
     capacity_phase1 = 24 * 16   # 384 GPU-hours/day
     capacity_phase2 = 24 * 32   # 768 GPU-hours/day
@@ -632,11 +719,8 @@ def plot_gpu_hours_per_day_by_type(df, weeks=4, target_types=['h200', 'b200']):
     ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, weeks // 4)))
     plt.xticks(rotation=45)
     ax.set_ylim(bottom=0)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'gpu_hours_per_day_by_type.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/gpu_hours_per_day_by_type.png")
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, 'gpu_hours_per_day_by_type.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/gpu_hours_per_day_by_type.webp")
 
 
 def plot_reservations_per_user_over_time(df, weeks=4, top_n=10):
@@ -644,14 +728,16 @@ def plot_reservations_per_user_over_time(df, weeks=4, top_n=10):
     print("\nGenerating reservations per user over time plot...")
 
     # Get last N weeks
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
 
     # Filter to last N weeks
-    df_recent = df[df['created_at'] >= start_date].copy()
+    df_recent = df[df['created_at'] >= start_date]
 
     # Get top N users by total reservation count in this period
-    top_users = df_recent['user_id'].value_counts().head(top_n).index.tolist()
+    # value_counts on a categorical also lists users with no recent reservations
+    user_counts = df_recent['user_id'].value_counts()
+    top_users = user_counts[user_counts > 0].head(top_n).index.tolist()
 
     # Create week range
     week_starts = pd.date_range(start=start_date, end=end_date, freq='W-MON')
@@ -681,7 +767,7 @@ def plot_reservations_per_user_over_time(df, weeks=4, top_n=10):
     plot_weeks = week_starts[:len(weekly_counts)]
 
     # Plot
-    plt.figure(figsize=(14, 7))
+    _figure((14, 7))
     colors = sns.color_palette("tab10", top_n)
 
     for idx, (user, counts) in enumerate(user_weekly_data.items()):
@@ -699,28 +785,11 @@ def plot_reservations_per_user_over_time(df, weeks=4, top_n=10):
     plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
     plt.xticks(rotation=45)
     plt.ylim(bottom=0)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, 'reservations_per_user_over_time.png'),
-                dpi=300, bbox_inches='tight')
-    print(f"  Saved: {OUTPUT_DIR}/reservations_per_user_over_time.png")
-    plt.close()
-
+    plt.savefig(os.path.join(OUTPUT_DIR, 'reservations_per_user_over_time.webp'), **SAVE_KW)
+    print(f"  Saved: {OUTPUT_DIR}/reservations_per_user_over_time.webp")
 
-def generate_html_dashboard(stats, df, gpu_usage_plots=[]):
-    """Generate HTML dashboard"""
-    print("\nGenerating HTML dashboard...")
 
-    gpu_usage_cards = ""
-    for plot_file in gpu_usage_plots:
-        gpu_type = plot_file.replace('usage_', '').replace('.png', '').upper()
-        gpu_usage_cards += f"""
-            <div class="chart-card">
-                <h2 class="chart-title">{gpu_type} GPU Usage (Last 4 Weeks)</h2>
-                <img src="{plot_file}" alt="{gpu_type} GPU Usage">
-            </div>
-        """
-
-    html = f"""
+DASHBOARD_TEMPLATE = Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -728,199 +797,228 @@ def generate_html_dashboard(stats, df, gpu_usage_plots=[]):
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>GPU Dev Server Analytics Dashboard</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
 
-        h1 {{
+        h1 {
             color: white;
             text-align: center;
             margin-bottom: 10px;
             font-size: 2.5em;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-        }}
+        }
 
-        .subtitle {{
+        .subtitle {
             color: rgba(255,255,255,0.9);
             text-align: center;
             margin-bottom: 30px;
             font-size: 1.1em;
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 25px;
             border-radius: 12px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             transition: transform 0.2s;
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 6px 12px rgba(0,0,0,0.15);
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2.5em;
             font-weight: bold;
             color: #667eea;
             margin-bottom: 5px;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             color: #666;
             font-size: 0.9em;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
 
-        .charts {{
+        .charts {
             display: grid;
             gap: 20px;
-        }}
+        }
 
-        .chart-card {{
+        .chart-card {
             background: white;
             padding: 20px;
             border-radius: 12px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .chart-card img {{
+        .chart-card img {
             width: 100%;
             height: auto;
             border-radius: 8px;
-        }}
+        }
 
-        .chart-title {{
+        .chart-title {
             font-size: 1.3em;
             color: #333;
             margin-bottom: 15px;
             font-weight: 600;
-        }}
+        }
 
-        .gpu-types {{
+        .gpu-types {
             background: white;
             padding: 20px;
             border-radius: 12px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             margin-bottom: 20px;
-        }}
+        }
 
-        .gpu-type-item {{
+        .gpu-type-item {
             display: flex;
             justify-content: space-between;
             padding: 10px;
             border-bottom: 1px solid #eee;
-        }}
+        }
 
-        .gpu-type-item:last-child {{
+        .gpu-type-item:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .footer {{
+        .footer {
             text-align: center;
             color: rgba(255,255,255,0.8);
             margin-top: 40px;
             padding: 20px;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>🚀 GPU Dev Server Analytics</h1>
-        <p class="subtitle">Generated on {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}</p>
+        <p class="subtitle">Generated on ${generated_on}</p>
 
         <div class="stats-grid">
             <div class="stat-card">
-                <div class="stat-value">{stats['total_reservations']:,}</div>
+                <div class="stat-value">${total_reservations}</div>
                 <div class="stat-label">Total Reservations</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{stats['unique_users']:,}</div>
+                <div class="stat-value">${unique_users}</div>
                 <div class="stat-label">Unique Users</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{stats['total_gpu_hours']:,.0f}</div>
+                <div class="stat-value">${total_gpu_hours}</div>
                 <div class="stat-label">Total GPU Hours</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{len(df[df['status'] == 'active']):,}</div>
+                <div class="stat-value">${currently_active}</div>
                 <div class="stat-label">Currently Active</div>
             </div>
         </div>
 
         <div class="charts">
-            {gpu_usage_cards}
+            ${gpu_usage_cards}
             <div class="chart-card">
                 <h2 class="chart-title">Unique Users Per Day</h2>
-                <img src="unique_users_per_day.png" alt="Unique Users Per Day">
+                <img src="unique_users_per_day.webp" alt="Unique Users Per Day">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">Unique Users Per Week</h2>
-                <img src="unique_users_per_week.png" alt="Unique Users Per Week">
+                <img src="unique_users_per_week.webp" alt="Unique Users Per Week">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">Reservations Per Week - Top 10 Users</h2>
-                <img src="reservations_per_user_over_time.png" alt="Reservations Per User Over Time">
+                <img src="reservations_per_user_over_time.webp" alt="Reservations Per User Over Time">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">GPU Hours Per Day - H200 & B200</h2>
-                <img src="gpu_hours_per_day_by_type.png" alt="GPU Hours Per Day by Type">
+                <img src="gpu_hours_per_day_by_type.webp" alt="GPU Hours Per Day by Type">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">Daily Active Reservations</h2>
-                <img src="daily_active_reservations.png" alt="Daily Active Reservations">
+                <img src="daily_active_reservations.webp" alt="Daily Active Reservations">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">Hourly Active GPU Count</h2>
-                <img src="hourly_gpu_usage.png" alt="Hourly GPU Usage">
+                <img src="hourly_gpu_usage.webp" alt="Hourly GPU Usage">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">Reservations by GPU Type</h2>
-                <img src="gpu_type_distribution.png" alt="GPU Type Distribution">
+                <img src="gpu_type_distribution.webp" alt="GPU Type Distribution">
             </div>
 
             <div class="chart-card">
                 <h2 class="chart-title">Top 10 Users by GPU Hours (by Type)</h2>
-                <img src="top_users_gpu_hours.png" alt="Top Users by GPU Hours">
+                <img src="top_users_gpu_hours.webp" alt="Top Users by GPU Hours">
             </div>
         </div>
 
         <div class="footer">
-            <p>Data spans from {stats['date_range']['first'].strftime('%B %d, %Y')} to {stats['date_range']['last'].strftime('%B %d, %Y')}</p>
+            <p>Data spans from ${first_date} to ${last_date}</p>
         </div>
     </div>
 </body>
 </html>
-    """
+""")
+
+GPU_USAGE_CARD_TEMPLATE = Template("""
+            <div class="chart-card">
+                <h2 class="chart-title">${gpu_type} GPU Usage (Last 4 Weeks)</h2>
+                <img src="${plot_file}" alt="${gpu_type} GPU Usage">
+            </div>
+        """)
+
+
+def generate_html_dashboard(stats, df, gpu_usage_plots=[]):
+    """Generate HTML dashboard"""
+    print("\nGenerating HTML dashboard...")
+
+    gpu_usage_cards = "".join(
+        GPU_USAGE_CARD_TEMPLATE.substitute(
+            gpu_type=plot_file.replace('usage_', '').replace('.webp', '').upper(),
+            plot_file=plot_file)
+        for plot_file in gpu_usage_plots)
+
+    html = DASHBOARD_TEMPLATE.substitute(
+        generated_on=datetime.now().strftime('%B %d, %Y at %H:%M:%S'),
+        total_reservations=f"{stats['total_reservations']:,}",
+        unique_users=f"{stats['unique_users']:,}",
+        total_gpu_hours=f"{stats['total_gpu_hours']:,.0f}",
+        currently_active=f"{(df['status'] == 'active').sum():,}",
+        gpu_usage_cards=gpu_usage_cards,
+        first_date=stats['date_range']['first'].strftime('%B %d, %Y'),
+        last_date=stats['date_range']['last'].strftime('%B %d, %Y'),
+    )
 
     output_path = os.path.join(OUTPUT_DIR, 'dashboard.html')
     with open(output_path, 'w') as f:
@@ -941,6 +1039,11 @@ def main():
         default=4,
         help='Number of weeks to analyze (default: 4)'
     )
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Ignore the local reservations cache and rescan the whole table'
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -949,8 +1052,7 @@ def main():
     print("=" * 60)
 
     # Fetch data
-    reservations = fetch_all_reservations()
-    df = parse_reservation_data(reservations)
+    df = load_reservations(full_refresh=args.full_refresh)
     gpu_availability = fetch_gpu_availability()
 
     if df.empty:
@@ -979,17 +1081,29 @@ def main():
     print("\n" + "=" * 60)
     print("GENERATING VISUALIZATIONS")
     print("=" * 60)
-    plot_unique_users_per_day(df, weeks=args.weeks)
-    plot_unique_users_per_week(df, weeks=args.weeks)
-    plot_reservations_per_user_over_time(df, weeks=args.weeks)
-    plot_gpu_hours_per_day_by_type(
-        df, weeks=args.weeks, target_types=['h200', 'b200'])
-    plot_daily_active_reservations(df, weeks=args.weeks)
-    plot_hourly_gpu_usage(df, weeks=args.weeks)
-    plot_gpu_type_distribution(df)
-    plot_top_users_by_gpu_hours(df)
-    gpu_usage_plots = plot_gpu_usage_by_type(
-        df, gpu_availability, weeks=args.weeks)
+    # Plots are independent and CPU-bound (rasterize + PNG encode), so render
+    # them in separate processes; matplotlib state is not shareable across threads.
+    recent = _recent_slice(df, weeks=args.weeks)
+    with ProcessPoolExecutor(max_workers=PLOT_WORKERS) as executor:
+        futures = [
+            executor.submit(plot_unique_users_per_day, df, weeks=args.weeks),
+            executor.submit(plot_unique_users_per_week, df, weeks=args.weeks),
+            executor.submit(plot_reservations_per_user_over_time,
+                            df, weeks=args.weeks),
+            executor.submit(plot_gpu_hours_per_day_by_type, df,
+                            weeks=args.weeks, target_types=['h200', 'b200']),
+            executor.submit(plot_daily_active_reservations,
+                            recent, weeks=args.weeks),
+            executor.submit(plot_hourly_gpu_usage, recent, weeks=args.weeks),
+            executor.submit(plot_gpu_type_distribution,
+                            stats['gpu_types']),
+            executor.submit(plot_top_users_by_gpu_hours, df),
+        ]
+        gpu_usage_future = executor.submit(
+            plot_gpu_usage_by_type, df, gpu_availability, weeks=args.weeks)
+        for future in futures:
+            future.result()  # re-raise any worker failure
+        gpu_usage_plots = gpu_usage_future.result()
 
     # Generate dashboard
     generate_html_dashboard(stats, df, gpu_usage_plots)
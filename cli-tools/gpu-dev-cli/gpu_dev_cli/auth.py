@@ -5,38 +5,42 @@ import os
 import subprocess
 import re
 import time
-from pathlib import Path
-from typing import Dict, Any, Optional
-from .config import Config
+from typing import Dict, Any, Optional, Tuple
+from .config import CONFIG_DIR, Config
 from rich.spinner import Spinner
 
 # SSH validation result is cached locally for 24h. New keys pushed to GitHub still take effect
 # at reservation time (pods fetch live keys via init container) — caching only skips the
 # pre-flight "are you who you say you are" check.
 _SSH_CACHE_TTL_SECONDS = 14 * 24 * 60 * 60
-_SSH_CACHE_PATH = Path(os.path.expanduser("~/.config/gpu-dev/ssh-validation-cache.json"))
+_SSH_CACHE_PATH = CONFIG_DIR / "ssh-validation-cache.json"
 
 # Cache for authenticate_user. STS GetCallerIdentity is stable per AWS profile and slow under SSO
 # (~500ms-1.5s). Cache for 24h keyed by AWS_PROFILE; if creds rotate the user_id rarely changes,
 # and the next AWS call (DDB/SQS) will surface a credential error if it does.
 _AUTH_CACHE_TTL_SECONDS = 60 * 60
-_AUTH_CACHE_PATH = Path(os.path.expanduser("~/.config/gpu-dev/auth-cache.json"))
+_AUTH_CACHE_PATH = CONFIG_DIR / "auth-cache.json"
+
+# In-process memo in front of the file cache: commands that chain into others (reserve ->
+# connect) or poll re-authenticate several times per run. Entries are
+# {(profile, github_user, role_arn): (monotonic_deadline, result)}.
+_auth_memo: Dict[tuple, tuple] = {}
 
 
 def _auth_cache_key() -> str:
     return os.environ.get("AWS_PROFILE", "default")
 
 
-def _load_auth_cache(github_user: str) -> Optional[Dict[str, Any]]:
+def _load_auth_cache(github_user: str) -> Optional[Tuple[Dict[str, Any], float]]:
+    """(result, ts) of a fresh cache entry for this profile + github_user, else None."""
     try:
-        if not _AUTH_CACHE_PATH.exists():
-            return None
         with open(_AUTH_CACHE_PATH) as f:
             data = json.load(f)
         entry = data.get(_auth_cache_key())
         if not entry or entry.get("github_user") != github_user:
             return None
-        if time.time() - float(entry.get("ts", 0)) > _AUTH_CACHE_TTL_SECONDS:
+        ts = float(entry.get("ts", 0))
+        if time.time() - ts > _AUTH_CACHE_TTL_SECONDS:
             return None
         # Defense against stale cache on a persistent disk that pre-dates the IRSA fix:
         # if AWS_ROLE_ARN points at a role the cached ARN doesn\'t reference, the cache
@@ -51,7 +55,7 @@ def _load_auth_cache(github_user: str) -> Optional[Dict[str, Any]]:
                     return None
             except Exception:
                 pass
-        return entry.get("result")
+        return entry.get("result"), ts
     except Exception:
         return None
 
@@ -59,13 +63,11 @@ def _load_auth_cache(github_user: str) -> Optional[Dict[str, Any]]:
 def _save_auth_cache(github_user: str, result: Dict[str, Any]) -> None:
     try:
         _AUTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        data = {}
-        if _AUTH_CACHE_PATH.exists():
-            try:
-                with open(_AUTH_CACHE_PATH) as f:
-                    data = json.load(f)
-            except Exception:
-                data = {}
+        try:
+            with open(_AUTH_CACHE_PATH) as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
         data[_auth_cache_key()] = {
             "github_user": github_user,
             "ts": int(time.time()),
@@ -80,9 +82,8 @@ def _save_auth_cache(github_user: str, result: Dict[str, Any]) -> None:
 def clear_auth_cache() -> None:
     """Drop the cached auth entry for the current AWS profile. Call this after a credential
     error to force the next authenticate_user() to re-hit STS."""
+    _auth_memo.clear()
     try:
-        if not _AUTH_CACHE_PATH.exists():
-            return
         with open(_AUTH_CACHE_PATH) as f:
             data = json.load(f)
         if _auth_cache_key() in data:
@@ -96,8 +97,6 @@ def clear_auth_cache() -> None:
 def _load_ssh_cache(github_user: str) -> Optional[Dict[str, Any]]:
     """Return cached validation if it's fresh and matches the configured github_user, else None."""
     try:
-        if not _SSH_CACHE_PATH.exists():
-            return None
         with open(_SSH_CACHE_PATH) as f:
             data = json.load(f)
         if data.get("configured_user") != github_user:
@@ -138,9 +137,18 @@ def authenticate_user(config: Config) -> Dict[str, Any]:
             "GitHub username not configured. Please run: gpu-dev config set github_user <your-github-username>"
         )
 
+    memo_key = (_auth_cache_key(), github_user, os.environ.get("AWS_ROLE_ARN", ""))
+    memo = _auth_memo.get(memo_key)
+    if memo is not None and time.monotonic() < memo[0]:
+        return memo[1]
+
     cached = _load_auth_cache(github_user)
     if cached is not None:
-        return cached
+        result, ts = cached
+        # The memo lives only as long as the file entry has left, not a fresh TTL
+        remaining = _AUTH_CACHE_TTL_SECONDS - (time.time() - ts)
+        _auth_memo[memo_key] = (time.monotonic() + remaining, result)
+        return result
 
     try:
         identity = config.get_user_identity()
@@ -152,6 +160,7 @@ def authenticate_user(config: Config) -> Dict[str, Any]:
             "arn": arn,
         }
         _save_auth_cache(github_user, result)
+        _auth_memo[memo_key] = (time.monotonic() + _AUTH_CACHE_TTL_SECONDS, result)
         return result
     except Exception as e:
         clear_auth_cache()
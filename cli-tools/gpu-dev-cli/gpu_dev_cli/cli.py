@@ -18,6 +18,7 @@ from rich.live import Live
 from .auth import authenticate_user, validate_ssh_key_matches_github_user
 from .reservations import (
     ReservationManager,
+    parse_iso_utc,
     _generate_vscode_command,
     _add_agent_forwarding_to_ssh,
     create_ssh_config_for_reservation,
@@ -25,7 +26,21 @@ from .reservations import (
     get_ssh_config_path,
     is_ssh_include_enabled,
 )
-from .config import Config, load_config
+from .config import CONFIG_DIR, Config, load_config
+from .disks import (
+    clone_disk,
+    create_disk,
+    delete_disk,
+    delete_refusal_message,
+    get_disk,
+    get_disk_in_use_status,
+    get_operation_result,
+    list_disk_content,
+    list_disks,
+    poll_disk_operation,
+    rename_disk,
+    unlock_disk,
+)
 from .interactive import (
     select_gpu_type_interactive,
     select_gpu_count_interactive,
@@ -101,14 +116,7 @@ def _format_relative_time(timestamp_str: str, relative_to: str = "now") -> str:
 
         # Parse the timestamp
         if isinstance(timestamp_str, str):
-            if timestamp_str.endswith("Z"):
-                dt_utc = datetime.fromisoformat(
-                    timestamp_str.replace("Z", "+00:00"))
-            elif "+" in timestamp_str or timestamp_str.endswith("00:00"):
-                dt_utc = datetime.fromisoformat(timestamp_str)
-            else:
-                naive_dt = datetime.fromisoformat(timestamp_str)
-                dt_utc = naive_dt.replace(tzinfo=timezone.utc)
+            dt_utc = parse_iso_utc(timestamp_str)
         else:
             dt_utc = datetime.fromtimestamp(timestamp_str, tz=timezone.utc)
 
@@ -163,14 +171,7 @@ def _format_expires_with_remaining(expires_at) -> str:
 
         # Parse the timestamp
         if isinstance(expires_at, str):
-            if expires_at.endswith("Z"):
-                expires_dt_utc = datetime.fromisoformat(
-                    expires_at.replace("Z", "+00:00"))
-            elif "+" in expires_at or expires_at.endswith("00:00"):
-                expires_dt_utc = datetime.fromisoformat(expires_at)
-            else:
-                naive_dt = datetime.fromisoformat(expires_at)
-                expires_dt_utc = naive_dt.replace(tzinfo=timezone.utc)
+            expires_dt_utc = parse_iso_utc(expires_at)
         else:
             # Legacy Unix timestamp
             expires_dt_utc = datetime.fromtimestamp(expires_at, tz=timezone.utc)
@@ -231,19 +232,7 @@ def _show_single_reservation(connection_info: dict) -> None:
             from datetime import datetime, timezone
 
             if isinstance(timestamp_str, str):
-                # Handle different ISO format variations
-                if timestamp_str.endswith("Z"):
-                    # Format: 2025-01-11T23:30:00Z
-                    dt_utc = datetime.fromisoformat(
-                        timestamp_str.replace("Z", "+00:00")
-                    )
-                elif "+" in timestamp_str or timestamp_str.endswith("00:00"):
-                    # Format: 2025-01-11T23:30:00+00:00
-                    dt_utc = datetime.fromisoformat(timestamp_str)
-                else:
-                    # Format: 2025-01-11T23:30:00 (naive datetime, assume UTC)
-                    naive_dt = datetime.fromisoformat(timestamp_str)
-                    dt_utc = naive_dt.replace(tzinfo=timezone.utc)
+                dt_utc = parse_iso_utc(timestamp_str)
 
                 dt_local = dt_utc.astimezone()  # Convert to local timezone
                 return dt_local.strftime("%Y-%m-%d %H:%M:%S")
@@ -1178,7 +1167,6 @@ def reserve(
 
                 # Validate disk if specified
                 if disk:
-                    from .disks import list_disks
                     existing_disks = list_disks(user_info["user_id"], config)
                     disk_names = [d["name"] for d in existing_disks]
 
@@ -1210,7 +1198,6 @@ def reserve(
                         live.start()
                     else:
                         # Disk exists, check if it's in use
-                        from .disks import get_disk_in_use_status
                         disk_info = next((d for d in existing_disks if d['name'] == disk), None)
 
                         if disk_info and disk_info['in_use']:
@@ -2424,7 +2411,7 @@ def list(ctx: click.Context, user: Optional[str], status: Optional[str], details
                         if ended:
                             try:
                                 from datetime import datetime, timezone
-                                ended_dt = datetime.fromisoformat(ended.replace("Z", "+00:00"))
+                                ended_dt = parse_iso_utc(ended)
                                 ended_str = ended_dt.astimezone().strftime("%H:%M")
                             except Exception:
                                 pass
@@ -2485,22 +2472,7 @@ def list(ctx: click.Context, user: Optional[str], status: Optional[str], details
                             from datetime import datetime
 
                             if isinstance(created_at, str):
-                                # Handle different ISO format variations
-                                if created_at.endswith("Z"):
-                                    created_dt_utc = datetime.fromisoformat(
-                                        created_at.replace("Z", "+00:00")
-                                    )
-                                elif "+" in created_at or created_at.endswith("00:00"):
-                                    created_dt_utc = datetime.fromisoformat(
-                                        created_at)
-                                else:
-                                    # Assume naive datetime is UTC
-                                    from datetime import timezone
-
-                                    naive_dt = datetime.fromisoformat(
-                                        created_at)
-                                    created_dt_utc = naive_dt.replace(
-                                        tzinfo=timezone.utc)
+                                created_dt_utc = parse_iso_utc(created_at)
 
                                 created_dt = created_dt_utc.astimezone()  # Convert to local
                                 created_formatted = created_dt.strftime(
@@ -2663,13 +2635,7 @@ def list(ctx: click.Context, user: Optional[str], status: Optional[str], details
                                     if created_at:
                                         try:
                                             if isinstance(created_at, str):
-                                                if created_at.endswith("Z"):
-                                                    created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                                                elif "+" in created_at or created_at.endswith("00:00"):
-                                                    created_dt = datetime.fromisoformat(created_at)
-                                                else:
-                                                    naive_dt = datetime.fromisoformat(created_at)
-                                                    created_dt = naive_dt.replace(tzinfo=timezone.utc)
+                                                created_dt = parse_iso_utc(created_at)
                                             else:
                                                 created_dt = datetime.fromtimestamp(created_at, tz=timezone.utc)
 
@@ -2773,14 +2739,7 @@ def list(ctx: click.Context, user: Optional[str], status: Optional[str], details
                                     if created_at and created_at != "N/A":
                                         try:
                                             if isinstance(created_at, str):
-                                                if created_at.endswith("Z"):
-                                                    created_dt_utc = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                                                elif "+" in created_at or created_at.endswith("00:00"):
-                                                    created_dt_utc = datetime.fromisoformat(created_at)
-                                                else:
-                                                    from datetime import timezone
-                                                    naive_dt = datetime.fromisoformat(created_at)
-                                                    created_dt_utc = naive_dt.replace(tzinfo=timezone.utc)
+                                                created_dt_utc = parse_iso_utc(created_at)
                                                 created_dt = created_dt_utc.astimezone()
                                                 created_formatted = created_dt.strftime("%m-%d %H:%M")
                                             else:
@@ -2978,19 +2937,7 @@ def cancel(
                         from datetime import datetime
 
                         if isinstance(created_at, str):
-                            if created_at.endswith("Z"):
-                                created_dt_utc = datetime.fromisoformat(
-                                    created_at.replace("Z", "+00:00")
-                                )
-                            elif "+" in created_at or created_at.endswith("00:00"):
-                                created_dt_utc = datetime.fromisoformat(
-                                    created_at)
-                            else:
-                                from datetime import timezone
-
-                                naive_dt = datetime.fromisoformat(created_at)
-                                created_dt_utc = naive_dt.replace(
-                                    tzinfo=timezone.utc)
+                            created_dt_utc = parse_iso_utc(created_at)
 
                             created_dt = created_dt_utc.astimezone()
                             created_formatted = created_dt.strftime(
@@ -3490,8 +3437,8 @@ def _maybe_show_sdk_tip() -> None:
     `gpu-dev repro` for sub-second, scriptable workflows. Counted locally."""
     try:
         import json
-        path = os.path.expanduser("~/.config/gpu-dev/reserve-count.json")
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        path = CONFIG_DIR / "reserve-count.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
         try:
             n = int(json.load(open(path)).get("count", 0))
         except Exception:
@@ -5119,7 +5066,6 @@ def disk():
 def disk_list(watch: bool, user: str):
     """List all persistent disks"""
     import time
-    from .disks import list_disks
     from .auth import authenticate_user
 
     config = load_config()
@@ -5271,7 +5217,6 @@ def disk_list(watch: bool, user: str):
 @click.argument("disk_name")
 def disk_create(disk_name: str):
     """Create a new named persistent disk"""
-    from .disks import create_disk, poll_disk_operation
     from .auth import authenticate_user
     import time
 
@@ -5289,7 +5234,6 @@ def disk_create(disk_name: str):
         if not operation_id:
             return
 
-        from .disks import poll_disk_operation
         rprint(f"[cyan]Creating disk '{disk_name}'...[/cyan]")
         success, message = poll_disk_operation("create", disk_name, user_id, config, timeout_seconds=120)
 
@@ -5307,9 +5251,10 @@ def disk_create(disk_name: str):
 @disk.command("list-content")
 @click.argument("disk_name")
 @click.option("--user", default=None, help="Impersonate another user (e.g., user@example.com)")
-def disk_list_content(disk_name: str, user: str):
+@click.option("--max-bytes", type=click.IntRange(min=1), default=None,
+              help="Only download the first N bytes of the listing (default: 1 MiB)")
+def disk_list_content(disk_name: str, user: str, max_bytes: Optional[int]):
     """Show contents of a disk's latest snapshot"""
-    from .disks import list_disk_content
     from .auth import authenticate_user
 
     config = load_config()
@@ -5326,7 +5271,7 @@ def disk_list_content(disk_name: str, user: str):
             return
 
     try:
-        contents = list_disk_content(disk_name, user_id, config)
+        contents = list_disk_content(disk_name, user_id, config, max_bytes=max_bytes)
 
         if contents is None:
             return
@@ -5349,7 +5294,6 @@ def disk_list_content(disk_name: str, user: str):
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 def disk_delete(disk_name: str, yes: bool):
     """Delete a disk and all its snapshots"""
-    from .disks import delete_disk, list_disks
     from .auth import authenticate_user
     import time
 
@@ -5364,8 +5308,7 @@ def disk_delete(disk_name: str, yes: bool):
 
     # Get disk info first to show snapshot count
     try:
-        disks = list_disks(user_id, config)
-        disk = next((d for d in disks if d['name'] == disk_name), None)
+        disk = get_disk(disk_name, user_id, config)
         if disk:
             snapshot_count = disk.get('snapshot_count', 0)
             rprint(f"[yellow]This will mark disk '{disk_name}' for deletion ({snapshot_count} snapshot(s)).[/yellow]")
@@ -5395,6 +5338,13 @@ def disk_delete(disk_name: str, yes: bool):
                 elapsed = int(time.time() - start_time)
                 live.update(f"[cyan]⏳ Deleting disk '{disk_name}'... ({elapsed}s)[/cyan]")
 
+                # The lambda re-checks the disk and may refuse (e.g. a reservation
+                # attached it after our pre-check) - it reports that here
+                status, error = get_operation_result(operation_id, config)
+                if status == "failed":
+                    live.update(f"[red]❌ {delete_refusal_message(disk_name, error)}[/red]")
+                    return
+
                 # Check if disk is marked as deleted
                 disks = list_disks(user_id, config)
                 disk = next((d for d in disks if d['name'] == disk_name), None)
@@ -5429,7 +5379,6 @@ def disk_clone(source_disk: str, target_disk: str):
     On first reservation the volume is created from that snapshot.
     Useful for parallel development/benchmarking with identical environments.
     """
-    from .disks import clone_disk, poll_disk_operation
     from .auth import authenticate_user
 
     config = load_config()
@@ -5465,7 +5414,6 @@ def disk_clone(source_disk: str, target_disk: str):
 @click.argument("new_name")
 def disk_rename(old_name: str, new_name: str):
     """Rename a disk"""
-    from .disks import rename_disk
     from .auth import authenticate_user
 
     config = load_config()
@@ -5494,7 +5442,6 @@ def disk_unlock(name: str, user: str):
 
     Use this when a disk shows as [IN USE] but you have no active reservations.
     """
-    from .disks import unlock_disk
     from .auth import authenticate_user
 
     config = load_config()
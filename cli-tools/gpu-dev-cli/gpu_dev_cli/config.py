@@ -3,10 +3,42 @@
 import os
 import json
 import boto3
-import botocore.exceptions
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Resolved once at import; every gpu-dev config/cache file lives under here.
+_HOME = Path.home()
+CONFIG_DIR = _HOME / ".config" / "gpu-dev"
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Write data to path, creating it owner-only (0600) so secrets are never
+    briefly readable under the default umask. The mode passed to os.open only
+    applies on create, so an existing file is tightened before it is written."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, "fchmod"):  # not on Windows before 3.13
+        os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+def json_loads(data: Any) -> Any:
+    """Decode JSON from bytes or str, using orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
 
 class Config:
     """Zero-config AWS-based configuration"""
@@ -42,11 +74,11 @@ class Config:
     DEFAULT_ENVIRONMENT = "prod"
 
     # Config file path (class-level for access without instantiation)
-    CONFIG_FILE = Path.home() / ".config" / "gpu-dev" / "config.json"
+    CONFIG_FILE = CONFIG_DIR / "config.json"
 
     # Legacy paths for migration
-    LEGACY_CONFIG_FILE = Path.home() / ".gpu-dev-config"
-    LEGACY_ENVIRONMENT_FILE = Path.home() / ".gpu-dev-environment.json"
+    LEGACY_CONFIG_FILE = _HOME / ".gpu-dev-config"
+    LEGACY_ENVIRONMENT_FILE = _HOME / ".gpu-dev-environment.json"
 
     def __init__(self):
         # Load unified config (handles migration from legacy files)
@@ -94,9 +126,12 @@ class Config:
         # AWS clients
         self._sts_client = None
         self._sqs_client = None
+        self._ec2_client = None
+        self._s3_client = None
         self._dynamodb = None
+        self._queue_url = None
 
-    _CRED_CACHE = Path.home() / ".config" / "gpu-dev" / "aws-cred-cache.json"
+    _CRED_CACHE = CONFIG_DIR / "aws-cred-cache.json"
 
     def _create_aws_session(self):
         """Create AWS session, caching resolved credentials to skip SSO resolution (~900ms)."""
@@ -104,15 +139,14 @@ class Config:
 
         # Try cached credentials first (avoids 900ms SSO resolution)
         try:
-            if self._CRED_CACHE.exists():
-                cached = json.loads(self._CRED_CACHE.read_text())
-                if _time.time() < cached.get("expires", 0):
-                    return boto3.Session(
-                        aws_access_key_id=cached["access_key"],
-                        aws_secret_access_key=cached["secret_key"],
-                        aws_session_token=cached["token"],
-                        region_name=self.aws_region,
-                    )
+            cached = json_loads(self._CRED_CACHE.read_bytes())
+            if _time.time() < cached.get("expires", 0):
+                return boto3.Session(
+                    aws_access_key_id=cached["access_key"],
+                    aws_secret_access_key=cached["secret_key"],
+                    aws_session_token=cached["token"],
+                    region_name=self.aws_region,
+                )
         except Exception:
             pass
 
@@ -131,13 +165,12 @@ class Config:
             frozen = creds.get_frozen_credentials()
             if frozen.token:
                 self._CRED_CACHE.parent.mkdir(parents=True, exist_ok=True)
-                self._CRED_CACHE.write_text(json.dumps({
+                _write_private(self._CRED_CACHE, json_dumps({
                     "access_key": frozen.access_key,
                     "secret_key": frozen.secret_key,
                     "token": frozen.token,
                     "expires": _time.time() + 2700,  # cache 45min (SSO tokens last ~1h)
                 }))
-                self._CRED_CACHE.chmod(0o600)
         except Exception:
             pass
 
@@ -152,6 +185,8 @@ class Config:
         self.session = self._create_aws_session()
         self._sts_client = None
         self._sqs_client = None
+        self._ec2_client = None
+        self._s3_client = None
         self._dynamodb = None
 
     @property
@@ -166,6 +201,18 @@ class Config:
             self._sqs_client = self.session.client("sqs", region_name=self.aws_region)
         return self._sqs_client
 
+    @property
+    def ec2_client(self):
+        if self._ec2_client is None:
+            self._ec2_client = self.session.client("ec2", region_name=self.aws_region)
+        return self._ec2_client
+
+    @property
+    def s3_client(self):
+        if self._s3_client is None:
+            self._s3_client = self.session.client("s3", region_name=self.aws_region)
+        return self._s3_client
+
     @property
     def dynamodb(self):
         if self._dynamodb is None:
@@ -175,10 +222,14 @@ class Config:
         return self._dynamodb
 
     def get_queue_url(self) -> str:
-        """Get SQS queue URL by name"""
+        """Get SQS queue URL by name. The URL is fixed for a queue name, so it is
+        resolved once per Config instead of on every send/poll."""
+        if self._queue_url is not None:
+            return self._queue_url
         try:
             response = self.sqs_client.get_queue_url(QueueName=self.queue_name)
-            return response["QueueUrl"]
+            self._queue_url = response["QueueUrl"]
+            return self._queue_url
         except Exception as e:
             raise RuntimeError(
                 f"Cannot access SQS queue {self.queue_name}. Check AWS permissions: {e}"
@@ -210,32 +261,21 @@ class Config:
         config = {}
         needs_save = False
 
-        # Try to load existing config
-        if self.CONFIG_FILE.exists():
-            try:
-                with open(self.CONFIG_FILE, "r") as f:
-                    config = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load config: {e}")
-        else:
-            # Migrate from legacy files
+        # Try to load existing config; migrate from legacy files if it's absent
+        try:
+            with open(self.CONFIG_FILE, "rb") as f:
+                config = json_loads(f.read())
+        except FileNotFoundError:
             migrated_from = []
-
-            if self.LEGACY_CONFIG_FILE.exists():
+            for legacy_file in (self.LEGACY_CONFIG_FILE, self.LEGACY_ENVIRONMENT_FILE):
                 try:
-                    with open(self.LEGACY_CONFIG_FILE, "r") as f:
-                        config.update(json.load(f))
-                    migrated_from.append(str(self.LEGACY_CONFIG_FILE))
+                    with open(legacy_file, "rb") as f:
+                        config.update(json_loads(f.read()))
+                    migrated_from.append(str(legacy_file))
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
-                    print(f"Warning: Could not read {self.LEGACY_CONFIG_FILE}: {e}")
-
-            if self.LEGACY_ENVIRONMENT_FILE.exists():
-                try:
-                    with open(self.LEGACY_ENVIRONMENT_FILE, "r") as f:
-                        config.update(json.load(f))
-                    migrated_from.append(str(self.LEGACY_ENVIRONMENT_FILE))
-                except Exception as e:
-                    print(f"Warning: Could not read {self.LEGACY_ENVIRONMENT_FILE}: {e}")
+                    print(f"Warning: Could not read {legacy_file}: {e}")
 
             if migrated_from:
                 print(
@@ -243,6 +283,8 @@ class Config:
                     f"to {self.CONFIG_FILE}"
                 )
                 needs_save = True
+        except Exception as e:
+            print(f"Warning: Could not load config: {e}")
 
         # Ensure required environment keys exist
         default_env = self.ENVIRONMENTS[self.DEFAULT_ENVIRONMENT]
@@ -268,8 +310,8 @@ class Config:
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Save config dict to file."""
         self.CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        with open(self.CONFIG_FILE, "wb") as f:
+            f.write(json_dumps(config, indent=True))
 
     def save_config(self, key: str, value: Any) -> None:
         """Save a configuration value."""
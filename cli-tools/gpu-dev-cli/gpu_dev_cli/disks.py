@@ -3,28 +3,89 @@ Disk management for GPU Dev CLI
 Handles named persistent disks with snapshot-first workflow
 """
 
-import boto3
+import codecs
+import hashlib
+import json
+import random
 import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import List, Dict, Optional, Tuple
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta, timezone
-from .config import Config
-from .reservations import get_version
+
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+
+from .config import CONFIG_DIR, Config, _write_private
+from .reservations import get_version, parse_iso_utc
+
+
+# Letters, digits, hyphens, underscores. \Z, unlike $, rejects a trailing newline.
+_DISK_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+
+# get_disk_in_use_status filters: any in-progress reservation naming the disk
+# (UserIndex), and for "default" the pre-named-disk reservations that carry an
+# EBS volume but no disk_name (UserStatusIndex, active/preparing only)
+_IN_USE_FILTER = "disk_name = :disk_name AND #status IN (:active, :preparing, :queued, :pending)"
+_LEGACY_DEFAULT_IN_USE_FILTER = "attribute_not_exists(disk_name) AND attribute_exists(ebs_volume_id)"
+
+# EC2 CreateTags accepts at most this many resource ids per call
+_CREATE_TAGS_MAX_RESOURCES = 1000
+
+# AWS error codes a disk-operation poll retries rather than reports
+_RETRYABLE_ERROR_CODES = frozenset({
+    'ThrottlingException',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'InternalServerError',
+    'ServiceUnavailable',
+})
+
+# Snapshot content listings keyed by S3 path, revalidated with If-None-Match
+_CONTENT_CACHE_DIR = CONFIG_DIR / "disk-content"
+
+# Download cap for a content listing when the caller gives no max_bytes
+_CONTENT_MAX_BYTES = 1 << 20
+
+# S3 body read size while decoding a content listing
+_CONTENT_CHUNK_BYTES = 64 * 1024
+
+
+# list_disks results per (user, table), indexed by name, reused for the
+# pre-checks the mutation helpers run right after a command listed the disks
+_DISKS_CACHE_TTL = 5.0
+_disks_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Dict]]] = {}
+
+
+# get_disk_in_use_status results per (user, table, disk) - repeat checks within
+# one command cost one lookup; cleared with the listing cache after mutations
+_IN_USE_CACHE_TTL = 2.0
+_in_use_cache: Dict[Tuple[str, str, str], Tuple[float, Tuple[bool, Optional[str]]]] = {}
+
+
+def _content_cache_paths(s3_path: str) -> Tuple[Path, Path]:
+    """(body, etag) cache files for a snapshot content listing."""
+    digest = hashlib.sha256(s3_path.encode()).hexdigest()[:16]
+    return _CONTENT_CACHE_DIR / f"{digest}.txt", _CONTENT_CACHE_DIR / f"{digest}.etag"
 
 
 def get_ec2_client(config: Config):
-    """Get boto3 EC2 client"""
-    return config.session.client('ec2', region_name=config.aws_region)
+    """Get boto3 EC2 client (built once per Config)"""
+    return config.ec2_client
 
 
 def get_s3_client(config: Config):
-    """Get boto3 S3 client"""
-    return config.session.client('s3', region_name=config.aws_region)
+    """Get boto3 S3 client (built once per Config)"""
+    return config.s3_client
 
 
 def get_dynamodb_resource(config: Config):
-    """Get boto3 DynamoDB resource"""
-    return config.session.resource('dynamodb', region_name=config.aws_region)
+    """Get boto3 DynamoDB resource (built once per Config)"""
+    return config.dynamodb
 
 
 def get_disk_in_use_status(disk_name: str, user_id: str, config: Config) -> Tuple[bool, Optional[str]]:
@@ -39,249 +100,334 @@ def get_disk_in_use_status(disk_name: str, user_id: str, config: Config) -> Tupl
     This prevents race conditions during both spinning up (queued/pending) and
     winding down (cancelled but cleanup still running).
     """
-    dynamodb = get_dynamodb_resource(config)
+    key = (user_id, config.disks_table, disk_name)
+    cached = _in_use_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _IN_USE_CACHE_TTL:
+        return cached[1]
 
     try:
-        # First check: disks table in_use field (most reliable for cleanup in progress)
-        disks_table_name = config.disks_table if hasattr(config, 'disks_table') else f"{config.queue_name.rsplit('-', 1)[0]}-disks"
-        disks_table = dynamodb.Table(disks_table_name)
+        status = _lookup_disk_in_use(disk_name, user_id, config)
+    except Exception as e:
+        print(f"Warning: Could not query reservations: {e}")
+        return False, None
 
-        try:
-            disk_response = disks_table.get_item(
-                Key={'user_id': user_id, 'disk_name': disk_name}
-            )
-            disk_item = disk_response.get('Item', {})
-
-            # Check if disk is marked as in_use in the disks table
-            if disk_item.get('in_use', False):
-                attached_reservation = disk_item.get('attached_to_reservation')
-                return True, attached_reservation
-        except Exception as disk_check_error:
-            # If disks table check fails, fall through to reservation check
-            pass
+    _in_use_cache[key] = (time.monotonic(), status)
+    return status
+
+
+def _lookup_disk_in_use(disk_name: str, user_id: str, config: Config) -> Tuple[bool, Optional[str]]:
+    """Uncached body of get_disk_in_use_status; raises on query errors."""
+    dynamodb = get_dynamodb_resource(config)
 
-        # Second check: reservations table for in-progress reservations
-        reservations_table = dynamodb.Table(config.reservations_table)
-
-        # Use UserIndex for efficient query (instead of scan with pagination)
-        # Check ALL in-progress statuses to prevent race conditions
-        response = reservations_table.query(
-            IndexName="UserIndex",
-            KeyConditionExpression="user_id = :user_id",
-            FilterExpression="disk_name = :disk_name AND #status IN (:active, :preparing, :queued, :pending)",
-            ExpressionAttributeNames={"#status": "status"},
-            ExpressionAttributeValues={
-                ":user_id": user_id,
-                ":disk_name": disk_name,
-                ":active": "active",
-                ":preparing": "preparing",
-                ":queued": "queued",
-                ":pending": "pending"
-            }
+    # First check: disks table in_use field (most reliable for cleanup in progress)
+    disks_table_name = config.disks_table if hasattr(config, 'disks_table') else f"{config.queue_name.rsplit('-', 1)[0]}-disks"
+    disks_table = dynamodb.Table(disks_table_name)
+
+    try:
+        disk_response = disks_table.get_item(
+            Key={'user_id': user_id, 'disk_name': disk_name},
+            ProjectionExpression='in_use, attached_to_reservation',
         )
+        disk_item = disk_response.get('Item', {})
+
+        # Check if disk is marked as in_use in the disks table
+        if disk_item.get('in_use', False):
+            attached_reservation = disk_item.get('attached_to_reservation')
+            return True, attached_reservation
+    except Exception as disk_check_error:
+        # If disks table check fails, fall through to reservation check
+        pass
 
-        # Handle pagination
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = reservations_table.query(
-                IndexName="UserIndex",
-                KeyConditionExpression="user_id = :user_id",
-                FilterExpression="disk_name = :disk_name AND #status IN (:active, :preparing, :queued, :pending)",
-                ExpressionAttributeNames={"#status": "status"},
-                ExpressionAttributeValues={
-                    ":user_id": user_id,
-                    ":disk_name": disk_name,
-                    ":active": "active",
-                    ":preparing": "preparing",
-                    ":queued": "queued",
-                    ":pending": "pending"
-                },
-                ExclusiveStartKey=response["LastEvaluatedKey"]
-            )
-            items.extend(response.get("Items", []))
+    # Second check: reservations table for in-progress reservations
+    reservations_table = dynamodb.Table(config.reservations_table)
 
-        if items:
-            reservation_id = items[0]["reservation_id"]
-            return True, reservation_id
-
-        # Special case: For "default" disk, also check for legacy reservations without disk_name field
-        # (reservations created before named disk migration)
-        # IMPORTANT: Only match legacy reservations that HAVE an ebs_volume_id
-        # (reservations without disk_name AND without ebs_volume_id are non-persistent, not "default" disk)
-        if disk_name == "default":
-            legacy_response = reservations_table.query(
-                IndexName="UserIndex",
-                KeyConditionExpression="user_id = :user_id",
-                FilterExpression="attribute_not_exists(disk_name) AND attribute_exists(ebs_volume_id) AND #status IN (:active, :preparing)",
+    # Use UserIndex for efficient query (instead of scan with pagination)
+    # Check ALL in-progress statuses to prevent race conditions
+    reservation_id = _first_reservation_id(
+        reservations_table,
+        IndexName="UserIndex",
+        KeyConditionExpression="user_id = :user_id",
+        FilterExpression=_IN_USE_FILTER,
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={
+            ":user_id": user_id,
+            ":disk_name": disk_name,
+            ":active": "active",
+            ":preparing": "preparing",
+            ":queued": "queued",
+            ":pending": "pending"
+        }
+    )
+    if reservation_id:
+        return True, reservation_id
+
+    # Special case: For "default" disk, also check for legacy reservations without disk_name field
+    # (reservations created before named disk migration)
+    # IMPORTANT: Only match legacy reservations that HAVE an ebs_volume_id
+    # (reservations without disk_name AND without ebs_volume_id are non-persistent, not "default" disk)
+    # Keyed on (user_id, status) so only the user's live reservations are read,
+    # not their whole history as a UserIndex query + status filter would.
+    if disk_name == "default":
+        for status in ("active", "preparing"):
+            reservation_id = _first_reservation_id(
+                reservations_table,
+                IndexName="UserStatusIndex",
+                KeyConditionExpression="user_id = :user_id AND #status = :status",
+                FilterExpression=_LEGACY_DEFAULT_IN_USE_FILTER,
                 ExpressionAttributeNames={"#status": "status"},
                 ExpressionAttributeValues={
                     ":user_id": user_id,
-                    ":active": "active",
-                    ":preparing": "preparing"
+                    ":status": status
                 }
             )
-
-            # Handle pagination for legacy query
-            legacy_items = legacy_response.get("Items", [])
-            while "LastEvaluatedKey" in legacy_response:
-                legacy_response = reservations_table.query(
-                    IndexName="UserIndex",
-                    KeyConditionExpression="user_id = :user_id",
-                    FilterExpression="attribute_not_exists(disk_name) AND attribute_exists(ebs_volume_id) AND #status IN (:active, :preparing)",
-                    ExpressionAttributeNames={"#status": "status"},
-                    ExpressionAttributeValues={
-                        ":user_id": user_id,
-                        ":active": "active",
-                        ":preparing": "preparing"
-                    },
-                    ExclusiveStartKey=legacy_response["LastEvaluatedKey"]
-                )
-                legacy_items.extend(legacy_response.get("Items", []))
-
-            if legacy_items:
-                reservation_id = legacy_items[0]["reservation_id"]
+            if reservation_id:
                 return True, reservation_id
 
-        return False, None
+    return False, None
 
-    except Exception as e:
-        print(f"Warning: Could not query reservations: {e}")
-        return False, None
 
+def _first_reservation_id(table, **query_kwargs) -> Optional[str]:
+    """
+    reservation_id of the first item the query matches, or None.
+    Pages through LastEvaluatedKey only until a page has a match; only
+    reservation_id is returned (the filter still sees the full item).
+    """
+    query_kwargs["ProjectionExpression"] = "reservation_id"
+    while True:
+        response = table.query(**query_kwargs)
+        items = response.get("Items", [])
+        if items:
+            return items[0]["reservation_id"]
+        if "LastEvaluatedKey" not in response:
+            return None
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
-def list_disks(user_id: str, config: Config) -> List[Dict]:
+
+def _disk_record(disk_item: Dict, parse_dates: bool = True) -> Dict:
     """
-    List all disks for a user.
-    Returns list of disk info dicts with: name, size, last_used, created_at, snapshot_count, in_use, reservation_id
+    Convert a disks-table item into the dict shape list_disks returns.
+    With parse_dates=False created_at/last_used are left as None, for callers
+    that only look at the name/in-use/snapshot fields.
     """
-    dynamodb = config.dynamodb
-    disks_table = dynamodb.Table(config.disks_table)
+    # Convert DynamoDB types (Decimal to int/float)
+    size_gb = int(disk_item.get('size_gb', 0)) if disk_item.get('size_gb') else 0
+    snapshot_count = int(disk_item.get('snapshot_count', 0)) if disk_item.get('snapshot_count') else 0
+    pending_snapshot_count = int(disk_item.get('pending_snapshot_count', 0)) if disk_item.get('pending_snapshot_count') else 0
+
+    # Parse datetime strings from DynamoDB
+    created_at_str = disk_item.get('created_at')
+    last_used_str = disk_item.get('last_used')
+
+    # Naive values from older records are normalized to UTC by parse_iso_utc
+    created_at = parse_iso_utc(created_at_str) if created_at_str and parse_dates else None
+    last_used = parse_iso_utc(last_used_str) if last_used_str and parse_dates else None
+
+    return {
+        'name': disk_item['disk_name'],
+        'size_gb': size_gb,
+        'disk_size': disk_item.get('disk_size'),
+        'created_at': created_at,
+        'last_used': last_used,
+        'snapshot_count': snapshot_count,
+        'pending_snapshot_count': pending_snapshot_count,
+        'in_use': bool(disk_item.get('in_use', False)),
+        'is_backing_up': disk_item.get('is_backing_up', False),
+        'reservation_id': str(disk_item.get('attached_to_reservation', '')) or None,
+        'is_deleted': disk_item.get('is_deleted', False),
+        'delete_date': disk_item.get('delete_date'),
+    }
 
-    dynamodb_disks = []
-    response = disks_table.query(
-        KeyConditionExpression="user_id = :user_id",
-        ExpressionAttributeValues={":user_id": user_id}
-    )
-    dynamodb_disks.extend(response.get('Items', []))
-
-    # Handle pagination (get all disks if user has many)
-    while 'LastEvaluatedKey' in response:
-        response = disks_table.query(
-            KeyConditionExpression="user_id = :user_id",
-            ExpressionAttributeValues={":user_id": user_id},
-            ExclusiveStartKey=response['LastEvaluatedKey']
-        )
-        dynamodb_disks.extend(response.get('Items', []))
-
-    # Process DynamoDB data
-    disks = []
-    for disk_item in dynamodb_disks:
-        disk_name = disk_item['disk_name']
-
-        # Convert DynamoDB types (Decimal to int/float)
-        size_gb = int(disk_item.get('size_gb', 0)) if disk_item.get('size_gb') else 0
-        snapshot_count = int(disk_item.get('snapshot_count', 0)) if disk_item.get('snapshot_count') else 0
-        pending_snapshot_count = int(disk_item.get('pending_snapshot_count', 0)) if disk_item.get('pending_snapshot_count') else 0
-
-        # Parse datetime strings from DynamoDB
-        created_at_str = disk_item.get('created_at')
-        last_used_str = disk_item.get('last_used')
-
-        created_at = datetime.fromisoformat(created_at_str) if created_at_str else None
-        last_used = datetime.fromisoformat(last_used_str) if last_used_str else None
-
-        # Ensure all datetimes are timezone-aware (normalize any timezone-naive datetimes from older records)
-        if created_at and created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-        if last_used and last_used.tzinfo is None:
-            last_used = last_used.replace(tzinfo=timezone.utc)
-
-        # Get disk_size if available
-        disk_size = disk_item.get('disk_size')
-
-        # Get backup and deletion status from DynamoDB
-        is_backing_up = disk_item.get('is_backing_up', False)
-        is_deleted = disk_item.get('is_deleted', False)
-        delete_date = disk_item.get('delete_date')
-
-        disks.append({
-            'name': disk_name,
-            'size_gb': size_gb,
-            'disk_size': disk_size,
-            'created_at': created_at,
-            'last_used': last_used,
-            'snapshot_count': snapshot_count,
-            'pending_snapshot_count': pending_snapshot_count,
-            'in_use': bool(disk_item.get('in_use', False)),
-            'is_backing_up': is_backing_up,
-            'reservation_id': str(disk_item.get('attached_to_reservation', '')) or None,
-            'is_deleted': is_deleted,
-            'delete_date': delete_date,
-        })
-
-    # Batch check: find all active reservations with disk_name set (single query)
+
+def _active_reservation_disks(user_id: str, config: Config) -> Dict[str, str]:
+    """
+    {disk_name: short reservation id} for the user's in-progress reservations.
+    Best effort - returns {} if the reservations table can't be queried.
+
+    One batch for all disks, so listings never need a per-disk
+    get_disk_in_use_status. Matches its legacy rule too: an active/preparing
+    reservation with an EBS volume but no disk_name holds the "default" disk.
+    """
+    active_disks = {}
     try:
-        reservations_table = dynamodb.Table(config.reservations_table)
-        active_disks = {}
-        for status in ["active", "preparing", "queued", "pending"]:
-            resp = reservations_table.query(
+        reservations_table = config.dynamodb.Table(config.reservations_table)
+
+        def query_status(status):
+            return reservations_table.query(
                 IndexName="UserStatusIndex",
                 KeyConditionExpression="user_id = :uid AND #s = :status",
                 ExpressionAttributeNames={"#s": "status"},
                 ExpressionAttributeValues={":uid": user_id, ":status": status},
-                ProjectionExpression="reservation_id, disk_name",
+                ProjectionExpression="reservation_id, disk_name, ebs_volume_id",
             )
+
+        # One round trip per status - run them concurrently
+        statuses = ["active", "preparing", "queued", "pending"]
+        with ThreadPoolExecutor(max_workers=len(statuses)) as executor:
+            responses = list(executor.map(query_status, statuses))
+        legacy_default = None
+        for status, resp in zip(statuses, responses):
             for item in resp.get("Items", []):
                 dn = item.get("disk_name")
                 if dn:
                     active_disks[dn] = str(item.get("reservation_id", ""))[:8]
-
-        for disk in disks:
-            if disk["name"] in active_disks:
-                disk["in_use"] = True
-                disk["reservation_id"] = active_disks[disk["name"]]
+                elif item.get("ebs_volume_id") and status in ("active", "preparing"):
+                    legacy_default = legacy_default or str(item.get("reservation_id", ""))[:8]
+        if legacy_default:
+            active_disks.setdefault("default", legacy_default)
     except Exception:
         pass
+    return active_disks
+
+
+def _is_expired_deletion(disk: Dict, today: str) -> bool:
+    """Soft-deleted disk whose delete_date has passed (hidden from listings)."""
+    return bool(disk.get('is_deleted') and disk.get('delete_date') and str(disk['delete_date']) <= today)
+
+
+def list_disks(user_id: str, config: Config) -> List[Dict]:
+    """
+    List all disks for a user.
+    Returns list of disk info dicts with: name, size, last_used, created_at, snapshot_count, in_use, reservation_id
+    """
+    disks_table = config.dynamodb.Table(config.disks_table)
+
+    def iter_disk_items():
+        # Yield page by page so raw items are converted as they arrive instead
+        # of holding every page alongside the converted list.
+        query_kwargs = {
+            "KeyConditionExpression": "user_id = :user_id",
+            "ExpressionAttributeValues": {":user_id": user_id},
+        }
+        while True:
+            response = disks_table.query(**query_kwargs)
+            yield from response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                return
+            query_kwargs["ExclusiveStartKey"] = response['LastEvaluatedKey']
+
+    # Batch check: find all active reservations with disk_name set. It doesn't
+    # depend on the disk rows, so it runs while the disks table pages in.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        active_future = executor.submit(_active_reservation_disks, user_id, config)
+        # Process DynamoDB data
+        disks = [_disk_record(disk_item) for disk_item in iter_disk_items()]
+        active_disks = active_future.result()
+
+    for disk in disks:
+        if disk["name"] in active_disks:
+            disk["in_use"] = True
+            disk["reservation_id"] = active_disks[disk["name"]]
 
     # Filter out expired deleted disks (delete_date has passed)
     today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-    disks = [
-        d for d in disks
-        if not (d.get('is_deleted') and d.get('delete_date') and str(d['delete_date']) <= today)
-    ]
+    disks = [d for d in disks if not _is_expired_deletion(d, today)]
 
-    # Sort by last_used (most recent first)
-    disks.sort(key=lambda d: d['last_used'] or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+    # Sort by last_used (most recent first); never-used disks go last, in
+    # table order. Only the dated ones need sorting, keyed in C by itemgetter.
+    used = [d for d in disks if d['last_used']]
+    used.sort(key=itemgetter('last_used'), reverse=True)
+    disks = used + [d for d in disks if not d['last_used']]
 
+    _disks_cache[(user_id, config.disks_table)] = (time.monotonic(), {d['name']: d for d in disks})
     return disks
 
 
+def _find_disk(disk_name: str, user_id: str, config: Config, check_in_use: bool = True) -> Optional[Dict]:
+    """
+    One disk's list_disks record, or None if the user has no such disk.
+
+    Served from a listing fetched in the last few seconds when there is one,
+    otherwise a point read of the disks table - plus the reservations check
+    when check_in_use is set. Only for pre-checks: polling loops call
+    list_disks for fresh state, and a point-read record skips the timestamp
+    parsing (created_at/last_used are None).
+    """
+    cached = _disks_cache.get((user_id, config.disks_table))
+    if cached and time.monotonic() - cached[0] < _DISKS_CACHE_TTL:
+        return cached[1].get(disk_name)
+
+    disks_table = config.dynamodb.Table(config.disks_table)
+    key = {'user_id': user_id, 'disk_name': disk_name}
+    if check_in_use:
+        # The disk read and the reservations probe are independent round
+        # trips - overlap them rather than waiting on one then the other.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_item = ex.submit(disks_table.get_item, Key=key)
+            f_active = ex.submit(_active_reservation_disks, user_id, config)
+            item = f_item.result().get('Item')
+            active_disks = f_active.result()
+    else:
+        item = disks_table.get_item(Key=key).get('Item')
+        active_disks = {}
+
+    if not item:
+        return None
+    disk = _disk_record(item, parse_dates=False)
+    if _is_expired_deletion(disk, datetime.now(timezone.utc).strftime('%Y-%m-%d')):
+        return None
+
+    if disk_name in active_disks:
+        disk['in_use'] = True
+        disk['reservation_id'] = active_disks[disk_name]
+    return disk
+
+
+def disk_exists(disk_name: str, user_id: str, config: Config) -> bool:
+    """
+    Whether the user already has a disk with this name (expired soft-deletes
+    don't count). Reads only the deletion fields - no record is built.
+    """
+    cached = _disks_cache.get((user_id, config.disks_table))
+    if cached and time.monotonic() - cached[0] < _DISKS_CACHE_TTL:
+        return disk_name in cached[1]
+
+    disks_table = config.dynamodb.Table(config.disks_table)
+    item = disks_table.get_item(
+        Key={'user_id': user_id, 'disk_name': disk_name},
+        ProjectionExpression='is_deleted, delete_date',
+    ).get('Item')
+    if item is None:
+        return False
+    return not _is_expired_deletion(item, datetime.now(timezone.utc).strftime('%Y-%m-%d'))
+
+
+def get_disk(disk_name: str, user_id: str, config: Config) -> Optional[Dict]:
+    """
+    One disk's record, or None - for commands that already name the disk.
+    A single keyed read instead of listing every disk the user has; in_use
+    is not resolved (use get_disk_in_use_status for that).
+    """
+    return _find_disk(disk_name, user_id, config, check_in_use=False)
+
+
+def clear_disk_cache() -> None:
+    """Drop cached disk listings and in-use results (after a create/delete/rename/clone/unlock)."""
+    _disks_cache.clear()
+    _in_use_cache.clear()
+
+
 def create_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
     """
     Create a new disk by sending request to SQS queue.
     Lambda will create the disk entry in DynamoDB.
     Returns operation_id on success, None on failure.
     """
-    import json
-    import uuid
+    # Validate disk name (alphanumeric + hyphens + underscores)
+    if not _DISK_NAME_RE.match(disk_name):
+        print("Error: Disk name must contain only letters, numbers, hyphens, and underscores")
+        return None
 
     # Check if disk already exists
-    existing_disks = list_disks(user_id, config)
-    if any(d['name'] == disk_name for d in existing_disks):
+    if disk_exists(disk_name, user_id, config):
         print(f"Error: Disk '{disk_name}' already exists")
         return None
 
-    # Validate disk name (alphanumeric + hyphens + underscores)
-    if not re.match(r'^[a-zA-Z0-9_-]+$', disk_name):
-        print(f"Error: Disk name must contain only letters, numbers, hyphens, and underscores")
-        return None
-
     # Generate operation ID for tracking
     operation_id = str(uuid.uuid4())
 
     # Send create request to SQS queue
     try:
-        sqs_client = config.session.client('sqs', region_name=config.aws_region)
+        sqs_client = config.sqs_client
         queue_url = config.get_queue_url()
 
         message = {
@@ -298,6 +444,7 @@ def create_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
             MessageBody=json.dumps(message)
         )
 
+        clear_disk_cache()
         return operation_id
 
     except Exception as e:
@@ -305,10 +452,32 @@ def create_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
         return None
 
 
-def list_disk_content(disk_name: str, user_id: str, config: Config) -> Optional[str]:
+def _decode_listing(body) -> Tuple[str, int, int]:
+    """
+    Decode an S3 body chunk by chunk, so the raw bytes are never held whole
+    next to their decoded copy. Returns (text, bytes read, bytes after the
+    last newline).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    parts = []
+    received = tail = 0
+    for chunk in body.iter_chunks(chunk_size=_CONTENT_CHUNK_BYTES):
+        received += len(chunk)
+        newline = chunk.rfind(b'\n')
+        tail = len(chunk) - newline - 1 if newline >= 0 else tail + len(chunk)
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b'', final=True))
+    return ''.join(parts), received, tail
+
+
+def list_disk_content(disk_name: str, user_id: str, config: Config,
+                      max_bytes: Optional[int] = None) -> Optional[str]:
     """
     Fetch and return the contents of the latest snapshot for a disk.
     Returns contents string or None if not found.
+
+    Only the first max_bytes (default 1 MiB) of the listing are downloaded
+    (S3 ranged GET); a longer listing is cut back to the last complete line.
     """
     s3_client = get_s3_client(config)
     dynamodb = get_dynamodb_resource(config)
@@ -331,7 +500,7 @@ def list_disk_content(disk_name: str, user_id: str, config: Config) -> Optional[
 
         if not s3_path:
             print(f"No snapshot contents available for disk '{disk_name}'")
-            print(f"This may be a newly created disk or a disk created before content tracking was added.")
+            print("This may be a newly created disk or a disk created before content tracking was added.")
             return None
 
     except Exception as e:
@@ -350,10 +519,65 @@ def list_disk_content(disk_name: str, user_id: str, config: Config) -> Optional[
 
     bucket_name, s3_key = path_parts
 
+    # A full listing is cached locally and revalidated with its ETag, so an
+    # unchanged snapshot costs a bodiless 304 instead of a re-download.
+    body_cache, etag_cache = _content_cache_paths(s3_path)
+    cached_etag = None
+    if not max_bytes:
+        try:
+            cached_etag = etag_cache.read_text()
+        except OSError:
+            pass
+
     try:
         # Fetch contents from S3
-        response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-        contents = response['Body'].read().decode('utf-8')
+        limit = max_bytes or _CONTENT_MAX_BYTES
+        get_kwargs = {'Bucket': bucket_name, 'Key': s3_key, 'Range': f"bytes=0-{limit - 1}"}
+        if cached_etag:
+            get_kwargs['IfNoneMatch'] = cached_etag
+        try:
+            response = s3_client.get_object(**get_kwargs)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+                # An empty object has no byte 0 to range over. Retry plainly -
+                # without IfNoneMatch too, so a 304 can't escape this handler
+                # (re-downloading an empty object costs nothing)
+                del get_kwargs['Range']
+                get_kwargs.pop('IfNoneMatch', None)
+                response = s3_client.get_object(**get_kwargs)
+            elif not cached_etag or e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') != 304:
+                raise
+            else:
+                try:
+                    return body_cache.read_text(encoding='utf-8')
+                except OSError:
+                    # etag survived but the body didn't - fetch unconditionally
+                    del get_kwargs['IfNoneMatch']
+                    response = s3_client.get_object(**get_kwargs)
+        contents, received, tail = _decode_listing(response['Body'])
+
+        # ContentRange is "bytes 0-N/TOTAL" on a partial response
+        truncated = False
+        content_range = response.get('ContentRange')
+        if content_range:
+            total = int(content_range.rsplit('/', 1)[1])
+            if total > received:
+                truncated = True
+                if tail < received:
+                    # drop the partial last line (no newline at all: keep it)
+                    contents = contents[:contents.rfind('\n') + 1]
+                    received -= tail
+                print(f"Showing first {received:,} of {total:,} bytes")
+
+        # Only a complete listing is worth revalidating later
+        if not max_bytes and not truncated and response.get('ETag'):
+            try:
+                # A listing of the user's files - owner-only, like the cred cache
+                _CONTENT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                _write_private(body_cache, contents.encode('utf-8'))
+                _write_private(etag_cache, response['ETag'].encode())
+            except OSError:
+                pass
         return contents
     except s3_client.exceptions.NoSuchKey:
         print(f"Contents file not found in S3: {s3_path}")
@@ -368,11 +592,7 @@ def unlock_disk(disk_name: str, user_id: str, config: Config) -> bool:
     Unlock a stale in_use lock on a disk by sending request to SQS queue.
     Lambda will verify no active reservation exists before unlocking.
     """
-    import json
-    import uuid
-
-    disks = list_disks(user_id, config)
-    disk = next((d for d in disks if d['name'] == disk_name), None)
+    disk = _find_disk(disk_name, user_id, config)
 
     if not disk:
         print(f"Error: Disk '{disk_name}' not found")
@@ -381,7 +601,7 @@ def unlock_disk(disk_name: str, user_id: str, config: Config) -> bool:
     if not disk['in_use']:
         # DDB says not locked — but check if EBS volume is still physically attached
         try:
-            ec2 = config.session.client('ec2', region_name=config.aws_region)
+            ec2 = get_ec2_client(config)
             vols = ec2.describe_volumes(Filters=[
                 {"Name": "tag:gpu-dev-user", "Values": [user_id]},
                 {"Name": "tag:disk_name", "Values": [disk_name]},
@@ -397,7 +617,7 @@ def unlock_disk(disk_name: str, user_id: str, config: Config) -> bool:
 
     operation_id = str(uuid.uuid4())
 
-    sqs_client = config.session.client('sqs', region_name=config.aws_region)
+    sqs_client = config.sqs_client
     queue_url = config.get_queue_url()
 
     message = {
@@ -414,6 +634,7 @@ def unlock_disk(disk_name: str, user_id: str, config: Config) -> bool:
         MessageBody=json.dumps(message)
     )
 
+    clear_disk_cache()
     return True
 
 
@@ -423,20 +644,16 @@ def delete_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
     Lambda will handle marking in DynamoDB and tagging snapshots.
     Returns operation_id on success, None on failure.
     """
-    import json
-    import uuid
-
     # Check if disk exists
-    disks = list_disks(user_id, config)
-    disk = next((d for d in disks if d['name'] == disk_name), None)
+    disk = _find_disk(disk_name, user_id, config)
 
     if not disk:
-        print(f"Error: Disk '{disk_name}' not found")
+        print(f"Error: {delete_refusal_message(disk_name, 'not_found')}")
         return None
 
     # Check if disk is in use
     if disk['in_use']:
-        print(f"Error: Cannot delete disk '{disk_name}' - it is currently in use")
+        print(f"Error: {delete_refusal_message(disk_name, 'in_use')}")
         print(f"Reservation ID: {disk['reservation_id']}")
         return None
 
@@ -449,7 +666,7 @@ def delete_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
 
     # Send delete request to SQS queue
     try:
-        sqs_client = config.session.client('sqs', region_name=config.aws_region)
+        sqs_client = config.sqs_client
         queue_url = config.get_queue_url()
 
         message = {
@@ -467,6 +684,7 @@ def delete_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
             MessageBody=json.dumps(message)
         )
 
+        clear_disk_cache()
         return operation_id
 
     except Exception as e:
@@ -474,61 +692,153 @@ def delete_disk(disk_name: str, user_id: str, config: Config) -> Optional[str]:
         return None
 
 
+def delete_refusal_message(disk_name: str, error: Optional[str]) -> str:
+    """
+    User-facing text for a refused delete. The CLI pre-check and the lambda
+    (which writes 'not_found' / 'in_use' to the operations table when the
+    pre-check raced a reservation) report through the same messages.
+    """
+    if error == 'not_found':
+        return f"Disk '{disk_name}' not found"
+    if error == 'in_use':
+        return f"Cannot delete disk '{disk_name}' - it is currently in use"
+    return f"Could not delete disk '{disk_name}': {error or 'unknown error'}"
+
+
+def _is_retryable(error: ClientError) -> bool:
+    """Throttling and server-side (5xx) errors are worth another poll."""
+    code = error.response.get('Error', {}).get('Code', '')
+    status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+    return code in _RETRYABLE_ERROR_CODES or status >= 500
+
+
+def _disk_operation_result(operation_type: str, disk_name: str, disk: Optional[Dict]) -> Optional[str]:
+    """Success message once the operation shows in the disk's record, else None."""
+    if operation_type == 'create':
+        # For create, we're waiting for the disk to appear
+        if disk is not None:
+            return f"Disk '{disk_name}' created successfully"
+
+    elif operation_type == 'delete':
+        # For delete, we're waiting for is_deleted to be True
+        if disk is None:
+            # Disk no longer in list (shouldn't happen with soft delete)
+            return f"Disk '{disk_name}' deleted successfully"
+        elif disk.get('is_deleted', False):
+            delete_date = disk.get('delete_date', 'in 30 days')
+            return f"Disk '{disk_name}' marked for deletion. Snapshots will be permanently deleted on {delete_date}"
+
+    return None
+
+
+def poll_disk_operations(
+    operations: List[Tuple[str, str]],
+    user_id: str,
+    config: Config,
+    timeout_seconds: int = 60,
+    initial_delay: float = 0.25,
+    backoff_multiplier: float = 1.6,
+    max_delay: float = 5.0,
+) -> Iterator[Tuple[str, bool, str]]:
+    """
+    Poll DynamoDB for several disk operations at once.
+
+    Each round is a single list_disks read that answers every pending
+    operation, so N operations cost the same reads as one. The first round is
+    immediate; later ones back off exponentially (with ~10% jitter) from
+    initial_delay up to max_delay.
+
+    Args:
+        operations: (operation_type, disk_name) pairs; type is 'create' or 'delete'
+        user_id: User ID
+        config: Config object
+        timeout_seconds: Max time to wait
+        initial_delay: Seconds to wait after the first poll
+        backoff_multiplier: Factor applied to the delay after each poll
+        max_delay: Upper bound for the delay between polls
+
+    Yields:
+        (disk_name, success, message) as each operation completes, then one
+        (disk_name, False, timeout message) for each still pending at timeout
+    """
+    pending = list(operations)
+    start_time = time.monotonic()
+    delay = initial_delay
+
+    # Check first, sleep after: an operation that is already done returns
+    # without any wait, and the last sleep never runs past the timeout.
+    while pending:
+        try:
+            disks_by_name = {d['name']: d for d in list_disks(user_id, config)}
+            still_pending = []
+            for operation_type, disk_name in pending:
+                message = _disk_operation_result(operation_type, disk_name, disks_by_name.get(disk_name))
+                if message:
+                    yield disk_name, True, message
+                else:
+                    still_pending.append((operation_type, disk_name))
+            pending = still_pending
+            if not pending:
+                return
+
+        except (BotoConnectionError, HTTPClientError):
+            # Network blip - the next round may well succeed
+            pass
+        except ClientError as e:
+            if not _is_retryable(e):
+                # Access denied, expired credentials, missing table: polling
+                # until the timeout can't fix these, so report them now
+                for operation_type, disk_name in pending:
+                    yield disk_name, False, f"Could not check disk '{disk_name}': {e}"
+                return
+
+        remaining = timeout_seconds - (time.monotonic() - start_time)
+        if remaining <= 0:
+            break
+        time.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+        delay = min(delay * backoff_multiplier, max_delay)
+
+    # Timeout
+    for operation_type, disk_name in pending:
+        if operation_type == 'create':
+            yield disk_name, False, f"Timed out waiting for disk '{disk_name}' to be created. It may still be processing."
+        else:
+            yield disk_name, False, f"Timed out waiting for disk '{disk_name}' deletion to complete. It may still be processing."
+
+
 def poll_disk_operation(
     operation_type: str,
     disk_name: str,
     user_id: str,
     config: Config,
-    timeout_seconds: int = 60
+    timeout_seconds: int = 60,
+    initial_delay: float = 0.25,
+    backoff_multiplier: float = 1.6,
+    max_delay: float = 5.0,
 ) -> Tuple[bool, str]:
     """
     Poll DynamoDB for disk operation completion.
 
+    Single-operation form of poll_disk_operations (same backoff and timeout).
+
     Args:
         operation_type: 'create' or 'delete'
         disk_name: Name of the disk
         user_id: User ID
         config: Config object
         timeout_seconds: Max time to wait
+        initial_delay: Seconds to wait after the first poll
+        backoff_multiplier: Factor applied to the delay after each poll
+        max_delay: Upper bound for the delay between polls
 
     Returns:
         Tuple of (success, message)
     """
-    import time
-
-    start_time = time.time()
-    poll_interval = 2  # seconds
-
-    while time.time() - start_time < timeout_seconds:
-        try:
-            disks = list_disks(user_id, config)
-            disk = next((d for d in disks if d['name'] == disk_name), None)
-
-            if operation_type == 'create':
-                # For create, we're waiting for the disk to appear
-                if disk is not None:
-                    return True, f"Disk '{disk_name}' created successfully"
-
-            elif operation_type == 'delete':
-                # For delete, we're waiting for is_deleted to be True
-                if disk is None:
-                    # Disk no longer in list (shouldn't happen with soft delete)
-                    return True, f"Disk '{disk_name}' deleted successfully"
-                elif disk.get('is_deleted', False):
-                    delete_date = disk.get('delete_date', 'in 30 days')
-                    return True, f"Disk '{disk_name}' marked for deletion. Snapshots will be permanently deleted on {delete_date}"
-
-            time.sleep(poll_interval)
-
-        except Exception as e:
-            # Continue polling on errors
-            time.sleep(poll_interval)
-
-    # Timeout
-    if operation_type == 'create':
-        return False, f"Timed out waiting for disk '{disk_name}' to be created. It may still be processing."
-    else:
-        return False, f"Timed out waiting for disk '{disk_name}' deletion to complete. It may still be processing."
+    _, success, message = next(poll_disk_operations(
+        [(operation_type, disk_name)], user_id, config, timeout_seconds,
+        initial_delay, backoff_multiplier, max_delay,
+    ))
+    return success, message
 
 
 def clone_disk(source_disk: str, target_disk: str, user_id: str, config: Config) -> Optional[str]:
@@ -537,12 +847,8 @@ def clone_disk(source_disk: str, target_disk: str, user_id: str, config: Config)
     Lambda copies the latest snapshot and creates a new disk entry.
     Returns operation_id on success, None on failure.
     """
-    import json
-    import uuid
-
     # Check source disk exists
-    existing_disks = list_disks(user_id, config)
-    source = next((d for d in existing_disks if d['name'] == source_disk), None)
+    source = _find_disk(source_disk, user_id, config, check_in_use=False)
     if not source:
         print(f"Error: Source disk '{source_disk}' not found")
         return None
@@ -553,23 +859,23 @@ def clone_disk(source_disk: str, target_disk: str, user_id: str, config: Config)
 
     if source.get('snapshot_count', 0) == 0:
         print(f"Error: Source disk '{source_disk}' has no snapshots to clone from")
-        print(f"Use the disk in a reservation first, then cancel/expire to create a snapshot.")
+        print("Use the disk in a reservation first, then cancel/expire to create a snapshot.")
         return None
 
     # Check target doesn't exist
-    if any(d['name'] == target_disk for d in existing_disks):
+    if disk_exists(target_disk, user_id, config):
         print(f"Error: Disk '{target_disk}' already exists")
         return None
 
     # Validate target name
-    if not re.match(r'^[a-zA-Z0-9_-]+$', target_disk):
-        print(f"Error: Disk name must contain only letters, numbers, hyphens, and underscores")
+    if not _DISK_NAME_RE.match(target_disk):
+        print("Error: Disk name must contain only letters, numbers, hyphens, and underscores")
         return None
 
     operation_id = str(uuid.uuid4())
 
     try:
-        sqs_client = config.session.client('sqs', region_name=config.aws_region)
+        sqs_client = config.sqs_client
         queue_url = config.get_queue_url()
 
         message = {
@@ -587,6 +893,7 @@ def clone_disk(source_disk: str, target_disk: str, user_id: str, config: Config)
             MessageBody=json.dumps(message)
         )
 
+        clear_disk_cache()
         return operation_id
 
     except Exception as e:
@@ -594,23 +901,30 @@ def clone_disk(source_disk: str, target_disk: str, user_id: str, config: Config)
         return None
 
 
-def poll_operation(operation_id: str, config: Config, timeout_seconds: int = 60) -> Tuple[Optional[str], Optional[str]]:
+def get_operation_result(operation_id: str, config: Config) -> Tuple[Optional[str], Optional[str]]:
     """
-    Poll the operations table for a result.
-    Returns (status, error) - status is 'completed', 'failed', or None if timeout.
+    One read of the operations table: (status, error), or (None, None) while
+    the lambda hasn't written a result yet. Raises on DynamoDB errors.
     """
-    import time
-
     dynamodb = get_dynamodb_resource(config)
     ops_table = dynamodb.Table(config.operations_table)
+    item = ops_table.get_item(Key={'operation_id': operation_id}).get('Item')
+    if not item:
+        return None, None
+    return item.get('status'), item.get('error')
 
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
+
+def poll_operation(operation_id: str, config: Config, timeout_seconds: int = 60) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Poll the operations table for a result.
+    Returns (status, error) - status is 'completed', 'failed', or None if timeout.
+    """
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < timeout_seconds:
         try:
-            response = ops_table.get_item(Key={'operation_id': operation_id})
-            item = response.get('Item')
-            if item:
-                return item.get('status'), item.get('error')
+            status, error = get_operation_result(operation_id, config)
+            if status:
+                return status, error
         except Exception as e:
             print(f"Error polling operation: {e}")
             return "failed", str(e)
@@ -627,20 +941,19 @@ def rename_disk(old_name: str, new_name: str, user_id: str, config: Config) -> b
     ec2_client = get_ec2_client(config)
 
     # Validate new disk name
-    if not re.match(r'^[a-zA-Z0-9_-]+$', new_name):
-        print(f"Error: Disk name must contain only letters, numbers, hyphens, and underscores")
+    if not _DISK_NAME_RE.match(new_name):
+        print("Error: Disk name must contain only letters, numbers, hyphens, and underscores")
         return False
 
     # Check if old disk exists
-    disks = list_disks(user_id, config)
-    old_disk = next((d for d in disks if d['name'] == old_name), None)
+    old_disk = _find_disk(old_name, user_id, config)
 
     if not old_disk:
         print(f"Error: Disk '{old_name}' not found")
         return False
 
     # Check if new name already exists
-    if any(d['name'] == new_name for d in disks):
+    if disk_exists(new_name, user_id, config):
         print(f"Error: Disk '{new_name}' already exists")
         return False
 
@@ -653,35 +966,55 @@ def rename_disk(old_name: str, new_name: str, user_id: str, config: Config) -> b
     print(f"Renaming disk '{old_name}' to '{new_name}'...")
 
     try:
-        # Find all snapshots for this disk
-        response = ec2_client.describe_snapshots(
-            OwnerIds=["self"],
-            Filters=[
+        # Find all snapshots for this disk, page by page (only the ids are kept)
+        describe_kwargs = {
+            'OwnerIds': ["self"],
+            'Filters': [
                 {"Name": "tag:gpu-dev-user", "Values": [user_id]},
                 {"Name": "tag:disk_name", "Values": [old_name]},
-            ]
-        )
-
-        snapshots = response.get('Snapshots', [])
-
-        if not snapshots:
+            ],
+            'MaxResults': 1000,
+        }
+        snapshot_ids = []
+        while True:
+            response = ec2_client.describe_snapshots(**describe_kwargs)
+            snapshot_ids.extend(snapshot['SnapshotId'] for snapshot in response.get('Snapshots', []))
+            if not response.get('NextToken'):
+                break
+            describe_kwargs['NextToken'] = response['NextToken']
+
+        if not snapshot_ids:
             print(f"Warning: No snapshots found for disk '{old_name}'")
             return False
 
-        # Update disk_name tag on each snapshot
+        # Update disk_name tag on the snapshots - one create_tags call per
+        # batch, falling back to one call per snapshot if a batch is rejected
+        # (a single bad id fails the whole request)
+        tags = [{"Key": "disk_name", "Value": new_name}]
         renamed_count = 0
-        for snapshot in snapshots:
-            snapshot_id = snapshot['SnapshotId']
-            try:
-                ec2_client.create_tags(
-                    Resources=[snapshot_id],
-                    Tags=[{"Key": "disk_name", "Value": new_name}]
-                )
-                print(f"  ✓ Updated snapshot {snapshot_id}")
-                renamed_count += 1
-            except Exception as e:
-                print(f"  ✗ Error updating snapshot {snapshot_id}: {e}")
+        for start in range(0, len(snapshot_ids), _CREATE_TAGS_MAX_RESOURCES):
+            batch = snapshot_ids[start:start + _CREATE_TAGS_MAX_RESOURCES]
+            if len(batch) > 1:
+                try:
+                    ec2_client.create_tags(Resources=batch, Tags=tags)
+                    print(f"  ✓ Updated {len(batch)} snapshots")
+                    renamed_count += len(batch)
+                    continue
+                except Exception:
+                    pass
+            for snapshot_id in batch:
+                try:
+                    ec2_client.create_tags(Resources=[snapshot_id], Tags=tags)
+                    print(f"  ✓ Updated snapshot {snapshot_id}")
+                    renamed_count += 1
+                except Exception as e:
+                    print(f"  ✗ Error updating snapshot {snapshot_id}: {e}")
+
+        if renamed_count == 0:
+            print(f"Error: Could not retag any snapshots of disk '{old_name}'")
+            return False
 
+        clear_disk_cache()
         print(f"✓ Successfully renamed disk to '{new_name}' ({renamed_count} snapshots updated)")
         return True
 
@@ -15,6 +15,9 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from .disks import create_disk, list_disks
+from .reservations import parse_iso_utc
+
 console = Console()
 
 # Custom style for questionary - softer colors
@@ -567,18 +570,7 @@ def select_reservation_interactive(
 
                 try:
                     if isinstance(expires_at, str):
-                        if expires_at.endswith("Z"):
-                            expires_dt_utc = datetime.fromisoformat(
-                                expires_at.replace("Z", "+00:00")
-                            )
-                        elif "+" in expires_at or expires_at.endswith("00:00"):
-                            expires_dt_utc = datetime.fromisoformat(expires_at)
-                        else:
-                            from datetime import timezone
-
-                            naive_dt = datetime.fromisoformat(expires_at)
-                            expires_dt_utc = naive_dt.replace(
-                                tzinfo=timezone.utc)
+                        expires_dt_utc = parse_iso_utc(expires_at)
 
                         expires_dt = expires_dt_utc.astimezone()
                         expires_formatted = expires_dt.strftime("%m-%d %H:%M")
@@ -603,18 +595,7 @@ def select_reservation_interactive(
                     from datetime import datetime
 
                     if isinstance(created_at, str):
-                        if created_at.endswith("Z"):
-                            created_dt_utc = datetime.fromisoformat(
-                                created_at.replace("Z", "+00:00")
-                            )
-                        elif "+" in created_at or created_at.endswith("00:00"):
-                            created_dt_utc = datetime.fromisoformat(created_at)
-                        else:
-                            from datetime import timezone
-
-                            naive_dt = datetime.fromisoformat(created_at)
-                            created_dt_utc = naive_dt.replace(
-                                tzinfo=timezone.utc)
+                        created_dt_utc = parse_iso_utc(created_at)
 
                         created_dt = created_dt_utc.astimezone()
                         created_formatted = created_dt.strftime("%m-%d %H:%M")
@@ -832,8 +813,6 @@ def select_disk_interactive(user_id: str, config: Any) -> Optional[str]:
     if not check_interactive_support():
         return "__cancelled__"
 
-    from .disks import list_disks
-
     while True:  # Loop to support "Refresh list"
         try:
             # Get user's disks
@@ -928,7 +907,6 @@ def select_disk_interactive(user_id: str, config: Any) -> Optional[str]:
                     return "__cancelled__"
 
                 # Validate the disk name (actual disk created by Lambda on first use)
-                from .disks import create_disk
                 success = create_disk(disk_name, user_id, config)
                 if success:
                     console.print(f"[cyan]✓ Will create disk '{disk_name}' with this reservation[/cyan]")
@@ -7,22 +7,52 @@ import signal
 import sys
 import time
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, Union
 
 import requests
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
-from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.live import Live
 from rich.spinner import Spinner
+from urllib3.util.retry import Retry
 
-from .config import Config
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+from .config import CONFIG_DIR, Config, json_dumps, json_loads
 from .name_generator import sanitize_name
 
 
+# fromisoformat() accepts a trailing "Z" from 3.11 on; older versions need it rewritten
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_utc(value: str) -> datetime:
+    """Parse a stored ISO-8601 timestamp into an aware datetime.
+
+    Accepts a trailing ``Z``, an explicit offset, or a naive value (which the
+    lambdas write as UTC). Cached because list/watch views re-render the same
+    created_at/expires_at strings on every refresh. Uses ciso8601 when the
+    ``fast`` extra is installed.
+    """
+    if ciso8601 is not None:
+        dt = ciso8601.parse_datetime(value)
+    else:
+        if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
 def _spot_stage_number(status: str) -> tuple:
     """Map a spot provisioning status message to a numbered step (N, total)."""
     s = status.lower()
@@ -435,6 +465,29 @@ class ReservationManager:
         self.config = config
         self.reservations_table = config.dynamodb.Table(
             config.reservations_table)
+        self._http_session = None
+
+    @property
+    def http(self) -> requests.Session:
+        """Pooled keep-alive session for Function URL calls, so a claim followed by
+        a logs fetch (or repeated polls) reuses one TCP+TLS connection. Retries only
+        cover connection failures — the request never reached the lambda, so a
+        POST is safe to resend."""
+        if self._http_session is None:
+            session = requests.Session()
+            retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3,
+                          allowed_methods=None)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._http_session = session
+        return self._http_session
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
 
     def _retry_on_expired(self, fn):
         """Call fn, auto-refresh credentials on ExpiredTokenException."""
@@ -586,7 +639,7 @@ class ReservationManager:
         if getattr(self, "_direct_url", None) is not None:
             return self._direct_url or None
         region = self.config.aws_region
-        cache_path = os.path.expanduser("~/.config/gpu-dev/direct-url.json")
+        cache_path = CONFIG_DIR / "direct-url.json"
         cache = {}
         try:
             with open(cache_path) as f:
@@ -605,7 +658,7 @@ class ReservationManager:
             self._direct_url = ""
         if self._direct_url:
             try:
-                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
                 cache[region] = self._direct_url
                 with open(cache_path, "w") as f:
                     json.dump(cache, f)
@@ -619,14 +672,14 @@ class ReservationManager:
             creds = self.config.session.get_credentials()
             if creds is None:
                 return None
-            data = json.dumps(payload)
+            data = json_dumps(payload)
             aws_req = AWSRequest(method="POST", url=url, data=data,
                                  headers={"Content-Type": "application/json"})
             SigV4Auth(creds, "lambda", self.config.aws_region).add_auth(aws_req)
-            resp = requests.post(url, data=data, headers=dict(aws_req.headers), timeout=timeout)
+            resp = self.http.post(url, data=data, headers=dict(aws_req.headers), timeout=timeout)
             if resp.status_code != 200:
                 return None
-            return resp.json()
+            return json_loads(resp.content)
         except Exception:
             return None
 
@@ -816,8 +869,6 @@ class ReservationManager:
         falling back to StatusIndex + FilterExpression if the GSI doesn't exist.
         Queries run in parallel per status for speed.
         """
-        from concurrent.futures import ThreadPoolExecutor
-
         try:
             all_reservations = []
             query_statuses = statuses_to_include or [
@@ -1230,7 +1281,6 @@ class ReservationManager:
                 all_items.extend(response.get("Items", []))
 
             # Fetch queue lengths for all GPU types in parallel
-            from concurrent.futures import ThreadPoolExecutor
             gpu_types_list = [item["gpu_type"] for item in all_items]
             with ThreadPoolExecutor(max_workers=10) as ex:
                 queue_futures = {gt: ex.submit(self._get_queue_length_for_gpu_type, gt) for gt in gpu_types_list}
@@ -1686,11 +1736,8 @@ class ReservationManager:
                             and current_expiration
                         ):
                             live.stop()
-                            from datetime import datetime, timezone
-
                             try:
-                                naive_dt = datetime.fromisoformat(current_expiration)
-                                exp_dt_utc = naive_dt.replace(tzinfo=timezone.utc)
+                                exp_dt_utc = parse_iso_utc(current_expiration)
                                 local_exp = exp_dt_utc.astimezone()
                                 formatted_expiration = local_exp.strftime("%m-%d %H:%M")
                                 console.print(
@@ -1726,25 +1773,44 @@ class ReservationManager:
                 f"[red]❌ Error polling extension result: {str(e)}[/red]")
             return False
 
+    def _scan_all_reservations(self) -> List[Dict[str, Any]]:
+        """Full paginated scan of the reservations table."""
+        response = self.reservations_table.scan()
+        reservations = response.get("Items", [])
+        while "LastEvaluatedKey" in response:
+            response = self.reservations_table.scan(
+                ExclusiveStartKey=response["LastEvaluatedKey"]
+            )
+            reservations.extend(response.get("Items", []))
+        return reservations
+
+    def _get_queue_depth(self) -> Optional[int]:
+        """Approximate SQS queue depth, or None if the queue is unreachable."""
+        try:
+            queue_url = self.config.get_queue_url()
+            queue_attrs = self.config.sqs_client.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=[
+                    "ApproximateNumberOfMessages"]
+            )
+            return int(queue_attrs["Attributes"]["ApproximateNumberOfMessages"])
+        except Exception:
+            return None
+
     def get_cluster_status(self) -> Optional[Dict[str, Any]]:
         """Get overall GPU cluster status from availability table"""
         try:
-            # Get reservations with pagination
-            reservations_response = self.reservations_table.scan()
-            reservations = reservations_response.get("Items", [])
-
-            # Handle pagination for admin stats scan
-            while "LastEvaluatedKey" in reservations_response:
-                reservations_response = self.reservations_table.scan(
-                    ExclusiveStartKey=reservations_response["LastEvaluatedKey"]
-                )
-                reservations.extend(reservations_response.get("Items", []))
+            # Reservations scan, availability scan and queue depth are independent
+            # round trips — run them concurrently instead of back to back.
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                f_reservations = ex.submit(self._scan_all_reservations)
+                f_availability = ex.submit(self.get_gpu_availability_by_type)
+                f_queue = ex.submit(self._get_queue_depth)
+                reservations = f_reservations.result()
+                availability_info = f_availability.result()
+                queue_length = f_queue.result()
 
-            # Get total GPUs from availability table
-            availability_info = self.get_gpu_availability_by_type()
             total_gpus = 0
             available_gpus = 0
-
             if availability_info:
                 for gpu_type, info in availability_info.items():
                     total_gpus += info.get("total", 0)
@@ -1757,17 +1823,7 @@ class ReservationManager:
             reserved_gpus = sum(int(r.get("gpu_count", 0))
                                 for r in active_reservations)
 
-            # Get queue length
-            try:
-                queue_url = self.config.get_queue_url()
-                queue_attrs = self.config.sqs_client.get_queue_attributes(
-                    QueueUrl=queue_url, AttributeNames=[
-                        "ApproximateNumberOfMessages"]
-                )
-                queue_length = int(
-                    queue_attrs["Attributes"]["ApproximateNumberOfMessages"]
-                )
-            except:
+            if queue_length is None:
                 queue_length = len(
                     [r for r in reservations if r.get("status") == "pending"]
                 )
@@ -11,6 +11,11 @@ import random
 import websockets
 import ssl as ssl_module
 
+try:
+    import uvloop
+except ImportError:  # optional: pip install gpu-dev[fast]
+    uvloop = None
+
 MAX_RETRIES = 3
 BACKOFF_BASE = 1.0
 BACKOFF_MAX = 5.0
@@ -18,6 +23,9 @@ BACKOFF_MAX = 5.0
 # Status codes that indicate non-transient errors (don't retry)
 NON_RETRYABLE_STATUS_CODES = {400, 401, 403, 404, 4000, 4004}
 
+# Matches SSH's maximum packet size, so one read usually carries a whole packet
+READ_CHUNK_SIZE = 65536
+
 
 def _is_retryable(exc: Exception) -> bool:
     """Return True if the error is transient and worth retrying."""
@@ -73,6 +81,8 @@ async def tunnel_ssh(target_host: str, target_port: int):
             async with websockets.connect(
                 ws_url, ssl=ssl_ctx, open_timeout=20,
                 ping_interval=30, ping_timeout=10,
+                # SSH traffic is already encrypted, so deflate only burns CPU
+                compression=None, max_size=2 ** 24,
             ) as websocket:
                 # Set up stdin/stdout for SSH
                 loop = asyncio.get_event_loop()
@@ -91,7 +101,7 @@ async def tunnel_ssh(target_host: str, target_port: int):
                     """Forward stdin to WebSocket"""
                     try:
                         while True:
-                            data = await reader.read(8192)
+                            data = await reader.read(READ_CHUNK_SIZE)
                             if not data:
                                 break
                             await websocket.send(data)
@@ -145,9 +155,10 @@ def main():
     target_host = sys.argv[1]
     target_port = int(sys.argv[2])
 
-    # Run the async tunnel
+    # Run the async tunnel (on libuv's loop when uvloop is installed)
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(tunnel_ssh(target_host, target_port))
+        run(tunnel_ssh(target_host, target_port))
     except KeyboardInterrupt:
         pass
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 import urllib.request
 import uuid
@@ -47,16 +48,15 @@ def _get_session() -> boto3.Session:
 
     # Try disk-cached credentials
     try:
-        if _CRED_CACHE_PATH.exists():
-            cached = json.loads(_CRED_CACHE_PATH.read_text())
-            if time.time() < cached.get("expires", 0):
-                _cached_session = boto3.Session(
-                    aws_access_key_id=cached["access_key"],
-                    aws_secret_access_key=cached["secret_key"],
-                    aws_session_token=cached["token"],
-                )
-                _cached_session_expires = cached["expires"]
-                return _cached_session
+        cached = json.loads(_CRED_CACHE_PATH.read_text())
+        if time.time() < cached.get("expires", 0):
+            _cached_session = boto3.Session(
+                aws_access_key_id=cached["access_key"],
+                aws_secret_access_key=cached["secret_key"],
+                aws_session_token=cached["token"],
+            )
+            _cached_session_expires = cached["expires"]
+            return _cached_session
     except Exception:
         pass
 
@@ -75,13 +75,19 @@ def _get_session() -> boto3.Session:
         frozen = creds.get_frozen_credentials()
         if frozen.token:
             _CRED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-            _CRED_CACHE_PATH.write_text(json.dumps({
-                "access_key": frozen.access_key,
-                "secret_key": frozen.secret_key,
-                "token": frozen.token,
-                "expires": time.time() + _CRED_CACHE_TTL,
-            }))
-            _CRED_CACHE_PATH.chmod(0o600)
+            # Create owner-only up front: write-then-chmod leaves the STS secret
+            # readable under the default umask for a moment. The os.open mode only
+            # applies on create, so also tighten a pre-existing file before writing.
+            fd = os.open(_CRED_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, "fchmod"):  # not on Windows before 3.13
+                os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps({
+                    "access_key": frozen.access_key,
+                    "secret_key": frozen.secret_key,
+                    "token": frozen.token,
+                    "expires": time.time() + _CRED_CACHE_TTL,
+                }))
     except Exception:
         pass
 
@@ -33,11 +33,10 @@ class GpuDevConfig(BaseModel):
         """Load config from a JSON file, falling back to defaults."""
         p = path or _DEFAULT_CONFIG_PATH
         data: dict = {}
-        if p.exists():
-            try:
-                data = json.loads(p.read_text())
-            except (json.JSONDecodeError, OSError):
-                pass
+        try:
+            data = json.loads(p.read_text())
+        except (json.JSONDecodeError, OSError):
+            pass
         return cls(
             github_user=data.get("github_user"),
             environment=data.get("environment", "prod"),
@@ -22,6 +22,7 @@ from shared.snapshot_utils import (
     safe_create_snapshot,
     cleanup_all_user_snapshots,
     capture_disk_contents,
+    find_tag,
     update_disk_snapshot_completed
 )
 from shared.dns_utils import (
@@ -163,10 +164,9 @@ def sync_disk_deleted_snapshots() -> int:
                 # Tag each snapshot that doesn't already have delete-date tag
                 for snapshot in snapshots:
                     snapshot_id = snapshot['SnapshotId']
-                    tags = {tag['Key']: tag['Value'] for tag in snapshot.get('Tags', [])}
 
                     # Skip if already tagged
-                    if 'delete-date' in tags:
+                    if find_tag(snapshot.get('Tags', ()), 'delete-date') is not None:
                         logger.debug(f"Snapshot {snapshot_id} already has delete-date tag, skipping")
                         continue
 
@@ -299,8 +299,7 @@ def cleanup_soft_deleted_snapshots() -> int:
 
         for snapshot in snapshots:
             snapshot_id = snapshot['SnapshotId']
-            tags = {tag['Key']: tag['Value'] for tag in snapshot.get('Tags', [])}
-            delete_date = tags.get('delete-date', '')
+            delete_date = find_tag(snapshot.get('Tags', ()), 'delete-date', '')
 
             # Compare dates (YYYY-MM-DD format)
             if delete_date and delete_date <= today:
@@ -23,7 +23,7 @@ import boto3
 import botocore.exceptions
 
 from shared import K8sGPUTracker, setup_kubernetes_client
-from shared.snapshot_utils import create_pod_shutdown_snapshot, get_latest_snapshot, safe_create_snapshot, capture_disk_contents
+from shared.snapshot_utils import create_pod_shutdown_snapshot, find_tag, get_latest_snapshot, safe_create_snapshot, capture_disk_contents
 from buildkit_job import create_buildkit_job, wait_for_buildkit_job
 from shared.dns_utils import (
     generate_unique_name,
@@ -7291,20 +7291,29 @@ def create_disk_from_snapshot_or_empty(user_id: str, availability_zone: str, dis
             return vol_id, True, None
 
         # Step 2: Find latest snapshot for this disk
-        # First check for pending snapshots (from recent reservation expiry)
-        pending_filters = [
+        # One listing covers both pending snapshots (from recent reservation
+        # expiry) and completed ones - split by state below
+        snapshot_filters = [
             {"Name": "tag:gpu-dev-user", "Values": [user_id]},
-            {"Name": "status", "Values": ["pending"]},
+            {"Name": "status", "Values": ["completed", "pending"]},
         ]
         if disk_name:
-            pending_filters.append({"Name": "tag:disk_name", "Values": [disk_name]})
+            snapshot_filters.append({"Name": "tag:disk_name", "Values": [disk_name]})
 
-        pending_response = ec2_client.describe_snapshots(
+        # Use pagination to handle users with many snapshots
+        paginator = ec2_client.get_paginator('describe_snapshots')
+        page_iterator = paginator.paginate(
             OwnerIds=["self"],
-            Filters=pending_filters
+            Filters=snapshot_filters,
+            PaginationConfig={'PageSize': 100}
         )
 
-        pending_snapshots = pending_response.get('Snapshots', [])
+        snapshots = []
+        for page in page_iterator:
+            snapshots.extend(page.get('Snapshots', []))
+
+        pending_snapshots = [s for s in snapshots if s['State'] == 'pending']
+        snapshots = [s for s in snapshots if s['State'] == 'completed']
         if pending_snapshots:
             latest_pending = max(pending_snapshots, key=lambda s: s['StartTime'])
             snapshot_id = latest_pending['SnapshotId']
@@ -7333,31 +7342,13 @@ def create_disk_from_snapshot_or_empty(user_id: str, availability_zone: str, dis
                 logger.error(f"Timeout waiting for snapshot {snapshot_id}: {wait_error}")
                 raise RuntimeError(f"Disk '{disk_name or 'default'}' snapshot is still being created from previous session. Please wait a few minutes and try again.")
 
-        # Now find latest completed snapshot (excluding soft-deleted ones)
-        snapshot_filters = [
-            {"Name": "tag:gpu-dev-user", "Values": [user_id]},
-            {"Name": "status", "Values": ["completed"]},
-        ]
-        if disk_name:
-            snapshot_filters.append({"Name": "tag:disk_name", "Values": [disk_name]})
-
-        # Use pagination to handle users with many snapshots
-        paginator = ec2_client.get_paginator('describe_snapshots')
-        page_iterator = paginator.paginate(
-            OwnerIds=["self"],
-            Filters=snapshot_filters,
-            PaginationConfig={'PageSize': 100}
-        )
-
-        snapshots = []
-        for page in page_iterator:
-            snapshots.extend(page.get('Snapshots', []))
+            # The listing predates the wait - count the snapshot as completed now
+            snapshots.append(latest_pending)
 
         # Filter out soft-deleted snapshots (those with delete-date tag)
         active_snapshots = []
         for snap in snapshots:
-            tags = {tag['Key']: tag['Value'] for tag in snap.get('Tags', [])}
-            if 'delete-date' not in tags:
+            if find_tag(snap.get('Tags', ()), 'delete-date') is None:
                 active_snapshots.append(snap)
 
         latest_snapshot = max(active_snapshots, key=lambda s: s['StartTime']) if active_snapshots else None
@@ -7451,7 +7442,7 @@ def create_disk_from_snapshot_or_empty(user_id: str, availability_zone: str, dis
 
             logger.info(f"Waiting for volume {volume_id} to become available...")
             waiter = ec2_client.get_waiter("volume_available")
-            waiter.wait(VolumeIds=[volume_id], WaiterConfig={"Delay": 5, "MaxAttempts": 60})
+            waiter.wait(VolumeIds=[volume_id], WaiterConfig={"Delay": 2, "MaxAttempts": 150})
 
             logger.info(f"Successfully restored volume {volume_id} from snapshot {snapshot_id}")
             return volume_id, is_new_disk, None
@@ -7485,7 +7476,7 @@ def create_disk_from_snapshot_or_empty(user_id: str, availability_zone: str, dis
 
             logger.info(f"Waiting for volume {volume_id} to become available...")
             waiter = ec2_client.get_waiter("volume_available")
-            waiter.wait(VolumeIds=[volume_id], WaiterConfig={"Delay": 5, "MaxAttempts": 60})
+            waiter.wait(VolumeIds=[volume_id], WaiterConfig={"Delay": 2, "MaxAttempts": 150})
 
             logger.info(f"Successfully created empty volume {volume_id}")
             return volume_id, is_new_disk, None
@@ -9993,6 +9984,7 @@ def process_delete_disk_action(record: dict[str, Any]) -> bool:
         user_id = message.get("user_id")
         disk_name = message.get("disk_name")
         delete_date = message.get("delete_date")
+        operation_id = message.get("operation_id")
 
         if not all([action, user_id, disk_name, delete_date]):
             logger.error(f"Missing required fields in delete disk action: {message}")
@@ -10000,7 +9992,9 @@ def process_delete_disk_action(record: dict[str, Any]) -> bool:
 
         logger.info(f"Processing delete disk action: marking '{disk_name}' for deletion (user: {user_id})")
 
-        # 1. Update DynamoDB to mark disk as deleted
+        # 1. Update DynamoDB to mark disk as deleted. The condition makes the
+        # table the source of truth: the CLI's pre-check can race with a
+        # reservation attaching the disk between check and processing.
         try:
             disks_table_name = os.environ.get('DISKS_TABLE_NAME', 'pytorch-gpu-dev-disks')
             disks_table = dynamodb.Table(disks_table_name)
@@ -10009,64 +10003,92 @@ def process_delete_disk_action(record: dict[str, Any]) -> bool:
             disks_table.update_item(
                 Key={'user_id': user_id, 'disk_name': disk_name},
                 UpdateExpression='SET is_deleted = :deleted, delete_date = :date, marked_deleted_at = :timestamp',
+                ConditionExpression='attribute_exists(disk_name) AND (attribute_not_exists(in_use) OR in_use = :not_in_use)',
                 ExpressionAttributeValues={
                     ':deleted': True,
                     ':date': delete_date,
-                    ':timestamp': marked_deleted_at
-                }
+                    ':timestamp': marked_deleted_at,
+                    ':not_in_use': False,
+                },
+                ReturnValuesOnConditionCheckFailure='ALL_OLD',
             )
             logger.info(f"Updated DynamoDB: marked disk '{disk_name}' as deleted")
 
+        except disks_table.meta.client.exceptions.ConditionalCheckFailedException as cond_error:
+            error_code = "in_use" if cond_error.response.get('Item') else "not_found"
+            logger.warning(f"Not deleting disk '{disk_name}' for user '{user_id}': {error_code}")
+            write_operation_result(operation_id, "failed", error_code)
+            return True  # Don't retry - the disk's state decides, not a transient error
+
         except Exception as db_error:
             logger.error(f"Error updating DynamoDB for disk '{disk_name}': {db_error}")
             return False  # Retry on DynamoDB errors
 
         # 2. Tag all snapshots in EC2
         try:
-            # Find all snapshots for this disk
-            response = ec2_client.describe_snapshots(
-                OwnerIds=["self"],
-                Filters=[
+            # Find all snapshots for this disk, page by page, keeping only the
+            # ids of those that don't already have a delete-date tag
+            describe_kwargs = {
+                'OwnerIds': ["self"],
+                'Filters': [
                     {"Name": "tag:gpu-dev-user", "Values": [user_id]},
                     {"Name": "tag:disk_name", "Values": [disk_name]},
-                ]
-            )
-
-            snapshots = response.get('Snapshots', [])
-            logger.info(f"Found {len(snapshots)} snapshots for disk '{disk_name}'")
+                ],
+                'MaxResults': 1000,
+            }
+            snapshot_count = 0
+            to_tag = []
+            while True:
+                response = ec2_client.describe_snapshots(**describe_kwargs)
+                for snapshot in response.get('Snapshots', []):
+                    snapshot_count += 1
+                    snapshot_id = snapshot['SnapshotId']
+
+                    # Skip if already tagged
+                    if find_tag(snapshot.get('Tags', ()), 'delete-date') is not None:
+                        logger.debug(f"Snapshot {snapshot_id} already has delete-date tag, skipping")
+                        continue
+                    to_tag.append(snapshot_id)
+                if not response.get('NextToken'):
+                    break
+                describe_kwargs['NextToken'] = response['NextToken']
+            logger.info(f"Found {snapshot_count} snapshots for disk '{disk_name}'")
 
-            # Tag each snapshot that doesn't already have delete-date tag
+            delete_tags = [
+                {"Key": "delete-date", "Value": delete_date},
+                {"Key": "marked-deleted-at", "Value": marked_deleted_at},
+            ]
             tagged_count = 0
-            for snapshot in snapshots:
-                snapshot_id = snapshot['SnapshotId']
-                tags = {tag['Key']: tag['Value'] for tag in snapshot.get('Tags', [])}
-
-                # Skip if already tagged
-                if 'delete-date' in tags:
-                    logger.debug(f"Snapshot {snapshot_id} already has delete-date tag, skipping")
-                    continue
-
-                try:
-                    ec2_client.create_tags(
-                        Resources=[snapshot_id],
-                        Tags=[
-                            {"Key": "delete-date", "Value": delete_date},
-                            {"Key": "marked-deleted-at", "Value": marked_deleted_at},
-                        ]
-                    )
-                    logger.info(f"Tagged snapshot {snapshot_id} with delete-date: {delete_date}")
-                    tagged_count += 1
-                except Exception as tag_error:
-                    logger.error(f"Error tagging snapshot {snapshot_id}: {tag_error}")
-                    # Continue tagging other snapshots
+            # CreateTags takes up to 1000 resources; one call per batch, and
+            # one per snapshot only if a batch is rejected (one bad id fails it)
+            for start in range(0, len(to_tag), 1000):
+                batch = to_tag[start:start + 1000]
+                if len(batch) > 1:
+                    try:
+                        ec2_client.create_tags(Resources=batch, Tags=delete_tags)
+                        logger.info(f"Tagged {len(batch)} snapshots with delete-date: {delete_date}")
+                        tagged_count += len(batch)
+                        continue
+                    except Exception as tag_error:
+                        logger.warning(f"Batch tagging failed, tagging snapshots one by one: {tag_error}")
+                for snapshot_id in batch:
+                    try:
+                        ec2_client.create_tags(Resources=[snapshot_id], Tags=delete_tags)
+                        logger.info(f"Tagged snapshot {snapshot_id} with delete-date: {delete_date}")
+                        tagged_count += 1
+                    except Exception as tag_error:
+                        logger.error(f"Error tagging snapshot {snapshot_id}: {tag_error}")
+                        # Continue tagging other snapshots
 
             logger.info(f"Successfully marked disk '{disk_name}' for deletion (tagged {tagged_count} snapshots)")
+            write_operation_result(operation_id, "completed")
             return True
 
         except Exception as ec2_error:
             logger.error(f"Error tagging snapshots for disk '{disk_name}': {ec2_error}")
             # DynamoDB is already updated, so return True to avoid retrying
             # The expiry Lambda will handle any missed snapshots
+            write_operation_result(operation_id, "completed")
             return True
 
     except Exception as e:
@@ -10173,7 +10195,7 @@ def process_clone_disk_action(record: dict[str, Any]) -> bool:
         # Exclude soft-deleted
         active_snapshots = [
             s for s in snapshots
-            if 'delete-date' not in {t['Key']: t['Value'] for t in s.get('Tags', [])}
+            if find_tag(s.get('Tags', ()), 'delete-date') is None
         ]
 
         if not active_snapshots:
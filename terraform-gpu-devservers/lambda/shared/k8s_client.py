@@ -4,6 +4,7 @@ Handles EKS authentication and client setup with just-in-time EKS token refresh
 """
 
 import base64
+import hashlib
 import logging
 import os
 import re
@@ -26,6 +27,14 @@ _token_cache = {"token": None, "expires_at": 0.0}
 _REFRESH_EARLY_SECONDS = 60
 _EFFECTIVE_TOKEN_TTL = 14 * 60  # ~14 minutes
 
+# Cluster endpoint/CA cache (module scope, like the token cache). Both are
+# effectively static, so warm invocations skip DescribeCluster for a day.
+_cluster_cache = {"endpoint": None, "ca_data": None, "fetched_at": 0.0}
+_CLUSTER_INFO_TTL = 24 * 60 * 60
+
+_CA_CERT_PATH = "/tmp/ca.crt"
+_ca_cert_cache = {"digest": None}  # blake2b of the base64 CA last written
+
 
 def get_bearer_token() -> str:
     """
@@ -76,28 +85,60 @@ def get_bearer_token() -> str:
     return token
 
 
+def _get_cluster_info() -> tuple:
+    """Return (endpoint, base64 CA data) for the EKS cluster, cached per container."""
+    now = time.time()
+    if (
+        _cluster_cache["endpoint"]
+        and now - _cluster_cache["fetched_at"] < _CLUSTER_INFO_TTL
+    ):
+        return _cluster_cache["endpoint"], _cluster_cache["ca_data"]
+
+    logger.info(f"Creating EKS client for region {REGION}")
+    eks = boto3.client("eks", region_name=REGION)
+
+    logger.info(f"Describing EKS cluster: {EKS_CLUSTER_NAME}")
+    cluster = eks.describe_cluster(name=EKS_CLUSTER_NAME)["cluster"]
+    logger.info(f"Retrieved EKS cluster info for {EKS_CLUSTER_NAME}")
+
+    _cluster_cache["endpoint"] = cluster["endpoint"]
+    _cluster_cache["ca_data"] = cluster["certificateAuthority"]["data"]
+    _cluster_cache["fetched_at"] = now
+    return _cluster_cache["endpoint"], _cluster_cache["ca_data"]
+
+
+def _write_ca_cert(ca_data: str) -> str:
+    """
+    Write the decoded CA to /tmp/ca.crt unless this container already wrote
+    the same CA. The fingerprint is taken over the base64 text, so a warm
+    hit skips the decode and the file read; a rotated CA still gets written.
+    """
+    digest = hashlib.blake2b(ca_data.encode(), digest_size=8).digest()
+    if digest == _ca_cert_cache["digest"] and os.path.exists(_CA_CERT_PATH):
+        return _CA_CERT_PATH
+
+    logger.info(f"Writing CA certificate to {_CA_CERT_PATH}")
+    tmp_path = f"{_CA_CERT_PATH}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(base64.b64decode(ca_data))
+    os.replace(tmp_path, _CA_CERT_PATH)
+    _ca_cert_cache["digest"] = digest
+    return _CA_CERT_PATH
+
+
 def setup_kubernetes_client() -> client.ApiClient:
     """
     Build an ApiClient configured for EKS and attach a refresh hook that
     keeps the Authorization header up to date. No locking (single-threaded Lambda).
     """
     try:
-        logger.info(f"Creating EKS client for region {REGION}")
-        eks = boto3.client("eks", region_name=REGION)
-
-        logger.info(f"Describing EKS cluster: {EKS_CLUSTER_NAME}")
-        cluster = eks.describe_cluster(name=EKS_CLUSTER_NAME)["cluster"]
-        logger.info(f"Retrieved EKS cluster info for {EKS_CLUSTER_NAME}")
-
-        # Always write CA cert (safe and avoids stale CA edge cases)
-        logger.info("Writing CA certificate to /tmp/ca.crt")
-        ca_path = "/tmp/ca.crt"
-        with open(ca_path, "wb") as f:
-            f.write(base64.b64decode(cluster["certificateAuthority"]["data"]))
+        endpoint, ca_data = _get_cluster_info()
+        ca_path = _write_ca_cert(ca_data)
 
         logger.info("Creating Kubernetes client configuration")
         cfg = client.Configuration()
-        cfg.host = cluster["endpoint"]
+        cfg.host = endpoint
         cfg.ssl_ca_cert = ca_path
         cfg.api_key_prefix = {"authorization": "Bearer"}
 
@@ -18,6 +18,11 @@ s3_client = boto3.client("s3")
 dynamodb = boto3.resource("dynamodb")
 
 
+def find_tag(tags, key, default=None):
+    """Value of one tag in an EC2 Tags list, without building a dict of them all."""
+    return next((tag['Value'] for tag in tags if tag['Key'] == key), default)
+
+
 def safe_create_snapshot(volume_id, user_id, snapshot_type="shutdown", disk_name=None, content_s3_path=None, disk_size=None):
     """
     Safely create snapshot, avoiding duplicates if one is already in progress.
@@ -304,24 +309,22 @@ def get_latest_snapshot(user_id, volume_id=None, include_pending=False):
             PaginationConfig={'PageSize': 100}
         )
 
-        snapshots = []
+        # Single pass over the pages, keeping only the most recent snapshot by
+        # start time; soft-deleted ones (delete-date tag) are skipped, and tags
+        # are only checked for snapshots newer than the current best
+        latest_snapshot = None
         for page in page_iterator:
-            snapshots.extend(page.get('Snapshots', []))
-
-        # Filter out soft-deleted snapshots (those with delete-date tag)
-        active_snapshots = []
-        for snap in snapshots:
-            tags = {tag['Key']: tag['Value'] for tag in snap.get('Tags', [])}
-            if 'delete-date' not in tags:
-                active_snapshots.append(snap)
+            for snap in page.get('Snapshots', []):
+                if latest_snapshot is not None and snap['StartTime'] <= latest_snapshot['StartTime']:
+                    continue
+                if find_tag(snap.get('Tags', ()), 'delete-date') is None:
+                    latest_snapshot = snap
 
-        if not active_snapshots:
+        if latest_snapshot is None:
             status_desc = "completed or pending" if include_pending else "completed"
             logger.info(f"No {status_desc} snapshots found for user {user_id}")
             return None
 
-        # Get most recent snapshot by start time
-        latest_snapshot = max(active_snapshots, key=lambda s: s['StartTime'])
         logger.info(
             f"Found latest snapshot {latest_snapshot['SnapshotId']} ({latest_snapshot['State']}) for user {user_id}")
         return latest_snapshot
@@ -308,37 +308,48 @@ def migrate_disks(region='us-east-2', dry_run=True):
         if not snapshots:
             print("✅ Phase 3: No snapshots found with disk_name tags (nothing to populate)\n")
         else:
-            # Group snapshots by user and disk_name
-            user_disk_snapshots = defaultdict(lambda: defaultdict(list))
+            # Group snapshots by user and disk_name, tracking each disk's
+            # oldest/latest snapshot and count in the same pass (tags are
+            # parsed once per snapshot; no per-disk sort or re-parse)
+            user_disk_snapshots = defaultdict(dict)
             for snapshot in snapshots:
                 tags = {tag['Key']: tag['Value'] for tag in snapshot.get('Tags', [])}
                 user_id = tags.get('gpu-dev-user')
                 disk_name = tags.get('disk_name')
 
-                if user_id and disk_name:
-                    user_disk_snapshots[user_id][disk_name].append(snapshot)
+                if not (user_id and disk_name):
+                    continue
+
+                disk = user_disk_snapshots[user_id].get(disk_name)
+                if disk is None:
+                    user_disk_snapshots[user_id][disk_name] = {
+                        'count': 1, 'oldest': snapshot, 'latest': snapshot, 'latest_tags': tags,
+                    }
+                    continue
+                disk['count'] += 1
+                if snapshot['StartTime'] < disk['oldest']['StartTime']:
+                    disk['oldest'] = snapshot
+                if snapshot['StartTime'] >= disk['latest']['StartTime']:
+                    disk['latest'] = snapshot
+                    disk['latest_tags'] = tags
 
             # Process each user's disks
             for user_id, disks in user_disk_snapshots.items():
                 print(f"👤 User: {user_id}")
                 print(f"   Disks: {len(disks)}")
 
-                for disk_name, disk_snapshots in disks.items():
-                    # Sort by start time
-                    disk_snapshots.sort(key=lambda s: s['StartTime'])
-
+                for disk_name, disk in disks.items():
                     # Get metadata from snapshots
-                    oldest_snapshot = disk_snapshots[0]
-                    latest_snapshot = disk_snapshots[-1]
+                    oldest_snapshot = disk['oldest']
+                    latest_snapshot = disk['latest']
 
                     size_gb = latest_snapshot.get('VolumeSize', 0)
                     created_at = oldest_snapshot['StartTime'].isoformat()
                     last_used = latest_snapshot['StartTime'].isoformat()
-                    snapshot_count = len(disk_snapshots)
+                    snapshot_count = disk['count']
 
                     # Extract disk_size from latest snapshot tags if available
-                    latest_tags = {tag['Key']: tag['Value'] for tag in latest_snapshot.get('Tags', [])}
-                    disk_size = latest_tags.get('disk_size', None)
+                    disk_size = disk['latest_tags'].get('disk_size', None)
 
                     print(f"   • {disk_name}: {size_gb}GB, {snapshot_count} snapshot(s)")
                     if disk_size:
@@ -31,6 +31,7 @@ def tmp_caches(tmp_path, monkeypatch):
     ssh_path = tmp_path / "ssh-validation-cache.json"
     monkeypatch.setattr(auth, "_AUTH_CACHE_PATH", auth_path)
     monkeypatch.setattr(auth, "_SSH_CACHE_PATH", ssh_path)
+    monkeypatch.setattr(auth, "_auth_memo", {})
     # Stable, deterministic auth-cache key regardless of the host's AWS_PROFILE.
     monkeypatch.setenv("AWS_PROFILE", "unittest-profile")
     # No AWS_ROLE_ARN by default (the role-name defense is opt-in by env).
@@ -119,6 +120,57 @@ def test_authenticate_user_uses_cache_and_skips_sts():
     assert cfg.get_user_identity.call_count == 1  # cache short-circuit
 
 
+def test_authenticate_user_memo_skips_cache_file_read(monkeypatch):
+    cfg = _make_config(arn="arn:aws:iam::111:user/bob")
+    first = auth.authenticate_user(cfg)
+    monkeypatch.setattr(auth, "_load_auth_cache",
+                        MagicMock(side_effect=AssertionError("file cache re-read")))
+    assert auth.authenticate_user(cfg) is first
+    assert cfg.get_user_identity.call_count == 1
+
+
+def test_authenticate_user_memo_expires_on_monotonic_deadline(monkeypatch):
+    cfg = _make_config(arn="arn:aws:iam::111:user/bob")
+    auth.authenticate_user(cfg)
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(auth.time, "monotonic",
+                        lambda: real_monotonic() + auth._AUTH_CACHE_TTL_SECONDS + 1)
+    load = MagicMock(return_value=None)
+    monkeypatch.setattr(auth, "_load_auth_cache", load)
+    auth.authenticate_user(cfg)
+    load.assert_called_once_with("octocat")
+    assert cfg.get_user_identity.call_count == 2
+
+
+def test_authenticate_user_memo_ends_with_old_cache_entry(tmp_caches, monkeypatch):
+    # A file entry with 60 s of life left is memoized for those 60 s, not a fresh TTL.
+    age = auth._AUTH_CACHE_TTL_SECONDS - 60
+    Path(tmp_caches["auth"]).write_text(json.dumps({"unittest-profile": {
+        "github_user": "octocat",
+        "ts": time.time() - age,
+        "result": {"arn": "a/bob", "user_id": "bob"},
+    }}))
+    cfg = _make_config(arn="arn:aws:iam::111:user/fresh")
+    assert auth.authenticate_user(cfg)["user_id"] == "bob"
+    deadline = auth._auth_memo[("unittest-profile", "octocat", "")][0]
+    assert deadline - time.monotonic() == pytest.approx(60, abs=5)
+
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(auth.time, "monotonic", lambda: real_monotonic() + 120)
+    monkeypatch.setattr(auth, "_load_auth_cache", MagicMock(return_value=None))
+    assert auth.authenticate_user(cfg)["user_id"] == "fresh"
+    assert cfg.get_user_identity.call_count == 1
+
+
+def test_clear_auth_cache_drops_memo():
+    cfg = _make_config(arn="arn:aws:iam::111:user/bob")
+    auth.authenticate_user(cfg)
+    auth.clear_auth_cache()
+    assert auth._auth_memo == {}
+    auth.authenticate_user(cfg)
+    assert cfg.get_user_identity.call_count == 2
+
+
 def test_authenticate_user_failure_clears_cache_and_raises():
     cfg = _make_config(identity_raises=RuntimeError("creds expired"))
     with pytest.raises(RuntimeError) as exc:
@@ -153,7 +205,7 @@ def test_load_auth_cache_missing_file_returns_none():
 def test_save_then_load_auth_cache_roundtrip():
     result = {"user_id": "bob", "github_user": "octocat", "arn": "a/bob"}
     auth._save_auth_cache("octocat", result)
-    assert auth._load_auth_cache("octocat") == result
+    assert auth._load_auth_cache("octocat")[0] == result
 
 
 def test_load_auth_cache_github_user_mismatch_returns_none():
@@ -185,7 +237,7 @@ def test_load_auth_cache_fresh_within_ttl_returns_result(tmp_caches):
         }
     }
     Path(tmp_caches["auth"]).write_text(json.dumps(data))
-    assert auth._load_auth_cache("octocat") == {"arn": "a/bob", "user_id": "bob"}
+    assert auth._load_auth_cache("octocat") == ({"arn": "a/bob", "user_id": "bob"}, fresh_ts)
 
 
 def test_load_auth_cache_role_arn_mismatch_returns_none(tmp_caches, monkeypatch):
@@ -212,7 +264,7 @@ def test_load_auth_cache_role_arn_match_returns_result(tmp_caches, monkeypatch):
         }
     }
     Path(tmp_caches["auth"]).write_text(json.dumps(data))
-    assert auth._load_auth_cache("octocat") == {
+    assert auth._load_auth_cache("octocat")[0] == {
         "arn": "arn:aws:sts::111:assumed-role/MyRole/bob"
     }
 
@@ -19,6 +19,8 @@ from the root conftest are cleared per test so region-resolution branches are
 deterministic.
 """
 import json
+import os
+import stat
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -280,6 +282,17 @@ def test_corrupt_config_file_is_handled_and_defaults_used(make_config):
     assert cfg.user_config["region"] == "us-east-2"
 
 
+def test_corrupt_legacy_file_warns_and_other_still_migrates(make_config, capsys):
+    make_config.paths.legacy_cfg.parent.mkdir(parents=True, exist_ok=True)
+    make_config.paths.legacy_cfg.write_text("{ nope")
+    _write_json(make_config.paths.legacy_env, {"environment": "test"})
+    cfg = make_config()
+    out = capsys.readouterr().out
+    assert f"Could not read {make_config.paths.legacy_cfg}" in out
+    assert f"Migrated config from {make_config.paths.legacy_env}" in out
+    assert cfg.user_config["environment"] == "test"
+
+
 def test_existing_complete_config_not_rewritten(make_config):
     # A complete config (all required keys) shouldn't trigger a needs_save write.
     full = {"region": "us-west-1", "environment": "test", "workspace": "default"}
@@ -400,6 +413,15 @@ def test_clients_are_lazy_and_cached(make_config):
     cfg.session.client.assert_any_call("sts", region_name=cfg.aws_region)
 
 
+def test_ec2_and_s3_clients_are_lazy_and_cached(make_config):
+    cfg = make_config()
+    assert cfg._ec2_client is None and cfg._s3_client is None
+    assert cfg.ec2_client is cfg.ec2_client
+    assert cfg.s3_client is cfg.s3_client
+    cfg.session.client.assert_any_call("ec2", region_name=cfg.aws_region)
+    cfg.session.client.assert_any_call("s3", region_name=cfg.aws_region)
+
+
 def test_dynamodb_uses_resource_not_client(make_config):
     cfg = make_config()
     assert cfg._dynamodb is None
@@ -416,6 +438,7 @@ def test_refresh_session_clears_clients_and_recreates(make_config):
         cfg.refresh_session()
     assert cfg._sts_client is None
     assert cfg._sqs_client is None
+    assert cfg._ec2_client is None and cfg._s3_client is None
     assert cfg._dynamodb is None
     assert cfg.session is new_session
 
@@ -431,6 +454,24 @@ def test_get_queue_url_success(make_config):
     cfg._sqs_client.get_queue_url.assert_called_once_with(QueueName=cfg.queue_name)
 
 
+def test_get_queue_url_resolved_once(make_config):
+    cfg = make_config()
+    cfg._sqs_client = MagicMock()
+    cfg._sqs_client.get_queue_url.return_value = {"QueueUrl": "https://q/url"}
+    assert cfg.get_queue_url() == cfg.get_queue_url() == "https://q/url"
+    cfg._sqs_client.get_queue_url.assert_called_once()
+
+
+def test_get_queue_url_error_is_not_cached(make_config):
+    cfg = make_config()
+    cfg._sqs_client = MagicMock()
+    cfg._sqs_client.get_queue_url.side_effect = [Exception("throttled"),
+                                                 {"QueueUrl": "https://q/url"}]
+    with pytest.raises(RuntimeError):
+        cfg.get_queue_url()
+    assert cfg.get_queue_url() == "https://q/url"
+
+
 def test_get_queue_url_wraps_error(make_config):
     cfg = make_config()
     cfg._sqs_client = MagicMock()
@@ -474,3 +515,58 @@ def test_load_config_returns_config_instance(cfg_paths):
 def test_module_exposes_config_and_load_config():
     assert config_mod.Config is Config
     assert callable(config_mod.load_config)
+
+
+# --------------------------------------------------------------------------
+# _create_aws_session credential cache
+# --------------------------------------------------------------------------
+def test_cred_cache_created_owner_only(make_config, monkeypatch):
+    cfg = make_config()
+    frozen = MagicMock(access_key="AK", secret_key="SK", token="TOK")
+    session = MagicMock()
+    session.get_credentials.return_value.get_frozen_credentials.return_value = frozen
+    created_modes = []
+    real_open = os.open
+
+    def spy_open(path, flags, mode=0o777):
+        created_modes.append(mode)
+        return real_open(path, flags, mode)
+
+    monkeypatch.setattr(config_mod.os, "open", spy_open)
+    with patch.object(config_mod.boto3, "Session", return_value=session):
+        Config._create_aws_session(cfg)
+    path = make_config.paths.cred
+    assert created_modes == [0o600]
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert json.loads(path.read_text())["secret_key"] == "SK"
+
+
+def test_cred_cache_existing_loose_file_tightened(make_config):
+    cfg = make_config()
+    path = make_config.paths.cred
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+    path.chmod(0o644)
+    frozen = MagicMock(access_key="AK", secret_key="SK", token="TOK")
+    session = MagicMock()
+    session.get_credentials.return_value.get_frozen_credentials.return_value = frozen
+    with patch.object(config_mod.boto3, "Session", return_value=session):
+        Config._create_aws_session(cfg)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+# --------------------------------------------------------------------------
+# json_loads / json_dumps (orjson when installed, stdlib fallback)
+# --------------------------------------------------------------------------
+@pytest.mark.parametrize("fast", [False, True])
+def test_json_helpers_roundtrip_bytes(monkeypatch, fast):
+    if fast:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(config_mod, "orjson", None)
+    data = {"region": "us-east-2", "n": [1, 2.5, None]}
+    compact = config_mod.json_dumps(data)
+    pretty = config_mod.json_dumps(data, indent=True)
+    assert isinstance(compact, bytes) and b"\n" not in compact
+    assert b'\n  "region"' in pretty
+    assert config_mod.json_loads(compact) == config_mod.json_loads(pretty.decode()) == data
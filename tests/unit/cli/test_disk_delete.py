@@ -0,0 +1,57 @@
+"""Unit tests for `gpu-dev disk delete`.
+
+The CLI's in-use pre-check is advisory: the lambda re-checks the disk under a
+condition and, when it refuses, writes status=failed with error in_use /
+not_found to the operations table. The delete poll must surface that instead
+of waiting out its timeout.
+
+We patch the symbols where the command looks them up: ``gpu_dev_cli.cli``
+(load_config, get_disk, delete_disk, get_operation_result, list_disks) and
+``gpu_dev_cli.auth.authenticate_user`` (imported inside the command).
+"""
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gpu_dev_cli.cli import main
+
+
+@contextmanager
+def delete_env(operation_results, disks=()):
+    with patch("gpu_dev_cli.cli.load_config", return_value=MagicMock(name="config")), \
+         patch("gpu_dev_cli.auth.authenticate_user", return_value={"user_id": "octocat"}), \
+         patch("gpu_dev_cli.cli.get_disk", return_value=None), \
+         patch("gpu_dev_cli.cli.delete_disk", return_value="op-1"), \
+         patch("gpu_dev_cli.cli.get_operation_result",
+               side_effect=list(operation_results)) as get_result, \
+         patch("gpu_dev_cli.cli.list_disks", return_value=list(disks)) as list_disks, \
+         patch("time.sleep"):
+        yield get_result, list_disks
+
+
+@pytest.mark.parametrize("error, message", [
+    ("in_use", "Cannot delete disk 'data' - it is currently in use"),
+    ("not_found", "Disk 'data' not found"),
+])
+def test_delete_refused_by_lambda_reports_reason(cli_runner, error, message):
+    # first round: no result yet; second round: the lambda refused
+    pending = {"name": "data", "is_deleted": False}
+    with delete_env([(None, None), ("failed", error)], disks=[pending]) as (get_result, _):
+        r = cli_runner.invoke(main, ["disk", "delete", "data", "--yes"])
+
+    assert r.exit_code == 0, r.output
+    assert message in r.output
+    assert "Timed out" not in r.output
+    assert get_result.call_args.args[0] == "op-1"
+    assert get_result.call_count == 2
+
+
+def test_delete_completes_when_disk_marked_deleted(cli_runner):
+    deleted = {"name": "data", "is_deleted": True, "delete_date": "2026-11-15"}
+    with delete_env([("completed", None)], disks=[deleted]):
+        r = cli_runner.invoke(main, ["disk", "delete", "data", "--yes"])
+
+    assert r.exit_code == 0, r.output
+    assert "marked for deletion" in r.output
+    assert "2026-11-15" in r.output
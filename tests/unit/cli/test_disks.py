@@ -2,22 +2,25 @@
 delete / clone / rename / unlock / poll helpers.
 
 These are pure-logic + boto3-shaped tests. We never touch real AWS: the Config
-is a MagicMock whose ``session``/``dynamodb`` produce MagicMock clients and
-resources, and the module's own client accessors
+is a MagicMock whose ``dynamodb``/``ec2_client``/``s3_client`` handles are
+MagicMocks (or table doubles), and the module's own client accessors
 (``get_dynamodb_resource``/``get_ec2_client``/``get_s3_client``) are patched
-where it matters. ``list_disks`` is the gatekeeper for the mutation helpers, so
-most of those tests patch ``disks.list_disks`` directly and assert the branch /
+where it matters. ``_find_disk`` is the gatekeeper for the mutation helpers, so
+most of those tests patch it (``_given_disks``) and assert the branch /
 SQS-message behaviour.
 
 The ``__no_disk__`` sentinel itself lives in interactive.select_disk_interactive;
 here we cover the disks.py side that consumes/produces disk records and the
 formatting/coercion done in list_disks.
 """
+import stat
+import threading
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
 
 import gpu_dev_cli.disks as disks
 
@@ -25,6 +28,22 @@ import gpu_dev_cli.disks as disks
 # --------------------------------------------------------------------------- #
 # helpers / fixtures                                                           #
 # --------------------------------------------------------------------------- #
+@pytest.fixture(autouse=True)
+def tmp_content_cache(tmp_path, monkeypatch):
+    """Keep list_disk_content's on-disk listing cache out of the real ~/.config."""
+    cache_dir = tmp_path / "disk-content"
+    monkeypatch.setattr(disks, "_CONTENT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def empty_disks_cache():
+    """Listings cached by one test must not satisfy another's pre-checks."""
+    disks.clear_disk_cache()
+    yield
+    disks.clear_disk_cache()
+
+
 def make_config(**overrides):
     """A Config-shaped MagicMock with the attribute names disks.py reads."""
     cfg = MagicMock(name="config")
@@ -60,6 +79,38 @@ class _Table:
         return self._get_item_response
 
 
+def _rendezvous_tables(**disks_table_kwargs):
+    """(disks table, reservations table) doubles for overlap tests: a disks-table
+    read only returns once a reservations query has started, so it deadlocks
+    (and times out) if the two probes run one after the other."""
+    query_started = threading.Event()
+
+    class _SlowDisks(_Table):
+        def query(self, **kwargs):
+            assert query_started.wait(timeout=5), "probes ran sequentially"
+            return super().query(**kwargs)
+
+        def get_item(self, **kwargs):
+            assert query_started.wait(timeout=5), "probes ran sequentially"
+            return super().get_item(**kwargs)
+
+    class _SignallingReservations(_Table):
+        def query(self, **kwargs):
+            query_started.set()
+            return super().query(**kwargs)
+
+    return _SlowDisks(**disks_table_kwargs), _SignallingReservations()
+
+
+def _given_disks(monkeypatch, records):
+    """Make the mutation helpers' _find_disk / disk_exists pre-checks see
+    exactly these disks."""
+    by_name = {d["name"]: d for d in records}
+    monkeypatch.setattr(disks, "_find_disk",
+                        lambda name, u, c, check_in_use=True: by_name.get(name))
+    monkeypatch.setattr(disks, "disk_exists", lambda name, u, c: name in by_name)
+
+
 def fake_dynamodb(tables):
     """A dynamodb resource double; tables is {name: _Table}."""
     res = MagicMock(name="dynamodb_resource")
@@ -70,23 +121,13 @@ def fake_dynamodb(tables):
 # --------------------------------------------------------------------------- #
 # client accessor helpers                                                      #
 # --------------------------------------------------------------------------- #
-def test_get_ec2_client_uses_region_and_session():
+def test_client_accessors_reuse_the_configs_cached_handles():
     cfg = make_config()
-    client = disks.get_ec2_client(cfg)
-    cfg.session.client.assert_called_once_with("ec2", region_name="us-east-2")
-    assert client is cfg.session.client.return_value
-
-
-def test_get_s3_client_uses_region_and_session():
-    cfg = make_config()
-    disks.get_s3_client(cfg)
-    cfg.session.client.assert_called_once_with("s3", region_name="us-east-2")
-
-
-def test_get_dynamodb_resource_uses_region_and_session():
-    cfg = make_config()
-    disks.get_dynamodb_resource(cfg)
-    cfg.session.resource.assert_called_once_with("dynamodb", region_name="us-east-2")
+    assert disks.get_ec2_client(cfg) is cfg.ec2_client
+    assert disks.get_s3_client(cfg) is cfg.s3_client
+    assert disks.get_dynamodb_resource(cfg) is cfg.dynamodb
+    cfg.session.client.assert_not_called()
+    cfg.session.resource.assert_not_called()
 
 
 # --------------------------------------------------------------------------- #
@@ -193,6 +234,36 @@ def test_list_disks_reservation_without_disk_name_is_ignored():
     assert result[0]["in_use"] is False
 
 
+class _StatusIndex(_Table):
+    """Reservations UserStatusIndex double answering per queried status."""
+
+    def __init__(self, items_by_status):
+        super().__init__()
+        self._items_by_status = items_by_status
+
+    def query(self, **kwargs):
+        self.query_calls.append(kwargs)
+        status = kwargs["ExpressionAttributeValues"][":status"]
+        return {"Items": self._items_by_status.get(status, [])}
+
+
+@pytest.mark.parametrize("status, in_use", [("active", True), ("preparing", True), ("queued", False)])
+def test_list_disks_legacy_reservation_holds_default_disk(status, in_use):
+    """Same rule as get_disk_in_use_status: no disk_name + an EBS volume +
+    active/preparing means the reservation has the "default" disk."""
+    cfg = make_config()
+    legacy = {"reservation_id": "legacy99-aaaa", "ebs_volume_id": "vol-1"}
+    cfg.dynamodb = fake_dynamodb({
+        cfg.disks_table: _Table(query_responses=[{"Items": [
+            {"disk_name": "default"}, {"disk_name": "myproj"}]}]),
+        cfg.reservations_table: _StatusIndex({status: [legacy]}),
+    })
+    by_name = {d["name"]: d for d in disks.list_disks("octocat", cfg)}
+    assert by_name["default"]["in_use"] is in_use
+    assert by_name["default"]["reservation_id"] == ("legacy99" if in_use else None)
+    assert by_name["myproj"]["in_use"] is False
+
+
 def test_list_disks_reservation_batch_check_swallows_errors():
     """If the reservations batch query raises, list still returns disk records."""
     cfg = make_config()
@@ -231,6 +302,41 @@ def test_list_disks_sorts_by_last_used_desc():
     assert [d["name"] for d in result] == ["new", "old", "never"]
 
 
+def test_list_disks_never_used_keep_table_order_after_dated():
+    items = [
+        {"disk_name": "n1"},
+        {"disk_name": "mid", "last_used": "2025-06-01T00:00:00+00:00"},
+        {"disk_name": "n2"},
+        {"disk_name": "top", "last_used": "2026-01-01T00:00:00+00:00"},
+    ]
+    result, _, _ = _list_disks_with(items)
+    assert [d["name"] for d in result] == ["top", "mid", "n1", "n2"]
+
+
+def test_list_disks_converts_each_page_before_fetching_the_next(monkeypatch):
+    events = []
+
+    class _RecordingTable(_Table):
+        def query(self, **kwargs):
+            events.append(("query", len(self.query_calls)))
+            return super().query(**kwargs)
+
+    real_record = disks._disk_record
+    monkeypatch.setattr(disks, "_disk_record",
+                        lambda item, **kw: (events.append(("record", item["disk_name"])),
+                                            real_record(item, **kw))[1])
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({
+        cfg.disks_table: _RecordingTable(query_responses=[
+            {"Items": [{"disk_name": "a"}], "LastEvaluatedKey": {"k": "1"}},
+            {"Items": [{"disk_name": "b"}]},
+        ]),
+        cfg.reservations_table: _Table(query_responses=[{"Items": []}] * 4),
+    })
+    disks.list_disks("octocat", cfg)
+    assert events == [("query", 0), ("record", "a"), ("query", 1), ("record", "b")]
+
+
 def test_list_disks_paginates_disks_table():
     cfg = make_config()
     page1 = {"Items": [{"disk_name": "a"}], "LastEvaluatedKey": {"k": 1}}
@@ -297,6 +403,34 @@ def test_in_use_status_default_disk_legacy_match(monkeypatch):
     in_use, rid = disks.get_disk_in_use_status("default", "octocat", cfg)
     assert in_use is True
     assert rid == "legacy-1"
+    legacy = res_table.query_calls[1]
+    assert legacy["IndexName"] == "UserStatusIndex"
+    assert legacy["ExpressionAttributeValues"][":status"] == "active"
+
+
+def test_in_use_status_projects_only_what_it_reads(monkeypatch):
+    disks_table = _Table(get_item_response={"Item": {}})
+    res_table = _Table(query_responses=[{"Items": []}, {"Items": []}, {"Items": []}])
+    cfg = _patch_ddb(monkeypatch, {"pytorch-gpu-dev-disks": disks_table,
+                                   "pytorch-gpu-dev-reservations": res_table})
+    assert disks.get_disk_in_use_status("default", "octocat", cfg) == (False, None)
+    assert disks_table.get_item_calls[0]["ProjectionExpression"] == "in_use, attached_to_reservation"
+    # named-disk query and both legacy status queries
+    assert [c["ProjectionExpression"] for c in res_table.query_calls] == ["reservation_id"] * 3
+
+
+def test_in_use_status_legacy_query_checks_preparing_after_active(monkeypatch):
+    disks_table = _Table(get_item_response={"Item": {}})
+    res_table = _Table(query_responses=[
+        {"Items": []},                                  # named disk
+        {"Items": []},                                  # legacy, active
+        {"Items": [{"reservation_id": "legacy-2"}]},    # legacy, preparing
+    ])
+    cfg = _patch_ddb(monkeypatch, {"pytorch-gpu-dev-disks": disks_table,
+                                   "pytorch-gpu-dev-reservations": res_table})
+    assert disks.get_disk_in_use_status("default", "octocat", cfg) == (True, "legacy-2")
+    assert [c["ExpressionAttributeValues"].get(":status") for c in res_table.query_calls[1:]] == [
+        "active", "preparing"]
 
 
 def test_in_use_status_non_default_skips_legacy_query(monkeypatch):
@@ -339,36 +473,100 @@ def test_in_use_status_disks_table_error_falls_through(monkeypatch):
     assert (in_use, rid) == (True, "r-7")
 
 
+def test_in_use_status_pages_only_until_a_match(monkeypatch):
+    disks_table = _Table(get_item_response={"Item": {}})
+    res_table = _Table(query_responses=[
+        {"Items": [], "LastEvaluatedKey": {"k": 1}},
+        {"Items": [{"reservation_id": "r-2"}], "LastEvaluatedKey": {"k": 2}},
+        {"Items": [{"reservation_id": "r-3"}]},
+    ])
+    cfg = _patch_ddb(monkeypatch, {"pytorch-gpu-dev-disks": disks_table,
+                                   "pytorch-gpu-dev-reservations": res_table})
+    assert disks.get_disk_in_use_status("myproj", "octocat", cfg) == (True, "r-2")
+    assert len(res_table.query_calls) == 2
+    assert res_table.query_calls[1]["ExclusiveStartKey"] == {"k": 1}
+
+
+def test_in_use_status_cached_briefly(monkeypatch):
+    disks_table = _Table(get_item_response={"Item": {}})
+    res_table = _Table(query_responses=[{"Items": [{"reservation_id": "r-1"}]}])
+    cfg = _patch_ddb(monkeypatch, {"pytorch-gpu-dev-disks": disks_table,
+                                   "pytorch-gpu-dev-reservations": res_table})
+    clock = [100.0]
+    monkeypatch.setattr(disks.time, "monotonic", lambda: clock[0])
+
+    assert disks.get_disk_in_use_status("myproj", "octocat", cfg) == (True, "r-1")
+    assert disks.get_disk_in_use_status("myproj", "octocat", cfg) == (True, "r-1")
+    assert len(disks_table.get_item_calls) == 1
+
+    clock[0] += disks._IN_USE_CACHE_TTL
+    assert disks.get_disk_in_use_status("myproj", "octocat", cfg) == (False, None)
+    assert len(disks_table.get_item_calls) == 2
+
+
+def test_in_use_status_cache_is_per_disks_table(monkeypatch):
+    disks_table = _Table(get_item_response={"Item": {"in_use": True, "attached_to_reservation": "r-1"}})
+    cfg = _patch_ddb(monkeypatch, {"pytorch-gpu-dev-disks": disks_table})
+    assert disks.get_disk_in_use_status("data", "octocat", cfg) == (True, "r-1")
+
+    other = make_config()
+    other.disks_table = "other-env-disks"
+    other.reservations_table = "other-env-reservations"
+    monkeypatch.setattr(disks, "get_dynamodb_resource", lambda c: fake_dynamodb({
+        "other-env-disks": _Table(get_item_response={"Item": {}}),
+        "other-env-reservations": _Table()}))
+    # same user + disk name in another environment: not served from the cache
+    assert disks.get_disk_in_use_status("data", "octocat", other) == (False, None)
+
+
+def test_in_use_status_cache_cleared_and_failures_not_cached(monkeypatch):
+    disks_table = _Table(get_item_response={"Item": {}})
+    bad_res = MagicMock()
+    bad_res.query.side_effect = [RuntimeError("creds expired"), {"Items": []}, {"Items": []}]
+    cfg = _patch_ddb(monkeypatch, {"pytorch-gpu-dev-disks": disks_table,
+                                   "pytorch-gpu-dev-reservations": bad_res})
+
+    assert disks.get_disk_in_use_status("myproj", "octocat", cfg) == (False, None)
+    assert disks.get_disk_in_use_status("myproj", "octocat", cfg) == (False, None)
+    assert bad_res.query.call_count == 2
+
+    disks.clear_disk_cache()
+    disks.get_disk_in_use_status("myproj", "octocat", cfg)
+    assert bad_res.query.call_count == 3
+
+
 # --------------------------------------------------------------------------- #
 # create_disk                                                                  #
 # --------------------------------------------------------------------------- #
 def test_create_disk_rejects_existing(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "dup"}])
+    _given_disks(monkeypatch, [{"name": "dup"}])
     cfg = make_config()
     assert disks.create_disk("dup", "octocat", cfg) is None
     assert "already exists" in capsys.readouterr().out
-    cfg.session.client.assert_not_called()
+    cfg.sqs_client.send_message.assert_not_called()
 
 
-@pytest.mark.parametrize("bad", ["has space", "weird!", "tab\tname", "slash/name", ""])
+@pytest.mark.parametrize("bad", ["has space", "weird!", "tab\tname", "slash/name", "",
+                                 "trailing\n"])
 def test_create_disk_rejects_invalid_names(monkeypatch, capsys, bad):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     cfg = make_config()
     assert disks.create_disk(bad, "octocat", cfg) is None
     assert "only letters, numbers" in capsys.readouterr().out
 
 
 def test_create_disk_sends_sqs_and_returns_operation_id(monkeypatch):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     monkeypatch.setattr(disks, "get_version", lambda: "0.6.6")
     cfg = make_config()
     sqs = MagicMock()
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
 
     op_id = disks.create_disk("valid_name-1", "octocat", cfg)
 
     assert op_id and isinstance(op_id, str)
-    cfg.session.client.assert_called_once_with("sqs", region_name="us-east-2")
+    # the Config's cached SQS client is reused, not a fresh one per send
+    cfg.session.client.assert_not_called()
     sqs.send_message.assert_called_once()
     kwargs = sqs.send_message.call_args.kwargs
     assert kwargs["QueueUrl"] == "https://sqs/queue"
@@ -382,12 +580,12 @@ def test_create_disk_sends_sqs_and_returns_operation_id(monkeypatch):
 
 
 def test_create_disk_sqs_error_returns_none(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     monkeypatch.setattr(disks, "get_version", lambda: "0")
     cfg = make_config()
     sqs = MagicMock()
     sqs.send_message.side_effect = RuntimeError("no perms")
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
     assert disks.create_disk("ok", "octocat", cfg) is None
     assert "Error sending create request" in capsys.readouterr().out
 
@@ -395,31 +593,151 @@ def test_create_disk_sqs_error_returns_none(monkeypatch, capsys):
 # --------------------------------------------------------------------------- #
 # delete_disk                                                                  #
 # --------------------------------------------------------------------------- #
+def test_precheck_reuses_recent_listing_and_create_invalidates():
+    """A command that just listed disks doesn't pay for a second listing in the
+    mutation helper's pre-check; a successful mutation drops the cache."""
+    disks_table = _Table(query_responses=[{"Items": [{"disk_name": "d1"}]}])
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({
+        cfg.disks_table: disks_table,
+        cfg.reservations_table: _Table(query_responses=[{"Items": []}] * 4),
+    })
+    disks.list_disks("octocat", cfg)
+    assert disks.create_disk("d1", "octocat", cfg) is None  # served from cache
+    assert len(disks_table.query_calls) == 1
+
+    assert disks.create_disk("d2", "octocat", cfg)
+    assert disks._disks_cache == {}
+
+
+def test_precheck_cache_expires():
+    disks_table = _Table(get_item_response={})
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table})
+    disks._disks_cache[("octocat", cfg.disks_table)] = (
+        disks.time.monotonic() - disks._DISKS_CACHE_TTL - 1, {"stale": {"name": "stale"}})
+    assert disks._find_disk("stale", "octocat", cfg) is None
+    assert len(disks_table.get_item_calls) == 1
+
+
+def test_find_disk_point_read_applies_active_reservation():
+    disks_table = _Table(get_item_response={"Item": {"disk_name": "d1", "size_gb": Decimal("10")}})
+    res_table = _Table(query_responses=[
+        {"Items": [{"reservation_id": "abcdefgh-1234", "disk_name": "d1"}]}])
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table,
+                                  cfg.reservations_table: res_table})
+    d = disks._find_disk("d1", "octocat", cfg)
+    assert d["name"] == "d1" and d["size_gb"] == 10
+    assert d["in_use"] is True and d["reservation_id"] == "abcdefgh"
+    assert disks_table.get_item_calls == [{"Key": {"user_id": "octocat", "disk_name": "d1"}}]
+    assert disks_table.query_calls == []  # no full listing
+
+
+def test_list_disks_overlaps_disks_query_and_reservations_probe():
+    disks_table, reservations_table = _rendezvous_tables(
+        query_responses=[{"Items": [{"disk_name": "d1"}]}])
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table,
+                                  cfg.reservations_table: reservations_table})
+    assert [d["name"] for d in disks.list_disks("octocat", cfg)] == ["d1"]
+
+
+def test_find_disk_overlaps_disk_read_and_reservations_probe():
+    disks_table, reservations_table = _rendezvous_tables(
+        get_item_response={"Item": {"disk_name": "d1"}})
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table,
+                                  cfg.reservations_table: reservations_table})
+    assert disks._find_disk("d1", "octocat", cfg)["in_use"] is False
+
+
+def test_find_disk_point_read_skips_timestamp_parsing(monkeypatch):
+    monkeypatch.setattr(disks, "parse_iso_utc", MagicMock(side_effect=AssertionError))
+    disks_table = _Table(get_item_response={"Item": {
+        "disk_name": "d1", "created_at": "2026-01-01T00:00:00Z",
+        "last_used": "2026-02-01T00:00:00Z", "snapshot_count": Decimal("2")}})
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table})
+    d = disks._find_disk("d1", "octocat", cfg, check_in_use=False)
+    assert (d["created_at"], d["last_used"], d["snapshot_count"]) == (None, None, 2)
+
+
+def test_find_disk_existence_only_skips_reservations():
+    disks_table = _Table(get_item_response={"Item": {"disk_name": "d1"}})
+    res_table = _Table()
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table,
+                                  cfg.reservations_table: res_table})
+    assert disks._find_disk("d1", "octocat", cfg, check_in_use=False)["name"] == "d1"
+    assert res_table.query_calls == []
+
+
+def test_find_disk_hides_expired_soft_delete():
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    disks_table = _Table(get_item_response={
+        "Item": {"disk_name": "gone", "is_deleted": True, "delete_date": yesterday}})
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table})
+    assert disks._find_disk("gone", "octocat", cfg) is None
+
+
+def test_disk_exists_reads_only_deletion_fields():
+    disks_table = _Table(get_item_response={"Item": {"is_deleted": False}})
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table})
+    assert disks.disk_exists("d1", "octocat", cfg) is True
+    call = disks_table.get_item_calls[0]
+    assert call["Key"] == {"user_id": "octocat", "disk_name": "d1"}
+    assert call["ProjectionExpression"] == "is_deleted, delete_date"
+
+
+def test_disk_exists_false_for_missing_or_expired():
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: _Table(get_item_response={})})
+    assert disks.disk_exists("ghost", "octocat", cfg) is False
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: _Table(get_item_response={
+        "Item": {"is_deleted": True, "delete_date": yesterday}})})
+    assert disks.disk_exists("gone", "octocat", cfg) is False
+
+
+def test_get_disk_is_one_keyed_read():
+    disks_table = _Table(get_item_response={"Item": {
+        "disk_name": "d1", "size_gb": 100, "snapshot_count": 3}})
+    reservations = _Table()
+    cfg = make_config()
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: disks_table,
+                                  cfg.reservations_table: reservations})
+    disk = disks.get_disk("d1", "octocat", cfg)
+    assert (disk["name"], disk["snapshot_count"]) == ("d1", 3)
+    assert disks_table.get_item_calls == [{"Key": {"user_id": "octocat", "disk_name": "d1"}}]
+    assert reservations.query_calls == []
+
+
 def test_delete_disk_not_found(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     cfg = make_config()
     assert disks.delete_disk("ghost", "octocat", cfg) is None
     assert "not found" in capsys.readouterr().out
 
 
 def test_delete_disk_in_use_blocked(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c:
-                        [{"name": "busy", "in_use": True, "reservation_id": "r-1"}])
+    _given_disks(monkeypatch, [{"name": "busy", "in_use": True, "reservation_id": "r-1"}])
     cfg = make_config()
     assert disks.delete_disk("busy", "octocat", cfg) is None
     out = capsys.readouterr().out
     assert "currently in use" in out
     assert "r-1" in out
-    cfg.session.client.assert_not_called()
+    cfg.sqs_client.send_message.assert_not_called()
 
 
 def test_delete_disk_sends_sqs_with_delete_date(monkeypatch):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c:
-                        [{"name": "old", "in_use": False, "reservation_id": None}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False, "reservation_id": None}])
     monkeypatch.setattr(disks, "get_version", lambda: "1.0")
     cfg = make_config()
     sqs = MagicMock()
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
 
     op_id = disks.delete_disk("old", "octocat", cfg)
     assert op_id
@@ -433,13 +751,12 @@ def test_delete_disk_sends_sqs_with_delete_date(monkeypatch):
 
 
 def test_delete_disk_sqs_error_returns_none(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c:
-                        [{"name": "old", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
     monkeypatch.setattr(disks, "get_version", lambda: "1.0")
     cfg = make_config()
     sqs = MagicMock()
     sqs.send_message.side_effect = RuntimeError("boom")
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
     assert disks.delete_disk("old", "octocat", cfg) is None
     assert "Error sending delete request" in capsys.readouterr().out
 
@@ -454,41 +771,41 @@ def _src(**kw):
 
 
 def test_clone_disk_source_missing(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     assert disks.clone_disk("src", "dst", "octocat", make_config()) is None
     assert "Source disk 'src' not found" in capsys.readouterr().out
 
 
 def test_clone_disk_source_deleted(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [_src(is_deleted=True)])
+    _given_disks(monkeypatch, [_src(is_deleted=True)])
     assert disks.clone_disk("src", "dst", "octocat", make_config()) is None
     assert "marked for deletion" in capsys.readouterr().out
 
 
 def test_clone_disk_source_no_snapshots(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [_src(snapshot_count=0)])
+    _given_disks(monkeypatch, [_src(snapshot_count=0)])
     assert disks.clone_disk("src", "dst", "octocat", make_config()) is None
     assert "no snapshots to clone" in capsys.readouterr().out
 
 
 def test_clone_disk_target_exists(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [_src(), {"name": "dst"}])
+    _given_disks(monkeypatch, [_src(), {"name": "dst"}])
     assert disks.clone_disk("src", "dst", "octocat", make_config()) is None
     assert "Disk 'dst' already exists" in capsys.readouterr().out
 
 
 def test_clone_disk_invalid_target_name(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [_src()])
+    _given_disks(monkeypatch, [_src()])
     assert disks.clone_disk("src", "bad name", "octocat", make_config()) is None
     assert "only letters, numbers" in capsys.readouterr().out
 
 
 def test_clone_disk_success_sends_sqs(monkeypatch):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [_src()])
+    _given_disks(monkeypatch, [_src()])
     monkeypatch.setattr(disks, "get_version", lambda: "2.0")
     cfg = make_config()
     sqs = MagicMock()
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
     op_id = disks.clone_disk("src", "dst-1", "octocat", cfg)
     assert op_id
     import json
@@ -499,12 +816,12 @@ def test_clone_disk_success_sends_sqs(monkeypatch):
 
 
 def test_clone_disk_sqs_error_returns_none(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [_src()])
+    _given_disks(monkeypatch, [_src()])
     monkeypatch.setattr(disks, "get_version", lambda: "2.0")
     cfg = make_config()
     sqs = MagicMock()
     sqs.send_message.side_effect = RuntimeError("x")
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
     assert disks.clone_disk("src", "dst", "octocat", cfg) is None
     assert "Error sending clone request" in capsys.readouterr().out
 
@@ -513,17 +830,17 @@ def test_clone_disk_sqs_error_returns_none(monkeypatch, capsys):
 # unlock_disk                                                                  #
 # --------------------------------------------------------------------------- #
 def test_unlock_disk_not_found(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     assert disks.unlock_disk("x", "octocat", make_config()) is False
     assert "not found" in capsys.readouterr().out
 
 
 def test_unlock_disk_locked_sends_clear_lock(monkeypatch):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "x", "in_use": True}])
+    _given_disks(monkeypatch, [{"name": "x", "in_use": True}])
     monkeypatch.setattr(disks, "get_version", lambda: "1")
     cfg = make_config()
     sqs = MagicMock()
-    cfg.session.client.return_value = sqs
+    cfg.sqs_client = sqs
     assert disks.unlock_disk("x", "octocat", cfg) is True
     import json
     body = json.loads(sqs.send_message.call_args.kwargs["MessageBody"])
@@ -532,35 +849,35 @@ def test_unlock_disk_locked_sends_clear_lock(monkeypatch):
 
 
 def test_unlock_disk_not_locked_no_ebs_returns_false(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "x", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "x", "in_use": False}])
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_volumes.return_value = {"Volumes": []}
-    cfg.session.client.return_value = ec2
+    cfg.ec2_client = ec2
     assert disks.unlock_disk("x", "octocat", cfg) is False
     assert "is not locked" in capsys.readouterr().out
 
 
 def test_unlock_disk_not_locked_but_ebs_attached_force_detaches(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "x", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "x", "in_use": False}])
     monkeypatch.setattr(disks, "get_version", lambda: "1")
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_volumes.return_value = {"Volumes": [{"VolumeId": "vol-1"}]}
     sqs = MagicMock()
-    # session.client called for ec2 (describe) then sqs (send_message)
-    cfg.session.client.side_effect = [ec2, sqs]
+    cfg.ec2_client = ec2
+    cfg.sqs_client = sqs
     assert disks.unlock_disk("x", "octocat", cfg) is True
     assert "still attached" in capsys.readouterr().out
     sqs.send_message.assert_called_once()
 
 
 def test_unlock_disk_describe_volumes_error_returns_false(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "x", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "x", "in_use": False}])
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_volumes.side_effect = RuntimeError("denied")
-    cfg.session.client.return_value = ec2
+    cfg.ec2_client = ec2
     assert disks.unlock_disk("x", "octocat", cfg) is False
     assert "is not locked" in capsys.readouterr().out
 
@@ -570,33 +887,31 @@ def test_unlock_disk_describe_volumes_error_returns_false(monkeypatch, capsys):
 # --------------------------------------------------------------------------- #
 def test_rename_disk_invalid_new_name(monkeypatch, capsys):
     cfg = make_config()
-    cfg.session.client.return_value = MagicMock()
+    cfg.ec2_client = MagicMock()
     assert disks.rename_disk("old", "new name", "octocat", cfg) is False
     assert "only letters, numbers" in capsys.readouterr().out
 
 
 def test_rename_disk_old_missing(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    _given_disks(monkeypatch, [])
     cfg = make_config()
-    cfg.session.client.return_value = MagicMock()
+    cfg.ec2_client = MagicMock()
     assert disks.rename_disk("old", "new", "octocat", cfg) is False
     assert "Disk 'old' not found" in capsys.readouterr().out
 
 
 def test_rename_disk_new_exists(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c:
-                        [{"name": "old", "in_use": False}, {"name": "new", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}, {"name": "new", "in_use": False}])
     cfg = make_config()
-    cfg.session.client.return_value = MagicMock()
+    cfg.ec2_client = MagicMock()
     assert disks.rename_disk("old", "new", "octocat", cfg) is False
     assert "Disk 'new' already exists" in capsys.readouterr().out
 
 
 def test_rename_disk_in_use_blocked(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c:
-                        [{"name": "old", "in_use": True, "reservation_id": "r-9"}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": True, "reservation_id": "r-9"}])
     cfg = make_config()
-    cfg.session.client.return_value = MagicMock()
+    cfg.ec2_client = MagicMock()
     assert disks.rename_disk("old", "new", "octocat", cfg) is False
     out = capsys.readouterr().out
     assert "currently in use" in out
@@ -604,57 +919,253 @@ def test_rename_disk_in_use_blocked(monkeypatch, capsys):
 
 
 def test_rename_disk_no_snapshots_returns_false(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "old", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_snapshots.return_value = {"Snapshots": []}
-    cfg.session.client.return_value = ec2
+    cfg.ec2_client = ec2
     assert disks.rename_disk("old", "new", "octocat", cfg) is False
     assert "No snapshots found" in capsys.readouterr().out
 
 
 def test_rename_disk_retags_snapshots(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "old", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_snapshots.return_value = {"Snapshots": [
         {"SnapshotId": "snap-1"}, {"SnapshotId": "snap-2"}]}
-    cfg.session.client.return_value = ec2
+    cfg.ec2_client = ec2
     assert disks.rename_disk("old", "newname", "octocat", cfg) is True
-    assert ec2.create_tags.call_count == 2
-    # tags set disk_name -> new
-    first = ec2.create_tags.call_args_list[0].kwargs
-    assert first["Resources"] == ["snap-1"]
-    assert {"Key": "disk_name", "Value": "newname"} in first["Tags"]
+    # one batched call sets disk_name -> new on every snapshot
+    ec2.create_tags.assert_called_once()
+    call = ec2.create_tags.call_args.kwargs
+    assert call["Resources"] == ["snap-1", "snap-2"]
+    assert {"Key": "disk_name", "Value": "newname"} in call["Tags"]
     out = capsys.readouterr().out
     assert "2 snapshots updated" in out
 
 
+def test_rename_disk_pages_through_snapshots(monkeypatch):
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
+    cfg = make_config()
+    ec2 = MagicMock()
+    ec2.describe_snapshots.side_effect = [
+        {"Snapshots": [{"SnapshotId": "snap-1"}], "NextToken": "t1"},
+        {"Snapshots": [{"SnapshotId": "snap-2"}]},
+    ]
+    cfg.ec2_client = ec2
+    assert disks.rename_disk("old", "newname", "octocat", cfg) is True
+    first, second = ec2.describe_snapshots.call_args_list
+    assert first.kwargs["MaxResults"] == 1000 and "NextToken" not in first.kwargs
+    assert second.kwargs["NextToken"] == "t1"
+    assert ec2.create_tags.call_args.kwargs["Resources"] == ["snap-1", "snap-2"]
+
+
+def test_rename_disk_batches_create_tags_at_api_limit(monkeypatch):
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
+    monkeypatch.setattr(disks, "_CREATE_TAGS_MAX_RESOURCES", 2)
+    cfg = make_config()
+    ec2 = MagicMock()
+    ec2.describe_snapshots.return_value = {"Snapshots": [
+        {"SnapshotId": f"snap-{i}"} for i in range(5)]}
+    cfg.ec2_client = ec2
+    assert disks.rename_disk("old", "newname", "octocat", cfg) is True
+    assert [c.kwargs["Resources"] for c in ec2.create_tags.call_args_list] == [
+        ["snap-0", "snap-1"], ["snap-2", "snap-3"], ["snap-4"]]
+
+
 def test_rename_disk_partial_tag_failure_still_succeeds(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "old", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_snapshots.return_value = {"Snapshots": [
         {"SnapshotId": "snap-1"}, {"SnapshotId": "snap-2"}]}
-    ec2.create_tags.side_effect = [None, RuntimeError("tag fail")]
-    cfg.session.client.return_value = ec2
+    # the batch is rejected, then each snapshot is retried on its own
+    ec2.create_tags.side_effect = [RuntimeError("InvalidSnapshot.NotFound"),
+                                   None, RuntimeError("tag fail")]
+    cfg.ec2_client = ec2
     assert disks.rename_disk("old", "newname", "octocat", cfg) is True
+    assert [c.kwargs["Resources"] for c in ec2.create_tags.call_args_list] == [
+        ["snap-1", "snap-2"], ["snap-1"], ["snap-2"]]
     out = capsys.readouterr().out
     # one updated, one errored, count reflects only successes
     assert "1 snapshots updated" in out
     assert "Error updating snapshot snap-2" in out
 
 
+def test_rename_disk_all_tag_failures_returns_false(monkeypatch, capsys):
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
+    cfg = make_config()
+    ec2 = MagicMock()
+    ec2.describe_snapshots.return_value = {"Snapshots": [
+        {"SnapshotId": "snap-1"}, {"SnapshotId": "snap-2"}]}
+    ec2.create_tags.side_effect = RuntimeError("UnauthorizedOperation")
+    cfg.ec2_client = ec2
+    assert disks.rename_disk("old", "newname", "octocat", cfg) is False
+    out = capsys.readouterr().out
+    assert "Could not retag any snapshots" in out
+    assert "Successfully renamed" not in out
+
+
 def test_rename_disk_describe_snapshots_error_returns_false(monkeypatch, capsys):
-    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "old", "in_use": False}])
+    _given_disks(monkeypatch, [{"name": "old", "in_use": False}])
     cfg = make_config()
     ec2 = MagicMock()
     ec2.describe_snapshots.side_effect = RuntimeError("api down")
-    cfg.session.client.return_value = ec2
+    cfg.ec2_client = ec2
     assert disks.rename_disk("old", "new", "octocat", cfg) is False
     assert "Error renaming disk" in capsys.readouterr().out
 
 
+# --------------------------------------------------------------------------- #
+# list_disk_content                                                            #
+# --------------------------------------------------------------------------- #
+class _Body:
+    """StreamingBody stand-in: iter_chunks in small pieces to cross chunk edges."""
+
+    def __init__(self, data):
+        self.data = data
+        self.chunk_sizes = []
+
+    def iter_chunks(self, chunk_size=1024):
+        self.chunk_sizes.append(chunk_size)
+        for i in range(0, len(self.data), 4):
+            yield self.data[i:i + 4]
+
+
+def _content_config(body, content_range=None, etag=None):
+    cfg = make_config()
+    table = _Table(get_item_response={"Item": {
+        "latest_snapshot_content_s3": "s3://bucket/contents/octocat/data.txt"}})
+    s3 = MagicMock()
+    response = {"Body": _Body(body)}
+    if content_range:
+        response["ContentRange"] = content_range
+    if etag:
+        response["ETag"] = etag
+    s3.get_object.return_value = response
+    cfg.dynamodb = fake_dynamodb({cfg.disks_table: table})
+    cfg.s3_client = s3
+    return cfg, s3
+
+
+def test_list_disk_content_full_object():
+    cfg, s3 = _content_config(b"a/\na/b.txt\n")
+    assert disks.list_disk_content("data", "octocat", cfg) == "a/\na/b.txt\n"
+    s3.get_object.assert_called_once_with(Bucket="bucket", Key="contents/octocat/data.txt",
+                                          Range=f"bytes=0-{disks._CONTENT_MAX_BYTES - 1}")
+
+
+def test_list_disk_content_caps_unbounded_fetch_and_skips_cache(capsys, tmp_content_cache):
+    cfg, s3 = _content_config(b"a/\na/b", content_range="bytes 0-5/5000000", etag='"big"')
+    assert disks.list_disk_content("data", "octocat", cfg) == "a/\n"
+    assert "Showing first 3 of 5,000,000 bytes" in capsys.readouterr().out
+    # a truncated listing is never cached as if it were the whole thing
+    assert not tmp_content_cache.exists()
+
+
+def test_list_disk_content_empty_object_falls_back_to_plain_get():
+    cfg, s3 = _content_config(b"")
+    invalid_range = ClientError({"Error": {"Code": "InvalidRange"},
+                                 "ResponseMetadata": {"HTTPStatusCode": 416}}, "GetObject")
+    s3.get_object.side_effect = [invalid_range, s3.get_object.return_value]
+    assert disks.list_disk_content("data", "octocat", cfg) == ""
+    assert "Range" not in s3.get_object.call_args.kwargs
+
+
+def test_list_disk_content_empty_object_retry_drops_if_none_match():
+    cfg, s3 = _content_config(b"", etag='"empty"')
+    disks.list_disk_content("data", "octocat", cfg)  # caches the empty listing + ETag
+    invalid_range = ClientError({"Error": {"Code": "InvalidRange"},
+                                 "ResponseMetadata": {"HTTPStatusCode": 416}}, "GetObject")
+    s3.get_object.side_effect = [invalid_range, s3.get_object.return_value]
+    assert disks.list_disk_content("data", "octocat", cfg) == ""
+    assert s3.get_object.call_args_list[-2].kwargs["IfNoneMatch"] == '"empty"'
+    assert "IfNoneMatch" not in s3.get_object.call_args.kwargs
+
+
+def test_list_disk_content_max_bytes_ranged_and_cut_at_line(capsys):
+    cfg, s3 = _content_config(b"a/\na/b.txt\na/c.t", content_range="bytes 0-15/4096")
+    assert disks.list_disk_content("data", "octocat", cfg, max_bytes=16) == "a/\na/b.txt\n"
+    assert s3.get_object.call_args.kwargs["Range"] == "bytes=0-15"
+    assert "Showing first 11 of 4,096 bytes" in capsys.readouterr().out
+
+
+def test_list_disk_content_decodes_across_chunk_edges(capsys):
+    # "é" (2 bytes) straddles the 4-byte test chunks; the cut still lands on bytes
+    cfg, s3 = _content_config("ab/é\ncaf".encode(), content_range="bytes 0-8/900")
+    assert disks.list_disk_content("data", "octocat", cfg, max_bytes=9) == "ab/é\n"
+    assert "Showing first 6 of 900 bytes" in capsys.readouterr().out
+    assert s3.get_object.return_value["Body"].chunk_sizes == [disks._CONTENT_CHUNK_BYTES]
+
+
+def test_list_disk_content_max_bytes_larger_than_object(capsys):
+    cfg, _ = _content_config(b"a/\na/b", content_range="bytes 0-5/6")
+    assert disks.list_disk_content("data", "octocat", cfg, max_bytes=1024) == "a/\na/b"
+    assert "Showing first" not in capsys.readouterr().out
+
+
+def _not_modified():
+    return ClientError({"Error": {"Code": "304", "Message": "Not Modified"},
+                        "ResponseMetadata": {"HTTPStatusCode": 304}}, "GetObject")
+
+
+def test_list_disk_content_revalidates_cached_listing_with_etag():
+    cfg, s3 = _content_config(b"a/\na/b.txt\n", etag='"abc"')
+    assert disks.list_disk_content("data", "octocat", cfg) == "a/\na/b.txt\n"
+    assert "IfNoneMatch" not in s3.get_object.call_args.kwargs
+
+    # Second run: S3 answers 304, the cached body is returned
+    s3.get_object.side_effect = _not_modified()
+    assert disks.list_disk_content("data", "octocat", cfg) == "a/\na/b.txt\n"
+    assert s3.get_object.call_args.kwargs["IfNoneMatch"] == '"abc"'
+
+
+def test_list_disk_content_cache_is_owner_only(tmp_content_cache):
+    cfg, _ = _content_config(b"a/\na/b.txt\n", etag='"abc"')
+    disks.list_disk_content("data", "octocat", cfg)
+    assert stat.S_IMODE(tmp_content_cache.stat().st_mode) == 0o700
+    files = list(tmp_content_cache.iterdir())
+    assert len(files) == 2
+    assert {stat.S_IMODE(f.stat().st_mode) for f in files} == {0o600}
+
+
+def test_list_disk_content_changed_object_replaces_cache():
+    cfg, s3 = _content_config(b"old\n", etag='"v1"')
+    disks.list_disk_content("data", "octocat", cfg)
+    s3.get_object.return_value["Body"] = _Body(b"new\n")
+    s3.get_object.return_value["ETag"] = '"v2"'
+    assert disks.list_disk_content("data", "octocat", cfg) == "new\n"
+    s3.get_object.side_effect = _not_modified()
+    assert disks.list_disk_content("data", "octocat", cfg) == "new\n"
+    assert s3.get_object.call_args.kwargs["IfNoneMatch"] == '"v2"'
+
+
+def test_list_disk_content_304_without_cached_body_refetches(tmp_content_cache):
+    cfg, s3 = _content_config(b"a/\n", etag='"abc"')
+    disks.list_disk_content("data", "octocat", cfg)
+    for f in tmp_content_cache.glob("*.txt"):
+        f.unlink()
+    s3.get_object.side_effect = [_not_modified(), s3.get_object.return_value]
+    assert disks.list_disk_content("data", "octocat", cfg) == "a/\n"
+    assert "IfNoneMatch" not in s3.get_object.call_args.kwargs
+
+
+def test_list_disk_content_max_bytes_bypasses_cache(tmp_content_cache):
+    cfg, s3 = _content_config(b"a/\n", content_range="bytes 0-2/3", etag='"abc"')
+    disks.list_disk_content("data", "octocat", cfg, max_bytes=16)
+    assert not tmp_content_cache.exists()
+
+
+def test_list_disk_content_missing_s3_path(capsys):
+    cfg, s3 = _content_config(b"")
+    cfg.dynamodb = fake_dynamodb(
+        {cfg.disks_table: _Table(get_item_response={"Item": {}})})
+    assert disks.list_disk_content("data", "octocat", cfg) is None
+    s3.get_object.assert_not_called()
+    assert "No snapshot contents available" in capsys.readouterr().out
+
+
 # --------------------------------------------------------------------------- #
 # poll_disk_operation                                                          #
 # --------------------------------------------------------------------------- #
@@ -702,6 +1213,136 @@ def test_poll_delete_timeout(monkeypatch):
     assert "Timed out" in msg
 
 
+def test_poll_backs_off_exponentially_up_to_cap(monkeypatch):
+    results = iter([[], [], [], [], [{"name": "new"}]])
+    monkeypatch.setattr(disks, "list_disks", lambda u, c: next(results))
+    monkeypatch.setattr(disks.random, "uniform", lambda a, b: 0)
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    ok, _ = disks.poll_disk_operation("create", "new", "octocat", make_config(),
+                                      initial_delay=1, backoff_multiplier=2,
+                                      max_delay=5)
+    assert ok is True
+    assert sleeps == [1, 2, 4, 5]
+
+
+def test_poll_checks_before_sleeping(monkeypatch):
+    """An operation already done is reported without any wait, even with no
+    time budget left."""
+    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "new"}])
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    ok, _ = disks.poll_disk_operation("create", "new", "octocat", make_config(),
+                                      timeout_seconds=0)
+    assert ok is True
+    assert sleeps == []
+
+
+def test_poll_last_sleep_is_clipped_to_the_deadline(monkeypatch):
+    monkeypatch.setattr(disks, "list_disks", lambda u, c: [])
+    monkeypatch.setattr(disks.random, "uniform", lambda a, b: 0)
+    clock = [1000.0]
+    monkeypatch.setattr(disks.time, "monotonic", lambda: clock[0])
+    sleeps = []
+
+    def fake_sleep(s):
+        sleeps.append(s)
+        clock[0] += s
+
+    monkeypatch.setattr(disks.time, "sleep", fake_sleep)
+    ok, _ = disks.poll_disk_operation("create", "new", "octocat", make_config(),
+                                      timeout_seconds=10, initial_delay=4,
+                                      backoff_multiplier=1, max_delay=4)
+    assert ok is False
+    assert sleeps == [4, 4, 2]
+
+
+def test_poll_jitter_is_bounded_by_a_tenth_of_the_delay(monkeypatch):
+    results = iter([[], [{"name": "new"}]])
+    monkeypatch.setattr(disks, "list_disks", lambda u, c: next(results))
+    bounds = []
+    monkeypatch.setattr(disks.random, "uniform", lambda a, b: bounds.append((a, b)) or b)
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    disks.poll_disk_operation("create", "new", "octocat", make_config(), initial_delay=2)
+    assert bounds == [(0, 0.2)]
+    assert sleeps == [2.2]
+
+
+def _client_error(code, status=400):
+    return ClientError({"Error": {"Code": code, "Message": code},
+                        "ResponseMetadata": {"HTTPStatusCode": status}}, "Query")
+
+
+def test_poll_fails_fast_on_non_retryable_aws_error(monkeypatch):
+    calls = []
+
+    def denied(u, c):
+        calls.append(u)
+        raise _client_error("AccessDeniedException")
+
+    monkeypatch.setattr(disks, "list_disks", denied)
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    ok, msg = disks.poll_disk_operation("create", "new", "octocat", make_config())
+    assert ok is False
+    assert "AccessDeniedException" in msg
+    assert len(calls) == 1 and sleeps == []
+
+
+@pytest.mark.parametrize("error", [
+    _client_error("ProvisionedThroughputExceededException"),
+    _client_error("InternalFailure", status=500),
+    EndpointConnectionError(endpoint_url="https://dynamodb"),
+])
+def test_poll_retries_transient_errors(monkeypatch, error):
+    results = iter([error, [{"name": "new"}]])
+
+    def flaky(u, c):
+        r = next(results)
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+    monkeypatch.setattr(disks, "list_disks", flaky)
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    ok, _ = disks.poll_disk_operation("create", "new", "octocat", make_config())
+    assert ok is True
+
+
+def test_poll_does_not_swallow_programming_errors(monkeypatch):
+    def broken(u, c):
+        raise KeyError("disk_name")
+
+    monkeypatch.setattr(disks, "list_disks", broken)
+    with pytest.raises(KeyError):
+        disks.poll_disk_operation("create", "new", "octocat", make_config())
+
+
+def test_poll_many_shares_one_listing_per_round(monkeypatch):
+    rounds = iter([
+        [{"name": "a"}, {"name": "old", "is_deleted": False}],
+        [{"name": "a"}, {"name": "b"}, {"name": "old", "is_deleted": True,
+                                        "delete_date": "2026-07-01"}],
+    ])
+    calls = []
+    monkeypatch.setattr(disks, "list_disks", lambda u, c: calls.append(u) or next(rounds))
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    results = list(disks.poll_disk_operations(
+        [("create", "a"), ("create", "b"), ("delete", "old")], "octocat", make_config()))
+    assert [(name, ok) for name, ok, _ in results] == [("a", True), ("b", True), ("old", True)]
+    assert len(calls) == 2  # one read per round, not per operation
+
+
+def test_poll_many_reports_stragglers_at_timeout(monkeypatch):
+    monkeypatch.setattr(disks, "list_disks", lambda u, c: [{"name": "a"}])
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    results = list(disks.poll_disk_operations(
+        [("create", "a"), ("create", "b")], "octocat", make_config(), timeout_seconds=0))
+    assert results[0][:2] == ("a", True)
+    assert results[1][:2] == ("b", False) and "Timed out" in results[1][2]
+
+
 # --------------------------------------------------------------------------- #
 # poll_operation (operations table)                                           #
 # --------------------------------------------------------------------------- #
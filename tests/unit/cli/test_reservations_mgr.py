@@ -8,16 +8,19 @@ coercion + pagination in `get_gpu_availability_by_type`.
 Everything external is mocked: the `Config` is a `MagicMock`, so
 `config.dynamodb.Table(...)`, `config.sqs_client`, `config.session` and
 `config.get_queue_url()` are all MagicMocks we set up / assert against. `requests`
-is patched inside `gpu_dev_cli.reservations` for the Function-URL path. No
+is patched inside `gpu_dev_cli.reservations` for the Function-URL path (the
+pooled session is `requests.Session.return_value`). No
 network, AWS, or filesystem dependency.
 """
 import json
+from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gpu_dev_cli.reservations import ReservationManager, get_version
+import gpu_dev_cli.reservations as reservations_mod
+from gpu_dev_cli.reservations import ReservationManager, get_version, parse_iso_utc
 
 
 QUEUE_URL = "https://sqs.us-east-2.amazonaws.com/000000000000/test-queue"
@@ -330,7 +333,7 @@ def test_signed_post_returns_none_without_credentials():
     mgr._cfg.session.get_credentials.return_value = None
     with patch("gpu_dev_cli.reservations.requests") as req:
         assert mgr._signed_post("https://fn.url/", {"a": 1}) is None
-        req.post.assert_not_called()
+        req.Session.return_value.post.assert_not_called()
 
 
 def test_signed_post_non_200_returns_none():
@@ -339,26 +342,37 @@ def test_signed_post_non_200_returns_none():
     resp = MagicMock(status_code=403)
     with patch("gpu_dev_cli.reservations.requests") as req, \
          patch("gpu_dev_cli.reservations.SigV4Auth"):
-        req.post.return_value = resp
+        req.Session.return_value.post.return_value = resp
         assert mgr._signed_post("https://fn.url/", {"a": 1}) is None
 
 
 def test_signed_post_success_returns_json():
     mgr = _make_mgr()
     mgr._cfg.session.get_credentials.return_value = MagicMock()
-    resp = MagicMock(status_code=200)
-    resp.json.return_value = {"claimed": True}
+    resp = MagicMock(status_code=200, content=b'{"claimed": true}')
     with patch("gpu_dev_cli.reservations.requests") as req, \
          patch("gpu_dev_cli.reservations.SigV4Auth"):
-        req.post.return_value = resp
+        req.Session.return_value.post.return_value = resp
         out = mgr._signed_post("https://fn.url/", {"a": 1})
     assert out == {"claimed": True}
     # The POSTed body is the JSON-serialized payload
-    _, kwargs = req.post.call_args
+    _, kwargs = req.Session.return_value.post.call_args
     assert json.loads(kwargs["data"]) == {"a": 1}
     assert kwargs["timeout"] == 20
 
 
+def test_http_session_is_pooled_and_reused():
+    mgr = _make_mgr()
+    first = mgr.http
+    assert mgr.http is first
+    adapter = first.get_adapter("https://fn.url/")
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0  # never resend a POST the lambda may have seen
+    mgr.close()
+    assert mgr._http_session is None
+    assert mgr.http is not first
+
+
 def test_signed_post_swallows_exceptions():
     mgr = _make_mgr()
     mgr._cfg.session.get_credentials.side_effect = RuntimeError("creds boom")
@@ -586,8 +600,96 @@ def test_availability_returns_none_on_scan_error():
     assert mgr.get_gpu_availability_by_type() is None
 
 
+# --------------------------------------------------------------------------- #
+# get_cluster_status                                                           #
+# --------------------------------------------------------------------------- #
+def test_cluster_status_aggregates_concurrent_fetches():
+    mgr = _make_mgr()
+    mgr._table.scan.side_effect = [
+        {"Items": [{"status": "active", "gpu_count": Decimal("4")}],
+         "LastEvaluatedKey": {"k": 1}},
+        {"Items": [{"status": "active", "gpu_count": Decimal("2")},
+                   {"status": "pending", "gpu_count": Decimal("1")}]},
+    ]
+    mgr._cfg.sqs_client.get_queue_attributes.return_value = {
+        "Attributes": {"ApproximateNumberOfMessages": "3"}}
+    avail = {"h100": {"total": 16, "available": 10}, "t4": {"total": 4, "available": 4}}
+    with patch.object(mgr, "get_gpu_availability_by_type", return_value=avail):
+        out = mgr.get_cluster_status()
+    assert out == {"total_gpus": 20, "available_gpus": 14, "reserved_gpus": 6,
+                   "active_reservations": 2, "queue_length": 3}
+
+
+def test_cluster_status_queue_falls_back_to_pending_count():
+    mgr = _make_mgr()
+    mgr._table.scan.return_value = {"Items": [{"status": "pending"}, {"status": "pending"}]}
+    mgr._cfg.get_queue_url.side_effect = RuntimeError("no queue")
+    with patch.object(mgr, "get_gpu_availability_by_type", return_value=None):
+        out = mgr.get_cluster_status()
+    assert out["queue_length"] == 2
+    assert out["total_gpus"] == 0
+
+
+def test_cluster_status_returns_none_on_scan_error():
+    mgr = _make_mgr()
+    mgr._table.scan.side_effect = RuntimeError("scan boom")
+    with patch.object(mgr, "get_gpu_availability_by_type", return_value=None):
+        assert mgr.get_cluster_status() is None
+
+
 # --------------------------------------------------------------------------- #
 # get_version                                                                  #
 # --------------------------------------------------------------------------- #
 def test_get_version_is_str():
     assert isinstance(get_version(), str)
+
+
+# --------------------------------------------------------------------------- #
+# parse_iso_utc                                                                #
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("value", [
+    "2025-01-11T23:30:00Z",
+    "2025-01-11T23:30:00+00:00",
+    "2025-01-11T23:30:00",          # naive -> UTC
+    "2025-01-11T18:30:00-05:00",
+])
+def test_parse_iso_utc_variants_are_the_same_instant(value):
+    assert parse_iso_utc(value) == datetime(2025, 1, 11, 23, 30, tzinfo=timezone.utc)
+    assert parse_iso_utc(value).tzinfo is not None
+
+
+def test_parse_iso_utc_naive_ending_in_zeros_is_utc():
+    # Previously "...T12:00:00" matched the endswith("00:00") offset branch and
+    # stayed naive (i.e. was read as local time).
+    assert parse_iso_utc("2025-01-11T12:00:00").utcoffset().total_seconds() == 0
+
+
+def test_parse_iso_utc_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_iso_utc("not-a-date")
+
+
+def test_parse_iso_utc_rewrites_z_where_fromisoformat_lacks_it(monkeypatch):
+    # Python 3.10 fromisoformat() rejects "Z"; the fallback spells it as +00:00.
+    monkeypatch.setattr(reservations_mod, "ciso8601", None)
+    monkeypatch.setattr(reservations_mod, "_FROMISOFORMAT_ACCEPTS_Z", False)
+    parse_iso_utc.cache_clear()
+    try:
+        assert parse_iso_utc("2025-01-11T23:30:00Z") == datetime(
+            2025, 1, 11, 23, 30, tzinfo=timezone.utc)
+    finally:
+        parse_iso_utc.cache_clear()
+
+
+def test_parse_iso_utc_prefers_ciso8601_when_installed(monkeypatch):
+    fake = MagicMock(name="ciso8601")
+    fake.parse_datetime.return_value = datetime(2025, 1, 11, 23, 30)
+    monkeypatch.setattr(reservations_mod, "ciso8601", fake)
+    parse_iso_utc.cache_clear()
+    try:
+        # naive results are still normalized to UTC
+        assert parse_iso_utc("2025-01-11T23:30:00") == datetime(
+            2025, 1, 11, 23, 30, tzinfo=timezone.utc)
+    finally:
+        parse_iso_utc.cache_clear()
+    fake.parse_datetime.assert_called_once_with("2025-01-11T23:30:00")
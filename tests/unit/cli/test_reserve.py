@@ -305,7 +305,7 @@ def test_fast_path_skipped_when_disk_specified(cli_runner):
     disk_rec = {"name": "mydisk", "in_use": False, "size_gb": 100,
                 "snapshot_count": 0, "is_deleted": False}
     with reserve_env() as mgr, \
-            patch("gpu_dev_cli.disks.list_disks", return_value=[disk_rec]):
+            patch("gpu_dev_cli.cli.list_disks", return_value=[disk_rec]):
         r = cli_runner.invoke(main, [
             "reserve", "--no-interactive", "-t", "h100", "-g", "1", "-h", "2",
             "--disk", "mydisk",
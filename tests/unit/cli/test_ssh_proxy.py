@@ -0,0 +1,39 @@
+"""Unit tests for the SSH ProxyCommand helper.
+
+Targets:
+    gpu_dev_cli.ssh_proxy.main -- event loop selection (uvloop when installed)
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from gpu_dev_cli import ssh_proxy
+
+
+@pytest.fixture
+def argv(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["gpu-dev-ssh-proxy", "gpu-dev-abc.devservers.io", "22"])
+    monkeypatch.setattr(ssh_proxy, "tunnel_ssh", MagicMock(name="tunnel_ssh"))
+
+
+def test_main_runs_tunnel_on_uvloop_when_installed(argv, monkeypatch):
+    fake_uvloop = MagicMock(name="uvloop")
+    monkeypatch.setattr(ssh_proxy, "uvloop", fake_uvloop)
+    monkeypatch.setattr(asyncio, "run", MagicMock(name="asyncio.run"))
+
+    ssh_proxy.main()
+
+    ssh_proxy.tunnel_ssh.assert_called_once_with("gpu-dev-abc.devservers.io", 22)
+    fake_uvloop.run.assert_called_once_with(ssh_proxy.tunnel_ssh.return_value)
+    asyncio.run.assert_not_called()
+
+
+def test_main_falls_back_to_asyncio(argv, monkeypatch):
+    monkeypatch.setattr(ssh_proxy, "uvloop", None)
+    run = MagicMock(name="asyncio.run")
+    monkeypatch.setattr(asyncio, "run", run)
+
+    ssh_proxy.main()
+
+    run.assert_called_once_with(ssh_proxy.tunnel_ssh.return_value)
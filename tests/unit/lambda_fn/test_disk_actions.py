@@ -0,0 +1,118 @@
+"""Unit tests for the reservation_processor lambda's disk delete action.
+
+Targets:
+    index.process_delete_disk_action -- conditional soft delete + batched snapshot tagging
+
+The disks table is the source of truth: the CLI's pre-check is advisory (it can
+race with a reservation attaching the disk), so the lambda refuses to mark a
+missing or in-use disk deleted and reports why in the operations table.
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class _ConditionalCheckFailed(Exception):
+    def __init__(self, item=None):
+        super().__init__("The conditional request failed")
+        self.response = {"Error": {"Code": "ConditionalCheckFailedException"}}
+        if item is not None:
+            self.response["Item"] = item
+
+
+def _record(**overrides):
+    body = {
+        "action": "delete_disk",
+        "operation_id": "op-1",
+        "user_id": "alice",
+        "disk_name": "data",
+        "delete_date": "2026-11-15",
+        "requested_at": "2026-10-16T00:00:00+00:00",
+    }
+    body.update(overrides)
+    return {"body": json.dumps(body)}
+
+
+@pytest.fixture
+def table(aws_mocks):
+    t = aws_mocks["dynamodb"].Table.return_value
+    t.meta.client.exceptions.ConditionalCheckFailedException = _ConditionalCheckFailed
+    return t
+
+
+@pytest.fixture
+def ec2(lambda_index, monkeypatch):
+    m = MagicMock(name="ec2_client")
+    m.describe_snapshots.return_value = {"Snapshots": [{"SnapshotId": "snap-1", "Tags": []}]}
+    monkeypatch.setattr(lambda_index, "ec2_client", m)
+    return m
+
+
+def _operation_puts(table):
+    return [c.kwargs["Item"] for c in table.put_item.call_args_list]
+
+
+def test_delete_is_conditional_on_existing_idle_disk(lambda_index, table, ec2):
+    assert lambda_index.process_delete_disk_action(_record()) is True
+
+    kwargs = table.update_item.call_args.kwargs
+    assert kwargs["Key"] == {"user_id": "alice", "disk_name": "data"}
+    assert "attribute_exists(disk_name)" in kwargs["ConditionExpression"]
+    assert kwargs["ExpressionAttributeValues"][":not_in_use"] is False
+    ec2.create_tags.assert_called_once()
+    assert _operation_puts(table)[-1]["status"] == "completed"
+
+
+@pytest.mark.parametrize("old_item, code", [
+    ({"disk_name": "data", "in_use": True}, "in_use"),
+    (None, "not_found"),
+])
+def test_delete_refused_reports_reason(lambda_index, table, ec2, old_item, code):
+    table.update_item.side_effect = _ConditionalCheckFailed(old_item)
+
+    # True: not a transient failure, so SQS must not redeliver it
+    assert lambda_index.process_delete_disk_action(_record()) is True
+
+    ec2.describe_snapshots.assert_not_called()
+    result = _operation_puts(table)[-1]
+    assert result["operation_id"] == "op-1"
+    assert (result["status"], result["error"]) == ("failed", code)
+
+
+def test_delete_tags_untagged_snapshots_in_one_call(lambda_index, table, ec2):
+    ec2.describe_snapshots.return_value = {"Snapshots": [
+        {"SnapshotId": "snap-1", "Tags": []},
+        {"SnapshotId": "snap-2", "Tags": [{"Key": "delete-date", "Value": "2026-11-01"}]},
+        {"SnapshotId": "snap-3"},
+    ]}
+
+    assert lambda_index.process_delete_disk_action(_record()) is True
+
+    ec2.create_tags.assert_called_once()
+    assert ec2.create_tags.call_args.kwargs["Resources"] == ["snap-1", "snap-3"]
+
+
+def test_delete_falls_back_to_per_snapshot_tagging(lambda_index, table, ec2):
+    ec2.describe_snapshots.return_value = {"Snapshots": [
+        {"SnapshotId": "snap-1"}, {"SnapshotId": "snap-gone"}]}
+    ec2.create_tags.side_effect = [RuntimeError("InvalidSnapshot.NotFound"),
+                                   None, RuntimeError("InvalidSnapshot.NotFound")]
+
+    assert lambda_index.process_delete_disk_action(_record()) is True
+
+    assert [c.kwargs["Resources"] for c in ec2.create_tags.call_args_list] == [
+        ["snap-1", "snap-gone"], ["snap-1"], ["snap-gone"]]
+    assert _operation_puts(table)[-1]["status"] == "completed"
+
+
+def test_delete_pages_through_all_snapshots(lambda_index, table, ec2):
+    ec2.describe_snapshots.side_effect = [
+        {"Snapshots": [{"SnapshotId": "snap-1"}], "NextToken": "t1"},
+        {"Snapshots": [{"SnapshotId": "snap-2"}]},
+    ]
+
+    assert lambda_index.process_delete_disk_action(_record()) is True
+
+    assert ec2.describe_snapshots.call_args_list[1].kwargs["NextToken"] == "t1"
+    assert ec2.create_tags.call_args.kwargs["Resources"] == ["snap-1", "snap-2"]
@@ -0,0 +1,80 @@
+"""Unit tests for the reservation_processor lambda's disk restore path.
+
+Targets:
+    index.create_disk_from_snapshot_or_empty -- snapshot selection (step 2),
+        volume availability wait (step 3)
+
+Pending and completed snapshots come from one paginated describe_snapshots
+listing; a pending snapshot is waited on and then restored like a completed one.
+"""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _snap(snapshot_id, state, day, tags=()):
+    return {
+        "SnapshotId": snapshot_id,
+        "State": state,
+        "StartTime": datetime(2026, 10, day, tzinfo=timezone.utc),
+        "Tags": [{"Key": k, "Value": v} for k, v in tags],
+    }
+
+
+@pytest.fixture
+def ec2(lambda_index, aws_mocks, monkeypatch):
+    m = MagicMock(name="ec2_client")
+    m.create_volume.return_value = {"VolumeId": "vol-1"}
+    monkeypatch.setattr(lambda_index, "ec2_client", m)
+    return m
+
+
+def _listing(ec2, *snapshots):
+    ec2.get_paginator.return_value.paginate.return_value = [{"Snapshots": list(snapshots)}]
+
+
+def test_one_listing_covers_pending_and_completed(lambda_index, ec2):
+    _listing(ec2, _snap("snap-old", "completed", 1))
+
+    volume_id, is_new, _ = lambda_index.create_disk_from_snapshot_or_empty("alice", "us-east-2a")
+
+    assert (volume_id, is_new) == ("vol-1", False)
+    ec2.describe_snapshots.assert_not_called()
+    ec2.get_paginator.assert_called_once_with("describe_snapshots")
+    filters = ec2.get_paginator.return_value.paginate.call_args.kwargs["Filters"]
+    assert {"Name": "status", "Values": ["completed", "pending"]} in filters
+    assert ec2.create_volume.call_args.kwargs["SnapshotId"] == "snap-old"
+
+
+def test_volume_wait_polls_every_two_seconds(lambda_index, ec2):
+    _listing(ec2)  # no snapshots -> empty volume
+
+    lambda_index.create_disk_from_snapshot_or_empty("alice", "us-east-2a")
+
+    ec2.get_waiter.assert_called_with("volume_available")
+    config = ec2.get_waiter.return_value.wait.call_args.kwargs["WaiterConfig"]
+    # same ~5 minute budget, finer polling
+    assert config == {"Delay": 2, "MaxAttempts": 150}
+
+
+def test_newer_pending_snapshot_is_waited_on_then_restored(lambda_index, ec2):
+    _listing(ec2,
+             _snap("snap-old", "completed", 1),
+             _snap("snap-new", "pending", 2))
+
+    lambda_index.create_disk_from_snapshot_or_empty("alice", "us-east-2a")
+
+    waits = [c.kwargs.get("SnapshotIds") for c in ec2.get_waiter.return_value.wait.call_args_list]
+    assert ["snap-new"] in waits
+    assert ec2.create_volume.call_args.kwargs["SnapshotId"] == "snap-new"
+
+
+def test_soft_deleted_snapshots_are_skipped(lambda_index, ec2):
+    _listing(ec2,
+             _snap("snap-keep", "completed", 1),
+             _snap("snap-gone", "completed", 2, tags=[("delete-date", "2026-10-01")]))
+
+    lambda_index.create_disk_from_snapshot_or_empty("alice", "us-east-2a")
+
+    assert ec2.create_volume.call_args.kwargs["SnapshotId"] == "snap-keep"
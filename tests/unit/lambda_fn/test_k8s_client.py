@@ -0,0 +1,75 @@
+"""Unit tests for the lambdas' shared EKS client setup.
+
+Targets:
+    shared.k8s_client._get_cluster_info -- DescribeCluster cached per container
+    shared.k8s_client._write_ca_cert    -- CA file written once per CA (fingerprint-gated)
+"""
+import base64
+from unittest.mock import MagicMock
+
+import pytest
+
+CA_PEM = b"-----BEGIN CERTIFICATE-----\nabc\n-----END CERTIFICATE-----\n"
+
+
+@pytest.fixture
+def eks():
+    m = MagicMock(name="eks")
+    m.describe_cluster.return_value = {"cluster": {
+        "endpoint": "https://eks.example",
+        "certificateAuthority": {"data": base64.b64encode(CA_PEM).decode()},
+    }}
+    return m
+
+
+@pytest.fixture
+def k8s_client(lambda_index, eks, monkeypatch, tmp_path):
+    from shared import k8s_client
+    monkeypatch.setattr(k8s_client, "_CA_CERT_PATH", str(tmp_path / "ca.crt"))
+    monkeypatch.setattr(k8s_client, "_ca_cert_cache", {"digest": None})
+    monkeypatch.setattr(k8s_client, "_cluster_cache",
+                        {"endpoint": None, "ca_data": None, "fetched_at": 0.0})
+    monkeypatch.setattr(k8s_client.boto3, "client", lambda *a, **k: eks)
+    return k8s_client
+
+
+def test_cluster_info_described_once_within_ttl(k8s_client, eks):
+    first = k8s_client._get_cluster_info()
+    second = k8s_client._get_cluster_info()
+
+    assert first == second
+    assert first[0] == "https://eks.example"
+    eks.describe_cluster.assert_called_once()
+
+
+def test_cluster_info_refetched_after_ttl(k8s_client, eks):
+    k8s_client._get_cluster_info()
+    k8s_client._cluster_cache["fetched_at"] -= k8s_client._CLUSTER_INFO_TTL + 1
+
+    k8s_client._get_cluster_info()
+
+    assert eks.describe_cluster.call_count == 2
+
+
+def test_ca_cert_rewritten_only_when_content_changes(k8s_client, monkeypatch):
+    ca_data = base64.b64encode(CA_PEM).decode()
+    path = k8s_client._write_ca_cert(ca_data)
+    with open(path, "rb") as f:
+        assert f.read() == CA_PEM
+
+    replaced = []
+    real_replace = k8s_client.os.replace
+    monkeypatch.setattr(k8s_client.os, "replace",
+                        lambda src, dst: (replaced.append(dst), real_replace(src, dst)))
+    decode = MagicMock(side_effect=base64.b64decode)
+    monkeypatch.setattr(k8s_client.base64, "b64decode", decode)
+    k8s_client._write_ca_cert(ca_data)
+    assert replaced == []
+    decode.assert_not_called()  # warm hit: fingerprint only, no decode
+
+    rotated = b"-----BEGIN CERTIFICATE-----\nxyz\n-----END CERTIFICATE-----\n"
+    k8s_client._write_ca_cert(base64.b64encode(rotated).decode())
+    assert replaced == [path]
+    with open(path, "rb") as f:
+        assert f.read() == rotated
+    assert k8s_client.os.stat(path).st_mode & 0o777 == 0o600
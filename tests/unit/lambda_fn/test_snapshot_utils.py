@@ -0,0 +1,58 @@
+"""Unit tests for the lambdas' shared snapshot helpers.
+
+Targets:
+    shared.snapshot_utils.get_latest_snapshot -- newest non-soft-deleted snapshot
+    shared.snapshot_utils.find_tag            -- single tag lookup in an EC2 Tags list
+"""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def snapshot_utils(lambda_index, monkeypatch):
+    from shared import snapshot_utils
+    monkeypatch.setattr(snapshot_utils, "ec2_client", MagicMock(name="ec2_client"))
+    return snapshot_utils
+
+
+def _snap(snapshot_id, day, deleted=False):
+    tags = [{"Key": "delete-date", "Value": "2026-10-01"}] if deleted else []
+    return {"SnapshotId": snapshot_id, "State": "completed",
+            "StartTime": datetime(2026, 10, day, tzinfo=timezone.utc), "Tags": tags}
+
+
+def _pages(snapshot_utils, *pages):
+    paginator = snapshot_utils.ec2_client.get_paginator.return_value
+    paginator.paginate.return_value = [{"Snapshots": list(p)} for p in pages]
+
+
+def test_latest_snapshot_across_pages_skips_soft_deleted(snapshot_utils):
+    _pages(snapshot_utils,
+           [_snap("snap-1", 1), _snap("snap-3", 3)],
+           [_snap("snap-4", 4, deleted=True), _snap("snap-2", 2)])
+
+    assert snapshot_utils.get_latest_snapshot("alice")["SnapshotId"] == "snap-3"
+
+
+def test_latest_snapshot_tie_keeps_first_seen(snapshot_utils):
+    _pages(snapshot_utils, [_snap("snap-a", 5)], [_snap("snap-b", 5)])
+
+    assert snapshot_utils.get_latest_snapshot("alice")["SnapshotId"] == "snap-a"
+
+
+def test_latest_snapshot_none_when_all_soft_deleted(snapshot_utils):
+    _pages(snapshot_utils, [_snap("snap-1", 1, deleted=True)])
+
+    assert snapshot_utils.get_latest_snapshot("alice") is None
+
+
+def test_find_tag(snapshot_utils):
+    tags = [{"Key": "disk_name", "Value": "data"}, {"Key": "delete-date", "Value": ""}]
+
+    assert snapshot_utils.find_tag(tags, "disk_name") == "data"
+    # present-but-empty is still present (callers test `is None`)
+    assert snapshot_utils.find_tag(tags, "delete-date") == ""
+    assert snapshot_utils.find_tag(tags, "gpu-dev-user") is None
+    assert snapshot_utils.find_tag((), "disk_name", "default") == "default"
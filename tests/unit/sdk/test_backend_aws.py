@@ -9,6 +9,7 @@ No network, AWS, k8s, or subprocess.
 from __future__ import annotations
 
 import json
+import stat
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
@@ -788,3 +789,36 @@ def test_refresh_on_expired_clears_module_cache_and_reinits():
     assert b._queue_url is None
     # re-init wired clients from the fresh session
     new_session.resource.assert_called_with("dynamodb", region_name=b._region)
+
+
+# --------------------------------------------------------------------------- #
+# _get_session credential cache
+# --------------------------------------------------------------------------- #
+def test_get_session_writes_cred_cache_owner_only(tmp_path, monkeypatch):
+    cache = tmp_path / "gpu-dev" / "aws-cred-cache.json"
+    monkeypatch.setattr(aws, "_CRED_CACHE_PATH", cache)
+    monkeypatch.setattr(aws, "_cached_session", None)
+    monkeypatch.setattr(aws, "_cached_session_expires", 0)
+    session = MagicMock(name="session")
+    session.get_credentials.return_value.get_frozen_credentials.return_value = MagicMock(
+        access_key="AK", secret_key="SK", token="TOK")
+    with patch.object(aws.boto3, "Session", return_value=session):
+        assert aws._get_session() is session
+    assert stat.S_IMODE(cache.stat().st_mode) == 0o600
+    assert json.loads(cache.read_text())["token"] == "TOK"
+
+
+def test_get_session_tightens_existing_loose_cred_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "gpu-dev" / "aws-cred-cache.json"
+    cache.parent.mkdir(parents=True)
+    cache.write_text("{}")
+    cache.chmod(0o644)
+    monkeypatch.setattr(aws, "_CRED_CACHE_PATH", cache)
+    monkeypatch.setattr(aws, "_cached_session", None)
+    monkeypatch.setattr(aws, "_cached_session_expires", 0)
+    session = MagicMock(name="session")
+    session.get_credentials.return_value.get_frozen_credentials.return_value = MagicMock(
+        access_key="AK", secret_key="SK", token="TOK")
+    with patch.object(aws.boto3, "Session", return_value=session):
+        aws._get_session()
+    assert stat.S_IMODE(cache.stat().st_mode) == 0o600